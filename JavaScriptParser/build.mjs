@@ -0,0 +1,103 @@
+// Builds the browser bundle of parser.js that the web UI imports:
+//
+//   node build.mjs           # writes hebrew_number/static/hebrew-number.<hash>.min.js
+//   node build.mjs --check   # exits 1 when the committed bundle is stale
+//
+// The lexicon is inlined, comments and indentation are stripped, and the file
+// name carries a hash of the content, so browsers may cache it forever and a
+// new build is picked up on the next page load. hebrew_number/static/hebrew-number.json
+// names the current bundle for hebrew_number/main.py. No dependencies beyond node.
+import { createHash } from "crypto";
+import fs from "fs";
+import path from "path";
+import { fileURLToPath } from "url";
+
+const here = path.dirname(fileURLToPath(import.meta.url));
+const staticDir = path.join(here, "..", "hebrew_number", "static");
+const manifestPath = path.join(staticDir, "hebrew-number.json");
+
+// Removes comments and the whitespace around lines and punctuation; line breaks
+// are kept (no reliance on semicolon insertion rules), as are strings, template
+// literals and regex literals.
+function minify(source) {
+  let out = "";
+  let i = 0;
+  const n = source.length;
+  const ident = c => /[\w$\u0080-\uffff]/.test(c);
+  const lastSignificant = () => out.trimEnd().slice(-1);
+  let pendingSpace = "";
+  const emit = s => {
+    if (pendingSpace) {
+      const prev = out.slice(-1);
+      if (pendingSpace === "\n" && out && prev !== "\n") out += "\n";
+      else if (ident(prev) && ident(s[0])) out += " ";
+      else if ("+-".includes(prev) && prev === s[0]) out += " ";
+      pendingSpace = "";
+    }
+    out += s;
+  };
+  while (i < n) {
+    const c = source[i];
+    if (c === "/" && source[i + 1] === "/") {
+      while (i < n && source[i] !== "\n") i++;
+    } else if (c === "/" && source[i + 1] === "*") {
+      i = source.indexOf("*/", i + 2) + 2;
+    } else if (/\s/.test(c)) {
+      let j = i;
+      while (j < n && /\s/.test(source[j])) j++;
+      if (source.slice(i, j).includes("\n") || pendingSpace === "\n") pendingSpace = "\n";
+      else pendingSpace = " ";
+      i = j;
+    } else if (c === '"' || c === "'" || c === "`") {
+      let j = i + 1;
+      while (source[j] !== c) j += source[j] === "\\" ? 2 : 1;
+      emit(source.slice(i, j + 1));
+      i = j + 1;
+    } else if (c === "/" && (!lastSignificant() || "(,=:[!&|?{};<>+-*%~^".includes(lastSignificant()) || /\breturn$/.test(out.trimEnd()))) {
+      let j = i + 1, inClass = false;
+      while (inClass || source[j] !== "/") {
+        if (source[j] === "\\") j++;
+        else if (source[j] === "[") inClass = true;
+        else if (source[j] === "]") inClass = false;
+        j++;
+      }
+      j++;
+      while (/[a-z]/.test(source[j])) j++;  // flags
+      emit(source.slice(i, j));
+      i = j;
+    } else {
+      let j = i + 1;
+      if (ident(c)) while (j < n && ident(source[j])) j++;
+      emit(source.slice(i, j));
+      i = j;
+    }
+  }
+  return out.trim() + "\n";
+}
+
+function bundle() {
+  const source = fs.readFileSync(path.join(here, "parser.js"), "utf8");
+  const lexicon = fs.readFileSync(path.join(here, "..", "hebrew_number", "lexicon.json"), "utf8");
+  const importLine = /^import lexicon from .*;$/m;
+  if (!importLine.test(source)) throw new Error("parser.js: lexicon import not found");
+  const inlined = source.replace(importLine, () => `const lexicon = ${JSON.stringify(JSON.parse(lexicon))};`);
+  const code = minify(inlined);
+  const hash = createHash("sha256").update(code).digest("hex").slice(0, 10);
+  return { name: `hebrew-number.${hash}.min.js`, code };
+}
+
+const { name, code } = bundle();
+if (process.argv.includes("--check")) {
+  const current = fs.existsSync(manifestPath) ? JSON.parse(fs.readFileSync(manifestPath, "utf8")).file : null;
+  if (current !== name || !fs.existsSync(path.join(staticDir, name))) {
+    console.error(`stale bundle: ${current}, expected ${name}; run \`node build.mjs\``);
+    process.exit(1);
+  }
+} else {
+  for (const old of fs.readdirSync(staticDir)) {
+    if (/^hebrew-number\.[0-9a-f]+\.min\.js$/.test(old) && old !== name) fs.rmSync(path.join(staticDir, old));
+  }
+  fs.writeFileSync(path.join(staticDir, name), code);
+  fs.writeFileSync(manifestPath, JSON.stringify({ file: name }) + "\n");
+  console.log(`hebrew_number/static/${name}: ${code.length} chars (parser.js: ${fs.statSync(path.join(here, "parser.js")).size} bytes)`);
+}
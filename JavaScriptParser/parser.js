@@ -1,265 +1,318 @@
-const hebrewUnits = new Map(Object.entries({
-  "אפס": 0,
-  "אחת": 1, "אחד": 1,
-  "שתיים": 2, "שניים": 2, "שתי": 2, "שני": 2,
-  "שלוש": 3, "שלושה": 3,
-  "ארבע": 4, "ארבעה": 4,
-  "חמש": 5, "חמישה": 5,
-  "שש": 6, "שישה": 6,
-  "שבע": 7, "שבעה": 7,
-  "שמונה": 8,
-  "תשע": 9, "תשעה": 9,
-}));
+// Port of hebrew_number/parser.py (the single-pass loop backend). Word lists are shared
+// with the Python parser (hebrew_number/lexicon.json) and conformance.json, generated
+// from the Python parser, keeps the two in step.
+import lexicon from "../hebrew_number/lexicon.json" with { type: "json" };
 
-const hebrewTens = new Map(Object.entries({
-  "עשר": 10, "עשרה": 10,
-  "עשרים": 20, "שלשים": 30, "שלושים": 30,
-  "ארבעים": 40, "חמישים": 50, "שישים": 60,
-  "שבעים": 70, "שמונים": 80, "תשעים": 90,
-}));
+// error messages, identical to hebrew_number/parser.py
+const ERR_TWO_TENS = "ניסוח לא תקין: שתי עשרות ברצף באותו מספר. נסה לנסח מחדש (למשל: 'אלף מאה וחמישים' במקום 'אלף שמונים שבעים').";
+const ERR_TENS_ALPAYIM = "ניסוח לא תקין: 'חמישים אלפיים' אינו תקין. כתוב 'חמישים אלף' או 'חמישים ושניים אלף'.";
+const ERR_DECIMAL_TAIL = "ניסוח לא תקין: אחרי 'נקודה' חייב לבוא ביטוי מספרי (למשל: 'נקודה חמש' / 'נקודה שבע מאות').";
+const ERR_REPEATED_FRACTION = "לא ניתן להשתמש בתוספת שבר (חצי/רבע) יותר מפעם אחת בביטוי";
+const ERR_SCALE_ORDER = "ניסוח לא תקין: לא ניתן להשתמש בשני מכפילים מאותו סדר גודל או גדול יותר ברצף (למשל 'מיליון מיליון', 'אלף מיליון').";
+const ERR_UNKNOWN_WORD = "מילה לא מוכרת";
+const ERR_TWO_UNITS = "ניסוח לא תקין: אחרי יחידה לא יכולות לבוא יחידה נוספת או מאות. נסה לנסח מחדש (למשל: 'מאה עשרים ושלוש' במקום 'מאה עשרים שלוש ארבע').";
+const ERR_REPEATED_POINT = "ניסוח לא תקין: 'נקודה' יכולה להופיע רק פעם אחת בביטוי";
+const ERR_ORDINAL = "מספר סודר (למשל 'שלישי') מתקבל רק כביטוי שלם, לא כחלק ממספר";
+const ERROR_CATEGORIES = [
+  [ERR_TWO_TENS, "two_tens"],
+  [ERR_TENS_ALPAYIM, "tens_alpayim"],
+  [ERR_DECIMAL_TAIL, "decimal_tail"],
+  [ERR_REPEATED_FRACTION, "repeated_fraction"],
+  [ERR_SCALE_ORDER, "scale_order"],
+  [ERR_UNKNOWN_WORD, "unknown_word"],
+  [ERR_TWO_UNITS, "two_units"],
+  [ERR_REPEATED_POINT, "repeated_point"],
+  [ERR_ORDINAL, "ordinal"],
+];
 
-const hebrewHundreds = new Map(Object.entries({
-  "מאה": 100, "מאתיים": 200, "מאתים": 200,
-  "שלוש מאות": 300, "שלושה מאות": 300,
-  "ארבע מאות": 400,
-  "חמש מאות": 500,
-  "שש מאות": 600,
-  "שבע מאות": 700,
-  "שמונה מאות": 800,
-  "תשע מאות": 900,
-}));
+// token kinds; a token is [word, kind, value, hasVav]
+const UNIT = 0, TEN = 1, HUNDRED = 2, SCALE = 3, FRACTION = 4, POINT = 5, VAV = 6, NUMBER = 7, WORD = 8, ALPAYIM = 9, ORDINAL = 10;
+const TWO_WORDS = new Set(["שניים", "שתיים", "שני"]);
+const ALPAYIM_TOKENS = [["שניים", UNIT, 2, false], ["אלפים", SCALE, 1000, false]];
 
-const scales = new Map(Object.entries({
-  "אלף": 1000, "אלפים": 1000,
-  "מיליון": 1000000, "מליון": 1000000,
-  "מיליארד": 1000000000, "מליארד": 1000000000,
-}));
+function fractionValue(ratio) {
+  const [n, d = "1"] = ratio.split("/");
+  return Number(n) / Number(d);
+}
+
+// same rules as _compile_lexicon in hebrew_number/parser.py
+function compileLexicon(data) {
+  const base = new Map();  // word -> [word, kind, value]
+  const fractions = Object.fromEntries(Object.entries(data.fractions ?? {}).map(([w, r]) => [w, fractionValue(r)]));
+  for (const [table, kind] of [[data.units, UNIT], [data.tens, TEN], [data.scales, SCALE], [fractions, FRACTION]]) {
+    for (const [word, value] of Object.entries(table ?? {})) {
+      if (!word.includes(" ")) base.set(word, [word, kind, value]);
+    }
+  }
+  for (const [word, value] of Object.entries(data.ordinals ?? {})) {
+    if (!base.has(word)) base.set(word, [word, ORDINAL, value]);
+  }
+  for (const [word, value] of Object.entries(data.hundreds ?? {})) {
+    if (!word.includes(" ")) base.set(word, [word, HUNDRED, value]);
+  }
+  const trie = new Map();  // first word -> Map(second word -> [kind, value])
+  for (const [table, kind] of [[data.tens, TEN], [data.hundreds, HUNDRED], [fractions, FRACTION]]) {
+    for (const [phrase, value] of Object.entries(table ?? {})) {
+      const [first, second] = phrase.split(" ");
+      if (second === undefined) continue;
+      if (!trie.has(first)) trie.set(first, new Map());
+      trie.get(first).set(second, [kind, value]);
+      if (!base.has(first)) base.set(first, [first, WORD, null]);
+      if (!base.has(second)) base.set(second, [second, WORD, null]);
+    }
+  }
+  for (const [alias, word] of Object.entries(data.aliases ?? {})) {
+    if (!base.has(alias)) base.set(alias, base.get(word));
+  }
+  base.set("נקודה", ["נקודה", POINT, null]);
+  base.set("ו", ["ו", VAV, null]);
+  base.set("אלפיים", ["אלפיים", ALPAYIM, null]);
+  const words = new Map();
+  for (const [raw, [w, kind, value]] of base) words.set(raw, [w, kind, value, false]);
+  for (const [raw, [w, kind, value]] of base) {
+    if (!words.has("ו" + raw)) words.set("ו" + raw, [w, kind, value, true]);
+  }
+  const skip = new Set([...(data.skip ?? []), ...(data.skip ?? []).map(w => "ו" + w)].filter(w => !words.has(w)));
+  return { words, trie, skip };
+}
+
+const { words: LEXICON, trie: PHRASE_TRIE, skip: SKIP } = compileLexicon(lexicon);
 
 function isNumberToken(tok) { return /^\d+(?:\.\d+)?$/.test(tok); }
 
+function unknownToken(raw) {
+  const hv = raw.startsWith("ו") && raw.length > 1;
+  const word = hv ? raw.slice(1) : raw;
+  return [word, isNumberToken(word) ? NUMBER : WORD, null, hv];
+}
+
+function fail(message, position) {
+  const error = new Error(message);
+  error.code = (ERROR_CATEGORIES.find(([prefix]) => message.startsWith(prefix)) ?? [null, "other"])[1];
+  error.position = position;
+  return error;
+}
+
+// 'ו' prefixes are stripped, 'אלפיים' expands to 'שניים אלפים', skip words
+// (currency) are dropped and two-word entries are merged into a single token
 function tokenize(text) {
-  // split by whitespace; keep dots if attached (will be invalid)
-  const raw = text.replace(/־/g, " ").trim().split(/\s+/).filter(Boolean);
-  const hasVav = raw.map(p => p.startsWith("ו") && p.length > 1);
-  const parts = raw.map((p, i) => hasVav[i] ? p.slice(1) : p);
-  // normalize 'אלפיים' -> 'שניים אלפים'
-  const normalized = [];
-  const vflags = [];
-  for (let i = 0; i < parts.length; i++) {
-    const tok = parts[i], hv = hasVav[i];
-    if (tok === "אלפיים") {
-      normalized.push("שניים", "אלפים");
-      vflags.push(false, false);
-    } else {
-      normalized.push(tok);
-      vflags.push(hv);
+  const tokens = [];
+  let pending = null;  // trie node of the previous token, if it can start a two-word entry
+  for (const raw of text.replace(/־/g, " ").split(/\s+/)) {
+    if (!raw) continue;
+    let tok = LEXICON.get(raw);
+    if (tok === undefined) {
+      if (SKIP.has(raw)) continue;
+      tok = unknownToken(raw);
+    }
+    const [word, kind] = tok;
+    if (pending !== null && pending.has(word)) {
+      const prev = tokens[tokens.length - 1];
+      const [mergedKind, value] = pending.get(word);
+      tokens[tokens.length - 1] = [`${prev[0]} ${word}`, mergedKind, value, prev[3]];
+      pending = null;
+      continue;
+    }
+    if (kind === ALPAYIM) {
+      tokens.push(...ALPAYIM_TOKENS);
+      pending = null;
+      continue;
     }
+    tokens.push(tok);
+    pending = kind === UNIT || kind === WORD ? PHRASE_TRIE.get(word) ?? null : null;
   }
-  return { parts: normalized, hasVav: vflags };
+  return tokens;
 }
 
-function parseDecimalPhrase(tokens) {
-  // Decide mode: digit-sequence (no magnitudes) vs numeric-phrase (with tens/hundreds/אלף)
-  let hasMagnitude = false;
-  for (let i = 0; i < tokens.length; i++) {
-    const t = tokens[i];
-    if (hebrewTens.has(t) || hebrewHundreds.has(t) || t === "אלף" || t === "אלפים") { hasMagnitude = true; break; }
-    if (i + 1 < tokens.length && hebrewHundreds.has(`${t} ${tokens[i+1]}`)) { hasMagnitude = true; break; }
-  }
-
-  if (!hasMagnitude) {
-    // Treat as a sequence of digits: units words -> single digits; numeric strings append as-is.
-    let digits = "";
-    for (let k = 0; k < tokens.length; k++) {
-      const t = tokens[k];
-      if (/^\d+$/.test(t)) { digits += t; continue; }
-      if (hebrewUnits.has(t)) { digits += String(hebrewUnits.get(t)); continue; }
-      // unknown token in digit mode -> stop
-      break;
+function checkStrict(tokens, i, kind) {
+  if (kind === TEN) {
+    if (i && (tokens[i-1][1] === TEN || (i > 1 && tokens[i-1][1] === VAV && tokens[i-2][1] === TEN))) {
+      throw fail(ERR_TWO_TENS, i);
     }
-    if (digits.length === 0) digits = "0";
-    return digits;
+  } else if (i > 1 && tokens[i][0] === "אלפים" && TWO_WORDS.has(tokens[i-1][0]) && tokens[i-2][1] === TEN) {
+    throw fail(ERR_TENS_ALPAYIM, i);
   }
+}
 
-  // Numeric-phrase mode: compute an integer from tens/hundreds/אלף
-  let val = 0, group = 0, k = 0;
-  while (k < tokens.length) {
-    const t = tokens[k];
-    if (k + 1 < tokens.length && hebrewHundreds.has(`${t} ${tokens[k+1]}`)) { group += hebrewHundreds.get(`${t} ${tokens[k+1]}`); k += 2; continue; }
-    if (hebrewHundreds.has(t)) { group += hebrewHundreds.get(t); k++; continue; }
-    if (hebrewTens.has(t)) { group += hebrewTens.get(t); k++; continue; }
-    if (hebrewUnits.has(t)) { group += hebrewUnits.get(t); k++; continue; }
-    if (/^\d+$/.test(t)) { group = group * (10 ** t.length) + parseInt(t, 10); k++; continue; }
-    if (t === "אלף" || t === "אלפים") {
-      if (group === 0) group = 1;
-      val = val * 1000 + group * 1000;
-      group = 0;
-      k++; continue;
+const isDigits = word => /^\d+$/.test(word);
+
+// the tail after 'נקודה' from tokens[i]: [digits, end] (see _scan_decimal_tail)
+function scanDecimalTail(tokens, i, n) {
+  let digits = [];
+  let val = 0n, group = 0n;  // BigInt: the tail is a digit string of any length
+  let j = i;
+  for (; j < n; j++) {
+    const [word, kind, value] = tokens[j];
+    if (kind === UNIT || (kind === NUMBER && isDigits(word))) {
+      if (digits !== null) digits.push(kind === NUMBER ? word : String(value));
+      else if (kind === UNIT) group += BigInt(value);
+      else group = group * 10n ** BigInt(word.length) + BigInt(word);
+    } else if (kind === TEN || kind === HUNDRED || (kind === SCALE && value === 1000)) {
+      checkStrict(tokens, j, kind);
+      if (digits !== null) {
+        // first magnitude: fold the digits seen so far into the integer
+        for (let k = i; k < j; k++) {
+          const [w, kd, v] = tokens[k];
+          group = kd === NUMBER ? group * 10n ** BigInt(w.length) + BigInt(w) : group + BigInt(v);
+        }
+        digits = null;
+      }
+      if (kind === SCALE) {
+        val = val * 1000n + (group || 1n) * 1000n;
+        group = 0n;
+      } else {
+        group += BigInt(value);
+      }
+    } else {
+      break;
     }
-    break;
   }
+  if (digits !== null) return [digits.join("") || "0", j];
   val += group;
-  return val > 0 ? String(val) : "0";
+  return [val > 0n ? String(val) : "0", j];
 }
 
-export function hebrewToNumber(text) {
-  const { parts, hasVav } = tokenize(text);
+// the loop of _evaluate in hebrew_number/parser.py, in float arithmetic
+function evaluate(text) {
+  const tokens = tokenize(text);
+  const n = tokens.length;
   let i = 0;
-  const groups = [];
-  let currentGroup = 0.0;
+  const groups = [];  // [value, multiplier]
+  let currentGroup = 0;
   let usedFraction = false;
-  let seenTensInSegment = false;
-  let seenUnitsInSegment = false;
-  let usedDecimal = false;
+  let usedPoint = false;
+  let seenTensInSegment = false;  // reset on scales
   let lastScaleValue = null;
 
-  // quick invalid tokens: trailing '.' etc.
-  for (const w of parts) {
-    if (/[.]/.test(w)) {
-      // dots are only allowed inside plain digit tokens via isNumberToken, not appended to words
-      if (!isNumberToken(w)) throw new Error("ניסוח לא תקין: נקודה לא במיקום תקין");
-    }
-  }
+  while (i < n) {
+    const [w, kind, value] = tokens[i];
 
-  // strictness pre-checks
-  for (let idx = 0; idx < parts.length - 1; idx++) {
-    if (hebrewTens.has(parts[idx])) {
-      let j = idx + 1;
-      if (parts[j] === "ו") j++;
-      if (j < parts.length && hebrewTens.has(parts[j])) {
-        throw new Error("ניסוח לא תקין: שתי עשרות ברצף באותו מספר.");
-      }
+    // an ordinal is a number only on its own: 'שלישי', but not 'מאה שלישי'
+    if (kind === ORDINAL) {
+      if (n > 1) throw fail(ERR_ORDINAL, i);
+      return value;
     }
-    if (hebrewTens.has(parts[idx]) && (parts[idx+1] === "אלפיים" || (idx+2 < parts.length && (parts[idx+1] === "שניים" || parts[idx+1] === "שתיים" || parts[idx+1] === "שני") && parts[idx+2] === "אלפים"))) {
-      throw new Error("ניסוח לא תקין: 'חמישים אלפיים' אינו תקין.");
-    }
-  }
 
-  while (i < parts.length) {
-    const w = parts[i];
-
-    if (w === "נקודה") {
-      if (usedDecimal) throw new Error("ניסוח לא תקין: יותר מנקודה עשרונית אחת");
-      let j = i + 1;
-      const allowed = [];
-      while (j < parts.length) {
-        const t = parts[j];
-        if (t === "ו") break;
-        if (t === "מיליון" || t === "מליון" || t === "מיליארד" || t === "מליארד") break;
-        if (j + 1 < parts.length && hebrewHundreds.has(`${t} ${parts[j+1]}`)) { allowed.push(t, parts[j+1]); j += 2; continue; }
-        if (/^\d+$/.test(t) || hebrewUnits.has(t) || hebrewTens.has(t) || hebrewHundreds.has(t) || t === "אלף" || t === "אלפים") { allowed.push(t); j++; continue; }
-        break;
-      }
-      if (!allowed.length) throw new Error("ניסוח לא תקין: אחרי 'נקודה' חייב לבוא ביטוי מספרי.");
-      const digits = parseDecimalPhrase(allowed);
+    if (kind === POINT) {
+      if (usedPoint) throw fail(ERR_REPEATED_POINT, i);
+      usedPoint = true;
+      const [digits, j] = scanDecimalTail(tokens, i + 1, n);
+      if (j === i + 1) throw fail(ERR_DECIMAL_TAIL, i);
       currentGroup += Number("0." + digits);
-      usedDecimal = true;
       i = j;
       continue;
     }
 
-    if (w === "ו" && i + 1 < parts.length && (parts[i+1] === "חצי" || parts[i+1] === "רבע")) {
-      if (usedFraction) throw new Error("לא ניתן להשתמש בתוספת שבר (חצי/רבע) יותר מפעם אחת בביטוי");
-      const frac = parts[i+1] === "חצי" ? 0.5 : 0.25;
+    // separate 'ו חצי' / 'ו רבע'
+    if (kind === VAV && i + 1 < n && tokens[i+1][1] === FRACTION) {
+      if (usedFraction) throw fail(ERR_REPEATED_FRACTION, i + 1);
+      const frac = tokens[i+1][2];
       if (currentGroup > 0) currentGroup += frac;
-      else if (groups.length) { const lastMult = groups[groups.length - 1][1]; groups.push([frac, lastMult]); }
+      else if (groups.length) groups.push([frac, groups[groups.length - 1][1]]);  // attach to last scale
       else currentGroup += frac;
       usedFraction = true;
       i += 2;
       continue;
     }
 
-    if (parts[i] === "חצי" || parts[i] === "רבע") {
-      if (usedFraction) throw new Error("לא ניתן להשתמש בתוספת שבר (חצי/רבע) יותר מפעם אחת בביטוי");
-      currentGroup += parts[i] === "חצי" ? 0.5 : 0.25;
+    if (kind === FRACTION) {
+      if (usedFraction) throw fail(ERR_REPEATED_FRACTION, i);
+      currentGroup += value;
       usedFraction = true;
       i += 1;
       continue;
     }
 
-    if (isNumberToken(w)) {
-      let num = parseFloat(w);
-      if (i + 2 < parts.length && parts[i+1] === "ו" && (parts[i+2] === "חצי" || parts[i+2] === "רבע") && !usedFraction) {
-        num += (parts[i+2] === "חצי" ? 0.5 : 0.25);
+    if (kind === NUMBER) {
+      let number = Number(w);
+      if (i + 2 < n && tokens[i+1][1] === VAV && tokens[i+2][1] === FRACTION && !usedFraction) {
+        number += tokens[i+2][2];
         usedFraction = true;
         i += 3;
-      } else if (i + 1 < parts.length && (parts[i+1] === "חצי" || parts[i+1] === "רבע") && !usedFraction) {
-        num += (parts[i+1] === "חצי" ? 0.5 : 0.25);
+      } else if (i + 1 < n && tokens[i+1][1] === FRACTION && !usedFraction) {
+        number += tokens[i+1][2];
         usedFraction = true;
         i += 2;
       } else {
         i += 1;
       }
-      currentGroup += num;
+      currentGroup += number;
       seenTensInSegment = false;
-      // numbers reset units/tens tracking for the segment
-      seenUnitsInSegment = false;
       continue;
     }
 
-    if (i + 1 < parts.length && hebrewHundreds.has(`${w} ${parts[i+1]}`)) {
-      currentGroup += hebrewHundreds.get(`${w} ${parts[i+1]}`);
-      i += 2;
-      seenTensInSegment = false;
-      // hundreds do not imply units yet
-      continue;
-    }
-
-    if (hebrewHundreds.has(w)) {
-      currentGroup += hebrewHundreds.get(w);
+    if (kind === HUNDRED) {
+      if (i && tokens[i-1][1] === UNIT) throw fail(ERR_TWO_UNITS, i);  // 'שלוש מאה'
+      currentGroup += value;
       i += 1;
       seenTensInSegment = false;
       continue;
     }
 
-    if (hebrewTens.has(w)) {
-      if (seenTensInSegment) throw new Error("ניסוח לא תקין: שתי עשרות ברצף באותו מספר.");
-      currentGroup += hebrewTens.get(w);
+    if (kind === TEN) {
+      checkStrict(tokens, i, kind);
+      if (seenTensInSegment) throw fail(ERR_TWO_TENS, i);
+      currentGroup += value;
       i += 1;
       seenTensInSegment = true;
       continue;
     }
 
-    if (hebrewUnits.has(w)) {
-      if (seenUnitsInSegment) throw new Error("ניסוח לא תקין: יותר מיחידת ספירה אחת באותו מקטע");
-      currentGroup += hebrewUnits.get(w);
+    // one unit per number; a teen's comes before its ten ('שלוש עשרה')
+    if (kind === UNIT) {
+      if (i && tokens[i-1][1] === UNIT) throw fail(ERR_TWO_UNITS, i);  // 'שלוש ארבע'
+      currentGroup += value;
       i += 1;
-      seenUnitsInSegment = true;
       continue;
     }
 
-    if (scales.has(w)) {
-      const mult = scales.get(w);
-      if (lastScaleValue !== null && mult >= lastScaleValue) throw new Error("ניסוח לא תקין: לא ניתן להשתמש בשני מכפילים מאותו סדר גודל או גדול יותר ברצף.");
+    if (kind === SCALE) {
+      checkStrict(tokens, i, kind);
+      const mult = value;
+      if (lastScaleValue !== null && mult >= lastScaleValue) throw fail(ERR_SCALE_ORDER, i);
       lastScaleValue = mult;
-      const groupVal = currentGroup !== 0 ? currentGroup : 1;
-      groups.push([groupVal, mult]);
-      currentGroup = 0.0;
-      // reset segment flags
+      groups.push([currentGroup !== 0 ? currentGroup : 1, mult]);
+      currentGroup = 0;
       seenTensInSegment = false;
-      seenUnitsInSegment = false;
-      usedDecimal = false; // decimal applies to the current small number only
 
-      // attached 'ו' fraction after scale
-      if (i + 2 < parts.length && parts[i+1] === "ו" && (parts[i+2] === "חצי" || parts[i+2] === "רבע")) {
-        if (usedFraction) throw new Error("לא ניתן להשתמש בתוספת שבר (חצי/רבע) יותר מפעם אחת בביטוי");
-        groups.push([parts[i+2] === "חצי" ? 0.5 : 0.25, mult]);
-        usedFraction = true; i += 3; continue;
+      // attached 'ו' fraction after scale ('מיליון וחצי' / 'מיליון ו חצי')
+      if (i + 2 < n && tokens[i+1][1] === VAV && tokens[i+2][1] === FRACTION) {
+        if (usedFraction) throw fail(ERR_REPEATED_FRACTION, i + 2);
+        groups.push([tokens[i+2][2], mult]);
+        usedFraction = true;
+        i += 3;
+        continue;
       }
-      if (i + 1 < parts.length && hasVav[i+1] && (parts[i+1] === "חצי" || parts[i+1] === "רבע")) {
-        if (usedFraction) throw new Error("לא ניתן להשתמש בתוספת שבר (חצי/רבע) יותר מפעם אחת בביטוי");
-        groups.push([parts[i+1] === "חצי" ? 0.5 : 0.25, mult]);
-        usedFraction = true; i += 2; continue;
+      if (i + 1 < n && tokens[i+1][3] && tokens[i+1][1] === FRACTION) {
+        if (usedFraction) throw fail(ERR_REPEATED_FRACTION, i + 1);
+        groups.push([tokens[i+1][2], mult]);
+        usedFraction = true;
+        i += 2;
+        continue;
       }
-
       i += 1;
       continue;
     }
 
-    throw new Error(`מילה לא מוכרת: ${w}`);
+    if (kind === VAV && i + 1 < n && tokens[i+1][1] === TEN) checkStrict(tokens, i + 1, TEN);  // 'שמונים ו שבעים'
+    throw fail(`${ERR_UNKNOWN_WORD}: ${w}`, i);
   }
 
-  let total = groups.reduce((s, [g,m]) => s + g*m, 0);
-  total += currentGroup;
-  return total;
+  return groups.reduce((sum, [g, m]) => sum + g * m, 0) + currentGroup;
+}
+
+// Convert a Hebrew number phrase to a number; throws an Error (with `code` and
+// `position`, the index of the offending token) when it does not parse.
+export function hebrewToNumber(text) {
+  return evaluate(text);
+}
+
+// Like hebrewToNumber, but returns {value} or {error, code, position} instead of throwing.
+export function parse(text) {
+  try {
+    return { value: evaluate(text) };
+  } catch (e) {
+    if (e.code === undefined) throw e;
+    return { error: e.message, code: e.code, position: e.position };
+  }
 }
@@ -1,4 +1,4 @@
-import { hebrewToNumber } from './parser';
+import { hebrewToNumber, parse } from './parser';
 import fs from 'fs';
 import { fileURLToPath } from 'url';
 import path from 'path';
@@ -7,6 +7,8 @@ const __filename = fileURLToPath(import.meta.url);
 const __dirname = path.dirname(__filename);
 
 const data = JSON.parse(fs.readFileSync(__dirname + '/test_cases.json', 'utf8'));
+// generated from the Python parser by tests/conformance.py
+const corpus = JSON.parse(fs.readFileSync(__dirname + '/conformance.json', 'utf8'));
 
 describe('Hebrew Number Parser (JS) — parity & invalids', () => {
   test.each(data.valid.map(v => [v.text, v.expected]))('valid: %s', (text, expected) => {
@@ -18,3 +20,13 @@ describe('Hebrew Number Parser (JS) — parity & invalids', () => {
     expect(() => hebrewToNumber(text)).toThrow();
   });
 });
+
+describe('conformance with the Python parser', () => {
+  test.each(corpus.valid.map(c => [c.text, c.expected]))('value: %s', (text, expected) => {
+    expect(parse(text)).toEqual({ value: expected });
+  });
+
+  test.each(corpus.invalid.map(c => [c.text, c]))('error: %s', (text, c) => {
+    expect(parse(text)).toEqual({ error: c.error, code: c.code, position: c.position });
+  });
+});
@@ -0,0 +1,36 @@
+"""The old import path of hebrew_number, for code and deployments written before the rename.
+
+    from app import hebrew_to_number       # same object as hebrew_number.hebrew_to_number
+    uvicorn app.main:app                   # runs hebrew_number.main
+
+Every `app.<module>` import returns the hebrew_number module itself, so state such as
+the result cache and the limits is shared. Only the source tree has this package;
+`pip install` ships hebrew_number alone.
+"""
+import importlib
+import importlib.abc
+import importlib.util
+import sys
+
+from hebrew_number import __all__  # noqa: F401
+import hebrew_number
+
+
+class _Alias(importlib.abc.MetaPathFinder, importlib.abc.Loader):
+    def find_spec(self, name, path=None, target=None):
+        if name.startswith(__name__ + "."):
+            return importlib.util.spec_from_loader(name, self)
+        return None
+
+    def create_module(self, spec):
+        return importlib.import_module("hebrew_number" + spec.name[len(__name__):])
+
+    def exec_module(self, module):
+        pass
+
+
+sys.meta_path.insert(0, _Alias())
+
+
+def __getattr__(name):
+    return getattr(hebrew_number, name)
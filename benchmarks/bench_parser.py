@@ -0,0 +1,45 @@
+"""Per-call latency of the tokenizer and parser over the shared test corpus.
+
+    python benchmarks/bench_parser.py [--repeat N]
+"""
+import argparse
+import json
+import sys
+import timeit
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from hebrew_number.parser import _tokenize, hebrew_to_number  # noqa: E402
+
+
+def load_phrases(kind: str = "valid"):
+    with open(ROOT / "JavaScriptParser" / "test_cases.json", encoding="utf-8") as f:
+        cases = json.load(f)
+    return [c["text"] if isinstance(c, dict) else c for c in cases[kind]]
+
+
+def per_call_us(fn, phrases, repeat):
+    def run():
+        for p in phrases:
+            fn(p)
+    best = min(timeit.repeat(run, number=1, repeat=repeat))
+    return best / len(phrases) * 1e6
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--repeat", type=int, default=200)
+    args = ap.parse_args()
+    phrases = load_phrases()
+    print(f"{len(phrases)} phrases, best of {args.repeat}")
+    print(f"_tokenize         {per_call_us(_tokenize, phrases, args.repeat):7.2f} us/call")
+    print(f"hebrew_to_number  {per_call_us(hebrew_to_number, phrases, args.repeat):7.2f} us/call")
+    for mode in ("decimal", "fraction"):
+        us = per_call_us(lambda p: hebrew_to_number(p, mode=mode), phrases, args.repeat)
+        print(f"  mode={mode:<9} {us:7.2f} us/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""Differential fuzzing: an alternative engine against the reference parser.
+
+    python benchmarks/differential.py dfa -n 1000000 --workers 8
+    python benchmarks/differential.py incremental --compare ok
+    python benchmarks/differential.py mypkg.fast:hebrew_to_number --mode fraction
+    python benchmarks/differential.py dfa --exhaustive      # one phrase of every shape
+
+Phrases come from phrasegen.py (valid shapes up to trillions plus mutations for
+every strictness error). Each worker process generates its own seeded chunks,
+so only mismatches cross process boundaries. An engine is `dfa`, `incremental`
+or `module:function` called as function(text, mode) that raises ValueError on
+a phrase it rejects. --compare sets what must agree: the value and the error
+message (default), the value and the error category, or the value and whether
+there is an error. Reports phrases per second of the whole run and of each
+engine alone. Exits 1 on a mismatch.
+"""
+import argparse
+import importlib
+import itertools
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import phrasegen  # noqa: E402
+from hebrew_number.metrics import error_category  # noqa: E402
+from hebrew_number.parser import hebrew_to_number  # noqa: E402
+
+CHUNK = 10_000
+
+
+def _incremental(text: str, mode: str):
+    from hebrew_number.incremental import IncrementalParser
+    p = IncrementalParser(mode)
+    for word in text.split():
+        if not p.feed(word):
+            raise ValueError(f"rejected at {word!r}")
+    return p.finish()
+
+
+def resolve_engine(spec: str):
+    """Callable (text, mode) of an engine name or 'module:function'."""
+    if spec == "reference":
+        return hebrew_to_number
+    if spec == "dfa":
+        return lambda text, mode: hebrew_to_number(text, mode, backend="dfa")
+    if spec == "incremental":
+        return _incremental
+    module, sep, name = spec.partition(":")
+    if not sep:
+        raise ValueError(f"unknown engine: {spec!r} (use dfa, incremental or module:function)")
+    return getattr(importlib.import_module(module), name)
+
+
+def outcome(fn, text: str, mode: str, compare: str):
+    try:
+        value = fn(text, mode)
+    except ValueError as e:
+        if compare == "message":
+            return "error", str(e)
+        return "error", error_category(str(e)) if compare == "category" else None
+    return type(value).__name__, value
+
+
+def run_chunk(engine: str, mode: str, compare: str, seed: int, start: int, count: int, max_report: int = 10):
+    """Compare the engine with the reference on `count` phrases of chunk `start`.
+       Returns (count, reference seconds, engine seconds, mismatch count, first mismatches)."""
+    ref, alt = resolve_engine("reference"), resolve_engine(engine)
+    if start < 0:  # exhaustive: chunk -k-1 fills shapes k*count .. (k+1)*count
+        rng = random.Random(seed * 1_000_003 - start)
+        first = (-start - 1) * count
+        texts = [phrasegen.valid_phrase(s, rng)[0] for s in itertools.islice(phrasegen.shapes(), first, first + count)]
+    else:
+        texts = list(phrasegen.phrases(count, seed * 1_000_003 + start))
+    t0 = time.perf_counter()
+    expected = [outcome(ref, t, mode, compare) for t in texts]
+    t1 = time.perf_counter()
+    got = [outcome(alt, t, mode, compare) for t in texts]
+    t2 = time.perf_counter()
+    mismatches = [(t, e, g) for t, e, g in zip(texts, expected, got) if e != g]
+    return len(texts), t1 - t0, t2 - t1, len(mismatches), mismatches[:max_report]
+
+
+def run(engine: str, count: int, mode: str = "float", compare: str = "message", seed: int = 0,
+        workers: int = 1, exhaustive: bool = False, chunk: int = CHUNK):
+    """Run the comparison; returns a dict with counts, rates and up to 10 of the mismatches."""
+    resolve_engine(engine)  # fail fast on a bad spec
+    if exhaustive:
+        total = sum(1 for _ in phrasegen.shapes())
+        starts = [-k - 1 for k in range(-(-total // chunk))]
+        sizes = [chunk] * len(starts)
+    else:
+        starts = list(range(0, count, chunk))
+        sizes = [min(chunk, count - s) for s in starts]
+    n = len(starts)
+    args = ([engine] * n, [mode] * n, [compare] * n, [seed] * n, starts, sizes)
+    t0 = time.perf_counter()
+    if workers > 1 and n > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(run_chunk, *args))
+    else:
+        results = list(map(run_chunk, *args))
+    elapsed = time.perf_counter() - t0
+    phrases = sum(r[0] for r in results)
+    ref_s, alt_s = sum(r[1] for r in results), sum(r[2] for r in results)
+    return {
+        "engine": engine, "mode": mode, "phrases": phrases, "seconds": elapsed,
+        "phrases_per_s": phrases / elapsed if elapsed else 0.0,
+        "reference_per_s": phrases / ref_s if ref_s else 0.0,
+        "engine_per_s": phrases / alt_s if alt_s else 0.0,
+        "mismatch_count": sum(r[3] for r in results),
+        "mismatches": [m for r in results for m in r[4]][:10],
+    }
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("engine", help="dfa, incremental or module:function")
+    ap.add_argument("-n", "--count", type=int, default=1_000_000, help="generated phrases (default: 1,000,000)")
+    ap.add_argument("--mode", choices=("float", "decimal", "fraction"), default="float")
+    ap.add_argument("--compare", choices=("message", "category", "ok"), default="message")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    ap.add_argument("--exhaustive", action="store_true", help="one phrase of each shape instead of -n random ones")
+    args = ap.parse_args(argv)
+    r = run(args.engine, args.count, args.mode, args.compare, args.seed, args.workers, args.exhaustive)
+    print(f"{r['engine']} vs reference, mode={r['mode']}: {r['phrases']:,} phrases in {r['seconds']:.1f}s")
+    print(f"  run        {r['phrases_per_s']:12,.0f} phrases/s  ({args.workers} workers, generation included)")
+    print(f"  reference  {r['reference_per_s']:12,.0f} phrases/s  (one process)")
+    print(f"  {args.engine:<10} {r['engine_per_s']:12,.0f} phrases/s  (one process)")
+    if r["mismatch_count"]:
+        print(f"{r['mismatch_count']:,} mismatches, first {len(r['mismatches'])}:")
+    for text, expected, got in r["mismatches"]:
+        print(f"MISMATCH {text!r}: reference {expected!r}, {args.engine} {got!r}")
+    return 1 if r["mismatch_count"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
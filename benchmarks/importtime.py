@@ -0,0 +1,59 @@
+"""Cold-start import time of the library modules, from `python -X importtime`.
+
+    python benchmarks/importtime.py                       # table per module
+    python benchmarks/importtime.py --max-ms 15           # exit 1 if hebrew_number.parser is slower
+
+Each module is imported in a fresh interpreter; the reported time is the best
+cumulative time over --repeat runs, with the slowest dependencies it pulled in.
+"""
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+MODULES = ("hebrew_number", "hebrew_number.parser", "hebrew_number.hebrew_format", "hebrew_number.extract", "hebrew_number.incremental", "hebrew_number.cli")
+
+
+def import_times(module: str) -> dict:
+    """{module and each module it pulled in: cumulative us} for a cold `import module`."""
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                          cwd=ROOT, capture_output=True, text=True, check=True)
+    rows = []  # (name, depth, cumulative us), in the order imports finished
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        rows.append((name.strip(), len(name) - len(name.lstrip()), int(cumulative)))
+    # the target is the last top-level row; its dependencies are the deeper rows just before it
+    end = max(i for i, (name, _, _) in enumerate(rows) if name == module)
+    depth = rows[end][1]
+    start = end
+    while start > 0 and rows[start - 1][1] > depth:
+        start -= 1
+    return {name: us for name, _, us in rows[start:end + 1]}
+
+
+def import_time_us(module: str, repeat: int = 5) -> float:
+    return min(import_times(module)[module] for _ in range(repeat))
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--max-ms", type=float, help="fail when importing hebrew_number.parser takes longer")
+    args = ap.parse_args()
+    for module in MODULES:
+        times = import_times(module)
+        heaviest = sorted((t, m) for m, t in times.items() if not m.startswith("hebrew_number"))[-3:]
+        print(f"{module:<30}{import_time_us(module, args.repeat) / 1000:8.2f} ms   "
+              + ", ".join(f"{m} {t / 1000:.1f}" for t, m in reversed(heaviest)))
+    if args.max_ms is not None:
+        ms = import_time_us("hebrew_number.parser", args.repeat) / 1000
+        if ms > args.max_ms:
+            print(f"\nimporting hebrew_number.parser took {ms:.2f} ms (limit {args.max_ms} ms)", file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""HTTP load test for the API: reports requests/sec and p50/p99 latency.
+
+    # against a running server
+    python benchmarks/loadtest.py --url http://127.0.0.1:8000 -c 64 -d 10
+    # start the server itself (default and lean serving modes)
+    python benchmarks/loadtest.py --spawn hebrew_number.main:app
+    python benchmarks/loadtest.py --spawn hebrew_number.fast:app
+
+Uses only the standard library: each of the -c connections is an asyncio
+keep-alive HTTP/1.1 client cycling through the phrases of test_cases.json.
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+from urllib.parse import quote, urlsplit
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def load_phrases():
+    with open(ROOT / "JavaScriptParser" / "test_cases.json", encoding="utf-8") as f:
+        cases = json.load(f)
+    return [c["text"] for c in cases["valid"]] + cases["invalid"]
+
+
+def build_requests(host, method, phrases):
+    reqs = []
+    for text in phrases:
+        if method == "GET":
+            reqs.append(f"GET /hebrew-number?text={quote(text)} HTTP/1.1\r\nHost: {host}\r\n\r\n".encode())
+        else:
+            body = json.dumps({"text": text}).encode()
+            head = (f"POST /hebrew-number HTTP/1.1\r\nHost: {host}\r\n"
+                    f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n")
+            reqs.append(head.encode() + body)
+    return reqs
+
+
+async def read_response(reader):
+    head = await reader.readuntil(b"\r\n\r\n")
+    status = int(head.split(b" ", 2)[1])
+    length = 0
+    for line in head.split(b"\r\n"):
+        if line.lower().startswith(b"content-length:"):
+            length = int(line.split(b":", 1)[1])
+    await reader.readexactly(length)
+    return status
+
+
+async def worker(host, port, reqs, offset, deadline, latencies, errors):
+    reader, writer = await asyncio.open_connection(host, port)
+    i = offset
+    try:
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            writer.write(reqs[i % len(reqs)])
+            status = await read_response(reader)
+            latencies.append(time.perf_counter() - start)
+            if status != 200:
+                errors.append(status)
+            i += 1
+    finally:
+        writer.close()
+
+
+async def run(host, port, reqs, concurrency, duration):
+    latencies, errors = [], []
+    deadline = time.perf_counter() + duration
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(host, port, reqs, k, deadline, latencies, errors) for k in range(concurrency)))
+    return latencies, errors, time.perf_counter() - start
+
+
+def percentile(sorted_values, q):
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+
+def wait_for_port(host, port, timeout=15.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            with socket.create_connection((host, port), timeout=0.5):
+                return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError(f"server did not start on {host}:{port}")
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--url", default="http://127.0.0.1:8765")
+    ap.add_argument("--spawn", metavar="MODULE:APP", help="start uvicorn with this app for the run")
+    ap.add_argument("-c", "--concurrency", type=int, default=32)
+    ap.add_argument("-d", "--duration", type=float, default=10.0, help="seconds")
+    ap.add_argument("--method", choices=("GET", "POST"), default="GET")
+    args = ap.parse_args()
+
+    url = urlsplit(args.url)
+    host, port = url.hostname, url.port or 80
+    server = None
+    if args.spawn:
+        server = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", args.spawn, "--host", host, "--port", str(port), "--no-access-log",
+             "--log-level", "warning"],
+            cwd=ROOT, env={**os.environ, "PYTHONPATH": str(ROOT)})
+    try:
+        wait_for_port(host, port)
+        reqs = build_requests(host, args.method, load_phrases())
+        latencies, errors, elapsed = asyncio.run(run(host, port, reqs, args.concurrency, args.duration))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    latencies.sort()
+    print(f"{args.spawn or args.url}  {args.method}  c={args.concurrency}  {elapsed:.1f}s")
+    print(f"requests  {len(latencies)}  (non-200: {len(errors)})")
+    print(f"rps       {len(latencies) / elapsed:,.0f}")
+    print(f"p50       {percentile(latencies, 0.50) * 1e3:.2f} ms")
+    print(f"p99       {percentile(latencies, 0.99) * 1e3:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+"""Generated phrases with known outcomes, built from the parser's word tables.
+
+A valid phrase is a shape (which scales appear and how each amount is spelled,
+plus an optional fraction or 'נקודה' tail) filled in with random words:
+
+    shapes()                       # every shape, in a fixed order (295,240 of them)
+    valid_phrase(shape, rng)       # -> (text, exact value as a Fraction)
+    invalid_phrase(error, rng)     # -> text the parser must reject with that error category
+
+Amounts run from 1 to 999 per scale (up to trillions) and spell units, teens,
+tens, hundreds and digit strings with their alternative forms ('שלוש'/'שלושה',
+'מיליון'/'מליון', 'אלף'/'אלפים'/'אלפיים'), with or without 'ו'.
+"""
+import itertools
+import random
+from fractions import Fraction
+
+from hebrew_number.parser import (
+    ERROR_CATEGORIES, fractions_map, hebrew_hundreds, hebrew_tens, hebrew_units, ordinals_map, scales,
+)
+
+AMOUNT_FORMS = ("unit", "teen", "ten", "ten_unit", "hundred", "hundred_unit", "hundred_ten_unit", "digits")
+SUFFIXES = ("none", "fraction", "fraction_in_group", "tail_digits", "tail_integer")
+# error categories that invalid_phrase can produce (inexact_decimal needs mode="decimal";
+# the input limits of hebrew_number.limits are not grammar errors)
+_NOT_MUTATIONS = ("inexact_decimal", "text_too_long", "too_many_words", "too_many_digits")
+MUTATIONS = tuple(c for _, c in ERROR_CATEGORIES if c not in _NOT_MUTATIONS)
+
+
+def _words_by_value(table):
+    out = {}
+    for word, value in table.items():
+        out.setdefault(value, []).append(word)
+    return out
+
+
+_UNITS = _words_by_value(hebrew_units)
+_TENS = _words_by_value(hebrew_tens)
+_HUNDREDS = _words_by_value(hebrew_hundreds)
+_SCALES = sorted(_words_by_value(scales).items(), reverse=True)  # [(1e12, [...]), ..., (1000, [...])]
+_FRACTIONS = {w: Fraction(*v.as_integer_ratio()) for w, v in fractions_map.items()}
+_UNKNOWN = ("שלום", "בננה", "כמה", "ועוד", "x1")
+
+
+def shapes():
+    """Every (scale values, amount forms, suffix) combination: each subset of the
+       scales, each spelling of the amount before every scale and of the remainder
+       (None: no remainder), and each suffix."""
+    values = [v for v, _ in _SCALES]
+    for k in range(len(values) + 1):
+        for used in itertools.combinations(values, k):
+            rest_forms = (None, *AMOUNT_FORMS) if used else AMOUNT_FORMS
+            for forms in itertools.product(AMOUNT_FORMS, repeat=k):
+                for rest in rest_forms:
+                    for suffix in SUFFIXES:
+                        yield used, forms, rest, suffix
+
+
+def random_shape(rng):
+    """A random shape: each subset of scales and each suffix is equally likely."""
+    used = tuple(v for v, _ in _SCALES if rng.random() < 0.5)
+    forms = tuple(rng.choice(AMOUNT_FORMS) for _ in used)
+    rest = rng.choice((None, *AMOUNT_FORMS) if used else AMOUNT_FORMS)
+    return used, forms, rest, rng.choice(SUFFIXES)
+
+
+def _vav(word, rng):
+    return "ו" + word if rng.random() < 0.5 else word
+
+
+def _amount(form, rng):
+    """(words, value) of an amount from 1 to 999 spelled as `form`."""
+    if form == "digits":
+        n = rng.randint(1, 999)
+        return [str(n)], n
+    if form == "unit":
+        n = rng.randint(1, 9)
+        return [rng.choice(_UNITS[n])], n
+    if form == "teen":
+        n = rng.randint(1, 9)
+        return [rng.choice(_UNITS[n]), rng.choice(_TENS[10])], 10 + n
+    words, value = [], 0
+    if form.startswith("hundred"):
+        value = rng.choice(list(_HUNDREDS))
+        words.append(rng.choice(_HUNDREDS[value]))
+    if "ten" in form:
+        ten = rng.randrange(10, 100, 10)
+        words.append(rng.choice(_TENS[ten]))
+        value += ten
+    if form.endswith("unit"):
+        n = rng.randint(1, 9)
+        words.append(_vav(rng.choice(_UNITS[n]), rng))
+        value += n
+    return words, value
+
+
+def _scale_words(value, amount_words, amount, rng):
+    """Words of `amount` × the scale `value` ('שלושת אלפים', 'אלפיים', 'מיליון')."""
+    words = dict(_SCALES)[value]
+    if value == 1000:
+        if amount == 2 and rng.random() < 0.3:
+            return ["אלפיים"]
+        # 'אלפים' after units only: a ten before 'שניים אלפים' is rejected ('חמישים אלפיים')
+        words = words if len(amount_words) == 1 and amount <= 10 else [w for w in words if w != "אלפים"]
+    if amount == 1 and rng.random() < 0.5:
+        return [rng.choice(words)]
+    return amount_words + [rng.choice(words)]
+
+
+def _tail(kind, rng):
+    """(words, value) of a 'נקודה' tail: digit words, or an integer read as digits."""
+    if kind == "tail_digits":
+        digits = [rng.randint(0, 9) for _ in range(rng.randint(1, 4))]
+        return ["נקודה"] + [rng.choice(_UNITS[d]) for d in digits], Fraction("0." + "".join(map(str, digits)))
+    words, value = _amount(rng.choice(("hundred", "hundred_ten_unit", "ten_unit")), rng)
+    return ["נקודה"] + words, Fraction(f"0.{value}")
+
+
+def valid_phrase(shape, rng):
+    """(text, exact value) of a random phrase of the given shape."""
+    used, forms, rest, suffix = shape
+    words, total = [], Fraction(0)
+    fraction_group = rng.randrange(len(used)) if suffix == "fraction_in_group" and used else None
+    frac_word = rng.choice(list(_FRACTIONS))
+    for k, (value, form) in enumerate(zip(used, forms)):
+        amount_words, amount = _amount(form, rng)
+        if k == fraction_group:
+            # 'שלוש וחצי מיליון': the fraction belongs to the amount
+            amount_words = amount_words + ["ו" + frac_word]
+            words += amount_words + [rng.choice(dict(_SCALES)[value])]
+            total += (amount + _FRACTIONS[frac_word]) * value
+            continue
+        words += _scale_words(value, amount_words, amount, rng)
+        total += amount * value
+    if rest is not None:
+        amount_words, amount = _amount(rest, rng)
+        if used and len(amount_words) == 1 and rng.random() < 0.5 and not amount_words[0].startswith("ו"):
+            amount_words = ["ו" + amount_words[0]]  # 'מיליון ומאה'
+        words += amount_words
+        total += amount
+    if suffix == "fraction" or (suffix == "fraction_in_group" and not used):
+        frac = _FRACTIONS[frac_word]
+        if rest is None:
+            # right after a scale, 'ו' + fraction multiplies it ('מיליון וחצי')
+            words += rng.choice((["ו" + frac_word], ["ו", frac_word]))
+            total += frac * used[-1]
+        else:
+            words += rng.choice((["ו" + frac_word], [frac_word]))
+            total += frac
+    elif suffix.startswith("tail"):
+        tail_words, tail_value = _tail(suffix, rng)
+        words += tail_words
+        total += tail_value
+    return " ".join(words), total
+
+
+def invalid_phrase(error, rng):
+    """A phrase the parser rejects with the error category `error`, made by
+       mutating a random valid phrase without suffix."""
+    used, forms, rest, _ = random_shape(rng)
+    text, _ = valid_phrase((used, forms, rest, "none"), rng)
+    if error == "two_tens":
+        ten, other = rng.sample(range(10, 100, 10), 2)
+        extra = [rng.choice(_TENS[ten]), _vav(rng.choice(_TENS[other]), rng)]
+    elif error == "tens_alpayim":
+        # after a scale or alone, so the ten is the first of its segment
+        text = valid_phrase((used, forms, None, "none"), rng)[0] if used else ""
+        extra = [rng.choice(_TENS[rng.randrange(20, 100, 10)]), "אלפיים"]
+    elif error == "decimal_tail":
+        extra = ["נקודה"] + rng.choice(([], ["מיליון"], ["חצי"], ["נקודה"]))
+    elif error == "repeated_fraction":
+        first, second = rng.choice(list(_FRACTIONS)), rng.choice(list(_FRACTIONS))
+        extra = ["ו" + first, "ו" + second]
+    elif error == "scale_order":
+        # 'אלפים' is left out: after 'עשרים ושניים' it is a tens_alpayim error
+        words = [w for w in dict(_SCALES)[used[-1] if used else 1000] if w != "אלפים"]
+        extra = [rng.choice(words), rng.choice(words)]
+    elif error == "two_units":
+        extra = [rng.choice(_UNITS[rng.randint(1, 9)]), _vav(rng.choice(_UNITS[rng.randint(1, 9)]), rng)]
+    elif error == "repeated_point":
+        extra = ["נקודה", rng.choice(_UNITS[rng.randint(0, 9)]), "נקודה", rng.choice(_UNITS[rng.randint(0, 9)])]
+    elif error == "ordinal":
+        extra = [_vav(rng.choice(list(ordinals_map)), rng)]
+    elif error == "unknown_word":
+        words = text.split()
+        words.insert(rng.randint(0, len(words)), rng.choice(_UNKNOWN))
+        return " ".join(words)
+    else:
+        raise ValueError(f"unknown error category: {error!r}")
+    return " ".join([text, *extra]).strip()
+
+
+def phrases(count: int, seed: int = 0, invalid_share: float = 0.2):
+    """`count` phrases: valid ones of random shapes and, with probability
+       invalid_share, a mutation for a random error category."""
+    rng = random.Random(seed)
+    for _ in range(count):
+        if rng.random() < invalid_share:
+            yield invalid_phrase(rng.choice(MUTATIONS), rng)
+        else:
+            yield valid_phrase(random_shape(rng), rng)[0]
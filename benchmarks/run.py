@@ -0,0 +1,266 @@
+"""Benchmark suite for the parser, the formatter and the HTTP API.
+
+    python benchmarks/run.py -o bench.json                       # run and save
+    python benchmarks/run.py --compare bench.json --threshold 0.2  # fail on >20% regressions
+
+Timings are the best per-call time (microseconds) over --repeat runs. Phrases
+come from JavaScriptParser/test_cases.json plus generated phrases of growing
+length. HTTP benchmarks run through the ASGI test client and are skipped when
+fastapi/httpx are not installed; the column benchmarks compare parse_array with
+a pandas `.apply(hebrew_to_number)` baseline and need numpy and pandas; the
+startup benchmarks time cold imports with `python -X importtime`. The
+adversarial benchmarks time hostile inputs (megabyte texts, thousands of words
+or digits) under the limits the web apps enable and, as `/unlimited`, with them
+off; `adversarial/worst` is the slowest limited one. Compare runs on the same
+machine only.
+"""
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+from decimal import Decimal
+
+from bench_parser import load_phrases, per_call_us
+from importtime import import_time_us
+
+from hebrew_number.compound import parse_compound
+from hebrew_number.limits import DEFAULTS, enable_limits, reset_limits, set_limits
+from hebrew_number.parser import _tokenize, _parse_decimal_phrase, hebrew_to_number, parse
+from hebrew_number.hebrew_format import number_to_hebrew
+
+
+def generated_phrases(digits: int, count: int = 50, seed: int = 7):
+    """Phrases for random integers with `digits` digits, spelled by number_to_hebrew."""
+    rng = random.Random(seed + digits)
+    return [number_to_hebrew(rng.randrange(10 ** (digits - 1), 10 ** digits)) for _ in range(count)]
+
+
+def decimal_tails(length: int, count: int = 50, seed: int = 11):
+    """Token lists for a 'נקודה' tail of `length` spoken digits."""
+    rng = random.Random(seed + length)
+    return [_tokenize(" ".join(number_to_hebrew(rng.randrange(10)) for _ in range(length))) for _ in range(count)]
+
+
+def misspelled_phrases(count: int = 50, seed: int = 13):
+    """generated_phrases(6) with one letter dropped from a long word of each phrase."""
+    rng = random.Random(seed)
+    phrases = []
+    for phrase in generated_phrases(6, count):
+        words = phrase.split()
+        i = max(range(len(words)), key=lambda k: len(words[k]))
+        j = rng.randrange(1, len(words[i]))
+        words[i] = words[i][:j] + words[i][j + 1:]
+        phrases.append(" ".join(words))
+    return phrases
+
+
+def compound_phrases(count: int = 50, seed: int = 17):
+    """Ranges and lists of corpus phrases ('X עד Y', 'X, Y ו‑Z')."""
+    rng = random.Random(seed)
+    corpus = load_phrases()
+    phrases = []
+    for k in range(count):
+        a, b, c = rng.sample(corpus, 3)
+        phrases.append(f"{a} עד {b}" if k % 2 else f"{a}, {b} או {c}")
+    return phrases
+
+
+def parser_benchmarks(repeat):
+    corpus = load_phrases()
+    results = {
+        "tokenize/corpus": per_call_us(_tokenize, corpus, repeat),
+        "hebrew_to_number/corpus": per_call_us(hebrew_to_number, corpus, repeat),
+        "hebrew_to_number/corpus/decimal": per_call_us(lambda p: hebrew_to_number(p, mode="decimal"), corpus, repeat),
+        "hebrew_to_number/corpus/dfa": per_call_us(lambda p: hebrew_to_number(p, backend="dfa"), corpus, repeat),
+        "hebrew_to_number/corpus/fuzzy": per_call_us(lambda p: hebrew_to_number(p, fuzzy=1), corpus, repeat),
+        "hebrew_to_number/misspelled/fuzzy": per_call_us(
+            _fuzzy_or_none, misspelled_phrases(), repeat),
+        "parse/corpus": per_call_us(parse, corpus, repeat),
+        "hebrew_to_number/invalid": per_call_us(_number_or_none, load_phrases("invalid"), repeat),
+        "parse/invalid": per_call_us(parse, load_phrases("invalid"), repeat),
+        "parse_compound/ranges": per_call_us(parse_compound, compound_phrases(), repeat),
+    }
+    for digits in (1, 3, 6, 9, 12, 15):
+        results[f"hebrew_to_number/digits-{digits}"] = per_call_us(hebrew_to_number, generated_phrases(digits), repeat)
+    results["hebrew_to_number/digits-15/dfa"] = per_call_us(
+        lambda p: hebrew_to_number(p, backend="dfa"), generated_phrases(15), repeat)
+    for length in (1, 8, 32):
+        results[f"parse_decimal_phrase/digits-{length}"] = per_call_us(_parse_decimal_phrase, decimal_tails(length), repeat)
+        tails = [f"אפס נקודה {' '.join(t[0] for t in toks)}" for toks in decimal_tails(length)]
+        results[f"hebrew_to_number/decimal-tail-{length}"] = per_call_us(hebrew_to_number, tails, repeat)
+    return results
+
+
+def _number_or_none(text):
+    try:
+        return hebrew_to_number(text)
+    except ValueError:
+        return None
+
+
+def _fuzzy_or_none(text):
+    try:
+        return hebrew_to_number(text, fuzzy=1)
+    except ValueError:
+        return None
+
+
+def formatter_benchmarks(repeat):
+    rng = random.Random(3)
+    ints = [rng.randrange(10 ** rng.randint(1, 15)) for _ in range(100)]
+    decimals = [Decimal(rng.randrange(10 ** 9)) / 10 ** rng.randint(1, 6) for _ in range(100)]
+    return {
+        "number_to_hebrew/ints": per_call_us(number_to_hebrew, ints, repeat),
+        "number_to_hebrew/decimals": per_call_us(number_to_hebrew, decimals, repeat),
+    }
+
+
+def http_benchmarks(repeat):
+    try:
+        from fastapi.testclient import TestClient
+    except ImportError as e:
+        print(f"skipping HTTP benchmarks: {e}", file=sys.stderr)
+        return {}
+    import hebrew_number.main
+    import hebrew_number.fast
+    corpus = load_phrases()[:20]
+    results = {}
+    for name, asgi_app in (("main", hebrew_number.main.app), ("fast", hebrew_number.fast.app)):
+        with TestClient(asgi_app) as client:
+            results[f"http/{name}/get"] = per_call_us(
+                lambda p: client.get("/hebrew-number", params={"text": p}), corpus, max(1, repeat // 20))
+            tags = {p: client.get("/hebrew-number", params={"text": p}).headers["etag"] for p in corpus}
+            results[f"http/{name}/get-304"] = per_call_us(
+                lambda p: client.get("/hebrew-number", params={"text": p}, headers={"If-None-Match": tags[p]}),
+                corpus, max(1, repeat // 20))
+            results[f"http/{name}/post"] = per_call_us(
+                lambda p: client.post("/hebrew-number", json={"text": p}), corpus, max(1, repeat // 20))
+            results[f"http/{name}/batch"] = per_call_us(
+                lambda _: client.post("/hebrew-number/batch", json={"texts": corpus}), [None], max(1, repeat // 20))
+    return results
+
+
+def column_benchmarks(repeat):
+    try:
+        import pandas as pd
+        from hebrew_number.vectorized import parse_array
+    except ImportError as e:
+        print(f"skipping column benchmarks: {e}", file=sys.stderr)
+        return {}
+    # 100k rows drawn from 1k distinct phrases, a typical analyst column
+    rng = random.Random(5)
+    distinct = load_phrases() + generated_phrases(6, count=1000 - len(load_phrases()))
+    column = pd.Series([rng.choice(distinct) for _ in range(100_000)])
+
+    def coerce(text):
+        try:
+            return hebrew_to_number(text)
+        except ValueError:
+            return float("nan")
+
+    runs = max(1, repeat // 20)
+    return {
+        "column/apply": per_call_us(lambda s: s.apply(coerce), [column], runs) / len(column),
+        "column/parse_array": per_call_us(lambda s: parse_array(s.to_numpy()), [column], runs) / len(column),
+    }
+
+
+# each under the default max_chars but for junk-1mb, so every limit is exercised
+ADVERSARIAL = {
+    "junk-1mb": ("שלום " * 200_000, "float"),
+    "words-250": ("מאה " * 250, "float"),
+    "digit-string-999/fraction": ("1" * 999, "fraction"),
+    "decimal-tail-891-digits": ("אפס נקודה " + " ".join(["9" * 99] * 9), "decimal"),
+    "decimal-tail-integer": ("אפס נקודה מאה " + " ".join(["9" * 98] * 9), "fraction"),
+}
+
+
+def adversarial_benchmarks(repeat):
+    """parse() of hostile inputs with the server limits (enable_limits) and with none."""
+    results = {}
+    try:
+        for limited in (True, False):
+            if limited:
+                enable_limits()
+            else:
+                set_limits(**dict.fromkeys(DEFAULTS))
+            for name, (text, mode) in ADVERSARIAL.items():
+                runs = repeat if limited else max(1, repeat // 50)
+                key = f"adversarial/{name}" + ("" if limited else "/unlimited")
+                results[key] = per_call_us(lambda t: parse(t, mode), [text], runs)
+    finally:
+        reset_limits()
+    results["adversarial/worst"] = max(results[f"adversarial/{name}"] for name in ADVERSARIAL)
+    return results
+
+
+def startup_benchmarks(repeat):
+    """Cold import time (us) of the library entry points, one fresh interpreter per run."""
+    runs = max(3, repeat // 20)
+    return {f"import/{m}": import_time_us(m, runs) for m in ("hebrew_number.parser", "hebrew_number.hebrew_format", "hebrew_number.cli")}
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> list:
+    """Print a comparison table; return the names that regressed beyond threshold."""
+    regressions = []
+    print(f"{'benchmark':<42}{'baseline':>10}{'current':>10}{'change':>9}")
+    for name, now in current.items():
+        before = baseline.get(name)
+        if before is None:
+            print(f"{name:<42}{'-':>10}{now:10.2f}{'new':>9}")
+            continue
+        change = now / before - 1
+        flag = "  REGRESSION" if change > threshold else ""
+        print(f"{name:<42}{before:10.2f}{now:10.2f}{change:+9.1%}{flag}")
+        if flag:
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("-o", "--output", help="write results to this JSON file")
+    ap.add_argument("--compare", metavar="BASELINE", help="JSON file from a previous run")
+    ap.add_argument("--threshold", type=float, default=0.25, help="allowed slowdown ratio (default: 0.25)")
+    ap.add_argument("--repeat", type=int, default=100)
+    ap.add_argument("--only", choices=("parser", "formatter", "http", "column", "startup", "adversarial"),
+                    action="append")
+    args = ap.parse_args()
+
+    groups = {"parser": parser_benchmarks, "formatter": formatter_benchmarks, "http": http_benchmarks,
+              "column": column_benchmarks, "startup": startup_benchmarks, "adversarial": adversarial_benchmarks}
+    results = {}
+    for name, run in groups.items():
+        if not args.only or name in args.only:
+            results.update(run(args.repeat))
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "unit": "us/call",
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} benchmark(s) regressed by more than {args.threshold:.0%}", file=sys.stderr)
+            sys.exit(1)
+    else:
+        for name, us in results.items():
+            print(f"{name:<42}{us:10.2f} us/call")
+
+
+if __name__ == "__main__":
+    main()
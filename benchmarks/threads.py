@@ -0,0 +1,55 @@
+"""Thread scaling of batch conversion in both directions.
+
+    python benchmarks/threads.py [--phrases N] [--workers 1 2 4 8]
+
+Runs hebrew_to_numbers(..., workers=N) and number_to_hebrew on a thread pool
+and prints throughput per worker count. Under the GIL expect no speed-up; on a
+free-threaded build (python3.13t / 3.14t, started with PYTHON_GIL=0) expect
+throughput to grow with the number of cores.
+"""
+import argparse
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from hebrew_number.hebrew_format import number_to_hebrew  # noqa: E402
+from hebrew_number.parser import hebrew_to_numbers  # noqa: E402
+
+
+def gil_enabled() -> bool:
+    check = getattr(sys, "_is_gil_enabled", None)
+    return True if check is None else check()
+
+
+def timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--phrases", type=int, default=50_000)
+    ap.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = ap.parse_args()
+
+    rng = random.Random(16)
+    numbers = [rng.randrange(10 ** rng.randint(1, 15)) for _ in range(args.phrases)]
+    phrases = [number_to_hebrew(n) for n in numbers]
+    chunks = [numbers[i:i + 1000] for i in range(0, len(numbers), 1000)]
+
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil_enabled() else 'disabled'}, {args.phrases} phrases")
+    print(f"{'workers':>7}{'to number/s':>14}{'to hebrew/s':>14}")
+    for workers in args.workers:
+        parse = timed(lambda: hebrew_to_numbers(phrases, workers=workers))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            fmt = timed(lambda: list(pool.map(lambda c: [number_to_hebrew(n) for n in c], chunks)))
+        print(f"{workers:>7}{args.phrases / parse:>14,.0f}{args.phrases / fmt:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Hebrew number phrases to numbers and back.
+
+    from hebrew_number import hebrew_to_number, number_to_hebrew
+
+Names are resolved on first access, so `import hebrew_number` loads nothing else; the
+web apps (hebrew_number.main, hebrew_number.fast) and the numpy/pandas helpers (hebrew_number.vectorized)
+are only imported when used.
+"""
+import importlib
+
+_EXPORTS = {
+    "hebrew_to_number": "hebrew_number.parser",
+    "hebrew_to_numbers": "hebrew_number.parser",
+    "parse": "hebrew_number.parser",
+    "ParseResult": "hebrew_number.parser",
+    "normalize_text": "hebrew_number.parser",
+    "number_to_hebrew": "hebrew_number.hebrew_format",
+    "iter_numbers": "hebrew_number.extract",
+    "parse_compound": "hebrew_number.compound",
+    "Compound": "hebrew_number.compound",
+    "IncrementalParser": "hebrew_number.incremental",
+    "parse_array": "hebrew_number.vectorized",
+    "enable_cache": "hebrew_number.cache",
+    "disable_cache": "hebrew_number.cache",
+    "cache_stats": "hebrew_number.cache",
+    "enable_metrics": "hebrew_number.metrics",
+    "disable_metrics": "hebrew_number.metrics",
+    "render_metrics": "hebrew_number.metrics",
+    "set_limits": "hebrew_number.limits",
+    "enable_limits": "hebrew_number.limits",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module 'hebrew_number' has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
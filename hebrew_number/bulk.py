@@ -0,0 +1,211 @@
+"""Bulk conversion of large files with one phrase per line.
+
+    python -m hebrew_number.bulk phrases.txt out --workers 8         # out.f8 + out.err
+    python -m hebrew_number.bulk phrases.txt out --dtype int64       # out.i8 + out.err
+    python -m hebrew_number.bulk phrases.txt out.txt --format text   # like hebrew_number.cli
+
+The input is memory-mapped and cut into line-aligned shards that worker
+processes convert independently; every worker maps the file itself, so no
+input crosses process boundaries. Binary output is two flat arrays with one
+element per input line: the values (native-endian float64 with NaN on errors,
+or int64 with 0 on errors) and uint8 error codes (0 = ok, see ERROR_CODES).
+Their size is known once the shards' lines are counted, so both files are
+preallocated and mapped by every worker, which writes its results in place. Text output is
+written per shard and concatenated. Memory use is bounded by the block size,
+not the file size.
+
+    values, errors = load_results("out")   # numpy.memmap views, needs numpy
+"""
+import argparse
+import math
+import mmap
+import os
+import shutil
+
+from hebrew_number.metrics import error_category
+from hebrew_number.parser import hebrew_to_number
+
+# error code of a line is its index here. .err files outlive the build that wrote
+# them, so this table is append-only: never reorder it or reuse a code, and add
+# each new parser.ERROR_CATEGORIES category at the end.
+ERROR_CODES = (
+    "ok", "two_tens", "tens_alpayim", "decimal_tail", "repeated_fraction", "scale_order", "unknown_word",
+    "inexact_decimal", "other", "not_integer", "text_too_long", "too_many_words", "too_many_digits",
+    "two_units", "repeated_point", "ordinal",
+)
+_CODE = {name: code for code, name in enumerate(ERROR_CODES)}
+_DTYPES = {"float64": ("f8", "d"), "int64": ("i8", "q")}  # numpy suffix, struct format
+BLOCK_SIZE = 1 << 20  # bytes decoded at a time
+_MIN_SHARD = 4 * BLOCK_SIZE
+
+
+def output_paths(dst: str, dtype: str = "float64"):
+    """(values path, error codes path) of a binary conversion written to dst."""
+    return f"{dst}.{_DTYPES[dtype][0]}", f"{dst}.err"
+
+
+def _shards(mm, parts: int):
+    """Split the mapped file into up to `parts` (start, end) ranges ending after a newline."""
+    size = len(mm)
+    step = max(_MIN_SHARD, math.ceil(size / max(parts, 1)))
+    bounds = [0]
+    while bounds[-1] < size:
+        cut = bounds[-1] + step
+        if cut >= size:
+            bounds.append(size)
+            break
+        nl = mm.find(b"\n", cut - 1)
+        bounds.append(size if nl < 0 else nl + 1)
+    return list(zip(bounds, bounds[1:]))
+
+
+def _count_lines(path: str, start: int, end: int) -> int:
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        lines = 0
+        for pos in range(start, end, BLOCK_SIZE):
+            lines += mm[pos:min(pos + BLOCK_SIZE, end)].count(b"\n")
+        if end == len(mm) and end > start and mm[end - 1:end] != b"\n":
+            lines += 1  # last line without a newline
+        return lines
+
+
+def _iter_lines(mm, start: int, end: int):
+    """Decoded lines of mm[start:end], BLOCK_SIZE bytes at a time. Only '\n'
+       ends a line (a trailing '\r' is dropped), matching _count_lines."""
+    pos = start
+    while pos < end:
+        stop = min(pos + BLOCK_SIZE, end)
+        if stop < end:
+            nl = mm.rfind(b"\n", pos, stop)
+            if nl < 0:  # a line longer than the block
+                nl = mm.find(b"\n", stop, end)
+            stop = nl + 1 if nl >= 0 else end
+        lines = mm[pos:stop].decode("utf-8", errors="replace").split("\n")
+        if lines[-1] == "":
+            lines.pop()
+        for line in lines:
+            yield line[:-1] if line.endswith("\r") else line
+        pos = stop
+
+
+def _convert(text: str, mode: str, fuzzy: int):
+    """(value, error message, error code) of one line."""
+    try:
+        return hebrew_to_number(text, mode, fuzzy=fuzzy), None, 0
+    except ValueError as e:
+        return None, str(e), _CODE[error_category(str(e))]
+
+
+def _convert_binary(src: str, dst: str, dtype: str, start: int, end: int, first_line: int, fuzzy: int):
+    values_path, errors_path = output_paths(dst, dtype)
+    fmt = _DTYPES[dtype][1]
+    integer = dtype == "int64"
+    mode, missing = ("fraction", 0) if integer else ("float", math.nan)  # int64 values stay exact
+    with open(src, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+            open(values_path, "r+b") as vf, mmap.mmap(vf.fileno(), 0) as vm, \
+            open(errors_path, "r+b") as ef, mmap.mmap(ef.fileno(), 0) as em:
+        values, errors = memoryview(vm).cast(fmt), memoryview(em)
+        i = first_line
+        try:
+            for line in _iter_lines(mm, start, end):
+                value, _, code = _convert(line, mode, fuzzy)
+                if integer and code == 0:
+                    if value.denominator == 1 and -2 ** 63 <= value < 2 ** 63:
+                        value = int(value)
+                    else:
+                        code = _CODE["not_integer"]
+                values[i] = value if code == 0 else missing
+                errors[i] = code
+                i += 1
+        finally:
+            values.release()
+            errors.release()
+    return i - first_line
+
+
+def _convert_text(src: str, part: str, start: int, end: int, fuzzy: int):
+    with open(src, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+            open(part, "w", encoding="utf-8", newline="") as out:
+        lines = 0
+        for line in _iter_lines(mm, start, end):
+            value, message, _ = _convert(line, "float", fuzzy)
+            out.write(f"{value}\n" if message is None else f"ERROR\t{message}\n")
+            lines += 1
+    return lines
+
+
+def convert_file(src: str, dst: str, format: str = "binary", dtype: str = "float64",
+                 workers: int = 1, fuzzy: int = 0) -> int:
+    """Convert every line of the UTF-8 file src; returns the number of lines.
+       format="binary" writes the arrays named by output_paths(dst, dtype);
+       format="text" writes one result per line to dst, as hebrew_number.cli does."""
+    if format not in ("binary", "text"):
+        raise ValueError(f"unknown format: {format!r}")
+    if dtype not in _DTYPES:
+        raise ValueError(f"unknown dtype: {dtype!r}")
+    if os.path.getsize(src) == 0:  # mmap cannot map an empty file
+        if format == "text":
+            open(dst, "wb").close()
+        else:
+            for path in output_paths(dst, dtype):
+                open(path, "wb").close()
+        return 0
+    with open(src, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        shards = _shards(mm, 4 * workers)
+    starts, ends = zip(*shards)
+    n = len(shards)
+    pool = None
+    if workers > 1 and n > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        pool = ProcessPoolExecutor(max_workers=workers)
+    run = pool.map if pool else map
+    try:
+        if format == "text":
+            parts = [f"{dst}.part{k}" for k in range(n)]
+            total = sum(run(_convert_text, [src] * n, parts, starts, ends, [fuzzy] * n))
+            with open(dst, "wb") as out:
+                for part in parts:
+                    with open(part, "rb") as f:
+                        shutil.copyfileobj(f, out)
+                    os.remove(part)
+            return total
+        counts = list(run(_count_lines, [src] * n, starts, ends))
+        total = sum(counts)
+        values_path, errors_path = output_paths(dst, dtype)
+        for path, itemsize in ((values_path, 8), (errors_path, 1)):
+            with open(path, "wb") as f:
+                f.truncate(total * itemsize)
+        firsts = [sum(counts[:k]) for k in range(n)]
+        list(run(_convert_binary, [src] * n, [dst] * n, [dtype] * n, starts, ends, firsts, [fuzzy] * n))
+        return total
+    finally:
+        if pool:
+            pool.shutdown()
+
+
+def load_results(dst: str, dtype: str = "float64"):
+    """(values, error codes) of a binary conversion as read-only numpy.memmap arrays."""
+    import numpy as np
+    values_path, errors_path = output_paths(dst, dtype)
+    if os.path.getsize(errors_path) == 0:  # numpy.memmap cannot map an empty file
+        return np.zeros(0, dtype=_DTYPES[dtype][0]), np.zeros(0, dtype=np.uint8)
+    return (np.memmap(values_path, dtype=_DTYPES[dtype][0], mode="r"),
+            np.memmap(errors_path, dtype=np.uint8, mode="r"))
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("input", help="UTF-8 file with one phrase per line")
+    ap.add_argument("output", help="output path (binary: prefix of the .f8/.i8 and .err files)")
+    ap.add_argument("--format", choices=("binary", "text"), default="binary")
+    ap.add_argument("--dtype", choices=tuple(_DTYPES), default="float64")
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="worker processes (default: all CPUs)")
+    ap.add_argument("--fuzzy", type=int, default=0, metavar="N",
+                    help="correct misspelled number words within N edits (default: 0, off)")
+    args = ap.parse_args(argv)
+    lines = convert_file(args.input, args.output, args.format, args.dtype, args.workers, args.fuzzy)
+    print(f"{lines} lines")
+
+
+if __name__ == "__main__":
+    main()
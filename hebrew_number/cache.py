@@ -0,0 +1,103 @@
+"""Opt-in bounded LRU cache for the conversion functions.
+
+Disabled by default; call enable_cache() to turn it on. Keys are computed from
+the normalized input, and parse errors are cached alongside successful results.
+"""
+import functools
+import threading
+from collections import OrderedDict
+
+
+class LRUCache:
+    def __init__(self, maxsize: int):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return (found, entry) and mark the entry as recently used."""
+        with self._lock:
+            try:
+                entry = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return False, None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return True, entry
+
+    def put(self, key, entry):
+        with self._lock:
+            self._data[key] = entry
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+            }
+
+
+_cache = None
+
+
+def enable_cache(maxsize: int = 4096) -> LRUCache:
+    """Turn on result caching (replacing any existing cache) and return it."""
+    global _cache
+    _cache = LRUCache(maxsize)
+    return _cache
+
+
+def disable_cache():
+    global _cache
+    _cache = None
+
+
+def cache_stats() -> dict:
+    if _cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **_cache.stats()}
+
+
+def cached(namespace: str, key=None):
+    """Decorator routing calls through the shared cache when it is enabled.
+       `key` maps the first argument to its cache key (e.g. text normalization);
+       a call that passes it by keyword goes straight to the function."""
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            cache = _cache
+            if cache is None or not args:
+                return fn(*args, **kwargs)
+            arg = args[0]
+            k = (namespace, key(arg) if key else arg, args[1:], tuple(sorted(kwargs.items())))
+            found, entry = cache.get(k)
+            if not found:
+                try:
+                    entry = (True, fn(*args, **kwargs))
+                except ValueError as e:
+                    entry = (False, e)
+                cache.put(k, entry)
+            ok, result = entry
+            if ok:
+                return result
+            raise type(result)(*result.args)
+        return wrapper
+    return decorator
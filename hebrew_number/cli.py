@@ -0,0 +1,150 @@
+"""Bulk conversion from the command line.
+
+    python -m hebrew_number.cli phrases.txt > numbers.txt
+    python -m hebrew_number.cli --format jsonl --workers 8 < in.jsonl > out.jsonl
+    python -m hebrew_number.cli --format csv --column amount --to-hebrew in.csv -o out.csv
+
+Input lines are converted in chunks; with --workers > 1 the chunks run on a
+process pool while results are written in input order as they complete.
+"""
+import argparse
+import csv
+import json
+import sys
+from collections import deque
+from itertools import islice
+
+from hebrew_number.parser import hebrew_to_number
+from hebrew_number.hebrew_format import number_to_hebrew
+
+
+def _to_number(value: str):
+    """int, or an exact Decimal for a fraction: float() would round long numbers."""
+    try:
+        return int(value)
+    except ValueError:
+        from decimal import Decimal, InvalidOperation
+        try:
+            return Decimal(value)
+        except InvalidOperation:
+            raise ValueError(f"לא ניתן להמיר: {value}") from None
+
+
+def _convert_one(value: str, to_hebrew: bool, fuzzy: int = 0):
+    """Return (result, error) for a single input value."""
+    if isinstance(value, ValueError):
+        return None, str(value)
+    try:
+        if to_hebrew:
+            return number_to_hebrew(_to_number(value)), None
+        return hebrew_to_number(value, fuzzy=fuzzy), None
+    except ValueError as e:
+        return None, str(e)
+
+
+def convert_chunk(values, to_hebrew: bool = False, fuzzy: int = 0):
+    return [_convert_one(v, to_hebrew, fuzzy) for v in values]
+
+
+def _read_records(stream, fmt: str, column: str):
+    """Yield (record, value) pairs; record is what gets echoed back on output.
+       A record that cannot be read has a ValueError for its value, reported
+       as that record's error."""
+    if fmt == "csv":
+        for row in csv.DictReader(stream):
+            value = row.get(column)
+            yield row, (ValueError(f"missing column {column!r}") if value is None else value)
+    elif fmt == "jsonl":
+        for number, line in enumerate(stream, 1):
+            if not line.strip():
+                continue
+            try:
+                obj = json.loads(line)
+            except ValueError as e:
+                yield {"line": number}, ValueError(f"invalid JSON: {e}")
+                continue
+            if not isinstance(obj, dict):
+                yield {"line": number}, ValueError("not a JSON object")
+            elif column not in obj:
+                yield obj, ValueError(f"missing field {column!r}")
+            else:
+                yield obj, str(obj[column])
+    else:
+        for line in stream:
+            line = line.rstrip("\n")
+            yield line, line
+
+
+def _chunks(iterable, size: int):
+    it = iter(iterable)
+    while chunk := list(islice(it, size)):
+        yield chunk
+
+
+def iter_converted(records, to_hebrew=False, workers=1, chunk_size=1000, fuzzy=0):
+    """Yield (record, result, error) in input order.
+       At most 2 * workers chunks are in flight, so memory stays bounded."""
+    if workers <= 1:
+        for chunk in _chunks(records, chunk_size):
+            yield from ((rec, *res) for rec, res in zip(chunk, convert_chunk([v for _, v in chunk], to_hebrew, fuzzy)))
+        return
+    from concurrent.futures import ProcessPoolExecutor  # pulls in multiprocessing; only for --workers > 1
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for chunk in _chunks(records, chunk_size):
+            pending.append((chunk, pool.submit(convert_chunk, [v for _, v in chunk], to_hebrew, fuzzy)))
+            if len(pending) >= 2 * workers:
+                chunk, fut = pending.popleft()
+                yield from ((rec, *res) for rec, res in zip(chunk, fut.result()))
+        while pending:
+            chunk, fut = pending.popleft()
+            yield from ((rec, *res) for rec, res in zip(chunk, fut.result()))
+
+
+def _write_results(results, out, fmt: str, to_hebrew: bool):
+    key = "hebrew" if to_hebrew else "number"
+    if fmt == "csv":
+        writer = None
+        for (record, _), result, error in results:
+            row = {**record, key: "" if result is None else result, "error": error or ""}
+            if writer is None:
+                writer = csv.DictWriter(out, fieldnames=list(row), extrasaction="ignore")
+                writer.writeheader()
+            writer.writerow(row)
+    elif fmt == "jsonl":
+        for (record, _), result, error in results:
+            row = {**record, **({"error": error} if error is not None else {key: result})}
+            out.write(json.dumps(row, ensure_ascii=False) + "\n")
+    else:
+        for _, result, error in results:
+            out.write(f"{result}\n" if error is None else f"ERROR\t{error}\n")
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(prog="python -m hebrew_number.cli", description="Convert Hebrew number phrases in bulk.")
+    ap.add_argument("input", nargs="?", help="input file (default: stdin)")
+    ap.add_argument("-o", "--output", help="output file (default: stdout)")
+    ap.add_argument("--format", choices=("text", "jsonl", "csv"), default="text")
+    ap.add_argument("--column", default="text", help="field holding the value, for jsonl/csv (default: text)")
+    ap.add_argument("--to-hebrew", action="store_true", help="convert numbers to Hebrew words instead")
+    ap.add_argument("--fuzzy", type=int, default=0, metavar="N",
+                    help="correct misspelled number words within N edits (default: 0, off)")
+    ap.add_argument("--workers", type=int, default=1, help="worker processes (default: 1)")
+    ap.add_argument("--chunk-size", type=int, default=1000, help="lines per dispatched chunk (default: 1000)")
+    args = ap.parse_args(argv)
+
+    src = open(args.input, encoding="utf-8", newline="") if args.input else sys.stdin
+    dst = open(args.output, "w", encoding="utf-8", newline="") if args.output else sys.stdout
+    try:
+        records = _read_records(src, args.format, args.column)
+        results = iter_converted(records, args.to_hebrew, args.workers, args.chunk_size, args.fuzzy)
+        _write_results(results, dst, args.format, args.to_hebrew)
+    finally:
+        if args.input:
+            src.close()
+        if args.output:
+            dst.close()
+
+
+if __name__ == "__main__":
+    main()
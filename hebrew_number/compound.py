@@ -0,0 +1,193 @@
+"""Ranges and lists of numbers in one phrase.
+
+    parse_compound("בין שלושים לארבעים אלף")     # Compound(range, 30000.0, 40000.0)
+    parse_compound("שלוש עד חמש מאות")           # Compound(range, 300.0, 500.0)
+    parse_compound("אלף, אלפיים ושלושת אלפים")   # Compound(list, 1000.0, 2000.0, 3000.0)
+
+A range is 'בין X ל‑Y', 'X עד Y', 'מX עד Y' or 'X-Y'; a list separates its
+numbers with commas or 'או', and the last 'ו' of a list joins its last number
+when it joins two words of the same kind ('שלוש, ארבע וחמש'), not when it ends
+a number ('עשרים ושלוש') or joins a fraction ('3 וחצי'). Without commas or
+'או', a 'ו' separates two numbers only when it cannot continue the number before
+it ('אלפיים ושלושת אלפים'). A phrase with neither is a single number.
+
+The words are split into numbers and classified in one pass, and every number
+is evaluated from its tokens, so an expression costs one call. A number without
+a scale before a number that ends in an amount and a scale takes that scale, as
+Hebrew implies: 'שלושים לארבעים אלף' is 30,000 to 40,000. A lone unit before a
+hundred takes its 'מאות' too: 'שלוש עד ארבע מאות אלף' is 300,000 to 400,000.
+"""
+import re
+
+from hebrew_number.limits import LIMITS
+from hebrew_number.parser import (
+    ERR_TEXT_TOO_LONG, ERR_TOO_MANY_WORDS, _ALPAYIM_TOKENS, _FRACTION, _HUNDRED, _LEXICON, _SCALE, _SKIP, _TEN, _UNIT,
+    _VAV, _convert, _evaluate_tokens, _is_number_token, _tokens,
+)
+
+ERR_COMPOUND = "ניסוח לא תקין: ביטוי מורכב צריך להיות טווח ('בין X ל‑Y', 'X עד Y') או רשימה ('X, Y ו‑Z') של מספרים."
+
+_WORD_RE = re.compile(r",|[-‐‑–]|[^\s,־\-‐‑–]+")
+_RANGE, _LIST = "range", "list"
+_SEPARATORS = {",": _LIST, "או": _LIST, "עד": _RANGE, "ל": _RANGE}
+_HYPHENS = frozenset("-‐‑–")
+_SAME_KIND = frozenset((_UNIT, _TEN, _HUNDRED))  # two in a row after 'ו' are two numbers
+
+
+class Compound:
+    """Result of parse_compound(): `kind` is "number", "range" or "list" and
+       `values` the numbers in order (a range has two: low and high)."""
+    __slots__ = ("kind", "values")
+
+    def __init__(self, kind: str, values: tuple):
+        self.kind = kind
+        self.values = values
+
+    @property
+    def low(self):
+        return self.values[0]
+
+    @property
+    def high(self):
+        return self.values[-1]
+
+    def __repr__(self):
+        return f"Compound({self.kind}, {', '.join(map(repr, self.values))})"
+
+
+def _known(word: str) -> bool:
+    return word in _LEXICON or _is_number_token(word)
+
+
+def _split(text: str):
+    """(kind, pieces): the words of each number and how they are joined."""
+    pieces = [[]]
+    kind = None
+    between = False
+    limit = LIMITS.max_tokens
+    for n, m in enumerate(_WORD_RE.finditer(text)):
+        if limit is not None and n == limit:
+            raise ValueError(f"{ERR_TOO_MANY_WORDS} (עד {limit})")
+        word = m.group()
+        sep = _SEPARATORS.get(word)
+        if sep is not None:
+            word = None
+        elif word in _HYPHENS:
+            if not pieces[-1]:
+                continue  # 'ל-40', 'מ-30': joins a prefix to its number
+            sep, word = _RANGE, None
+        elif word == "בין" and not pieces[0]:
+            between = True
+            continue
+        elif word == "מ" and not pieces[0]:
+            continue
+        elif word[0] in "למ" and len(word) > 1 and word not in _LEXICON and word not in _SKIP and _known(word[1:]):
+            # 'לארבעים' ends the first number of a range; 'משלוש' starts it
+            if word[0] == "ל" and pieces[0]:
+                sep = _RANGE
+                word = word[1:]
+            elif word[0] == "מ" and not pieces[0]:
+                word = word[1:]
+        if sep is not None:
+            if not pieces[-1] or (kind is not None and kind != sep):
+                raise ValueError(ERR_COMPOUND)
+            kind = sep
+            pieces.append([])
+        if word is not None:
+            pieces[-1].append(word)
+    if (between and kind != _RANGE) or not pieces[-1] or (kind == _RANGE and len(pieces) != 2):
+        raise ValueError(ERR_COMPOUND)
+    return kind, pieces
+
+
+def _shared_scale(tokens):
+    """What a number without a scale borrows from `tokens`: (hundreds, scale token)
+       for the 'מאות' of 'חמש מאות' and the final scale of 'ארבעים אלף', or None."""
+    amount, scale = tokens, None
+    last = tokens[-1]
+    if last[1] == _SCALE and len(tokens) > 1 and last is not _ALPAYIM_TOKENS[1] \
+            and sum(t[1] == _SCALE for t in tokens) == 1:
+        amount, scale = tokens[:-1], last
+    hundreds = len(amount) == 1 and amount[0][1] == _HUNDRED and " " in amount[0][0]
+    return (hundreds, scale) if hundreds or scale else None
+
+
+def _with_scale(tokens, hundreds, scale):
+    """tokens with the borrowed hundreds and scale, or tokens itself when it has a scale."""
+    if any(t[1] == _SCALE for t in tokens):
+        return tokens
+    shared = tokens
+    if hundreds and len(tokens) == 1 and tokens[0][1] == _UNIT:
+        w, _, value, hv = tokens[0]
+        shared = [(f"{w} מאות", _HUNDRED, value * 100, hv)]  # 'שלוש' of 'שלוש עד חמש מאות'
+    if scale is not None:
+        shared = shared + [scale]
+    return shared
+
+
+def _value(tokens, mode):
+    return _convert(tokens, mode, _evaluate_tokens)
+
+
+def _split_vav(tokens, mode, last=False):
+    """[(tokens, value)] of the two numbers of a list item joined by 'ו', or None.
+       Splits at the first 'ו' that gives two numbers; with last=True only at the
+       last 'ו' between two words of the same kind ('ארבע וחמש', 'מאה ומאתיים'),
+       which cannot join one number, so 'עשרים ושלוש' stays whole. A 'ו' before a
+       fraction ('3 וחצי') belongs to its number."""
+    points = range(1, len(tokens))
+    for k in reversed(points) if last else points:
+        w, kind, value, hv = tokens[k]
+        if kind == _VAV:
+            head, tail = tokens[:k], tokens[k+1:]
+        elif hv:
+            head, tail = tokens[:k], [(w, kind, value, False)] + tokens[k+1:]
+        else:
+            continue
+        if not tail or tail[0][1] == _FRACTION:
+            continue
+        if last and not (head[-1][1] == tail[0][1] and tail[0][1] in _SAME_KIND):
+            continue
+        try:
+            return [(head, _value(head, mode)), (tail, _value(tail, mode))]
+        except ValueError:
+            continue
+    return None
+
+
+def parse_compound(text: str, mode: str = "float") -> Compound:
+    """Parse a range, a list or a single number (see the module docstring); raises
+       ValueError when a number does not parse or the expression mixes ranges and lists.
+       mode is as for hebrew_to_number."""
+    if mode not in ("float", "decimal", "fraction"):
+        raise ValueError(f"unknown mode: {mode!r}")
+    limit = LIMITS.max_chars
+    if limit is not None and len(text) > limit:
+        raise ValueError(f"{ERR_TEXT_TOO_LONG} (עד {limit} תווים)")
+    kind, pieces = _split(text)
+    items = []  # (tokens, value) of each number
+    for k, words in enumerate(pieces):
+        tokens = _tokens(words)
+        if not tokens:
+            raise ValueError(ERR_COMPOUND)  # only skip words, e.g. 'שקל עד 5'
+        if kind == _LIST and k == len(pieces) - 1:
+            # 'שלוש, ארבע וחמש': the last 'ו' of a list joins its last number
+            pair = _split_vav(tokens, mode, last=True)
+            if pair is not None:
+                items += pair
+                continue
+        try:
+            items.append((tokens, _value(tokens, mode)))
+        except ValueError:
+            pair = _split_vav(tokens, mode) if kind != _RANGE else None
+            if pair is None:
+                raise
+            items += pair
+            kind = _LIST
+    borrowed = _shared_scale(items[-1][0]) if len(items) > 1 else None
+    if borrowed is not None:
+        for k, (tokens, value) in enumerate(items[:-1]):
+            shared = _with_scale(tokens, *borrowed)
+            if shared is not tokens:
+                items[k] = (shared, _value(shared, mode))
+    return Compound(kind or "number", tuple(value for _, value in items))
@@ -0,0 +1,257 @@
+"""Table-driven parse backend: hebrew_to_number(text, backend="dfa").
+
+The grammar hebrew_to_number accepts is regular: everything the strictness
+rules need to remember (the last scale, whether a fraction, tens or 'נקודה' were used,
+a pending 'ו' or 'נקודה', the one or two tokens looked back at) is a finite
+state. At import the reachable states are enumerated once and compiled into a
+transition table indexed by [state][token class]. Each entry holds the next
+state and the register update for the token, or the error message of a
+rejection, so evaluating a phrase is one linear scan of table lookups.
+"""
+from hebrew_number.parser import (
+    _ALPAYIM_TOKENS, _FRACTION, _HUNDRED, _LEXICON, _PHRASE_TRIE, _NUMBER, _POINT, _SCALE, _TEN,
+    _ORDINAL, _TWO_WORDS, _UNIT, _VAV, ERR_DECIMAL_TAIL, ERR_ORDINAL, ERR_REPEATED_FRACTION, ERR_REPEATED_POINT,
+    ERR_SCALE_ORDER, ERR_TENS_ALPAYIM, ERR_TWO_TENS, ERR_TWO_UNITS, ERR_UNKNOWN_WORD, _fail, _parse_decimal_phrase,
+    _tokenize, scales,
+)
+
+# token classes
+_SCALE_VALUES = tuple(sorted(set(scales.values())))
+(_C_UNIT, _C_TWO, _C_TEN, _C_HUNDRED, _C_FRACTION, _C_VAV_FRACTION, _C_POINT, _C_VAV,
+ _C_DIGITS, _C_NUMBER, _C_WORD, _C_ALAFIM, _C_ORDINAL) = range(13)
+_C_SCALE = {value: 13 + k for k, value in enumerate(_SCALE_VALUES)}  # value -> class
+_N_CLASSES = 13 + len(_SCALE_VALUES)
+_CLASS_SCALE = {c: value for value, c in _C_SCALE.items()}
+_CLASS_SCALE[_C_ALAFIM] = 1000
+
+# lookbehind for the strictness checks: the previous token was a ten, a 'ו' after
+# a ten, a 'שניים'/'שני' after a ten, or another unit
+_ADJ_NONE, _ADJ_TEN, _ADJ_TEN_VAV, _ADJ_TEN_TWO, _ADJ_UNIT = range(5)
+# what the next token continues; _START is _MAIN before the first token, where
+# an ordinal may stand alone, and nothing may follow it (_DONE)
+_MAIN, _PENDING_VAV, _TAIL_EMPTY, _TAIL, _START, _DONE = range(6)
+
+
+def _token_class(tok) -> int:
+    word, kind, value, hv = tok
+    if kind == _UNIT:
+        return _C_TWO if word in _TWO_WORDS else _C_UNIT
+    if kind == _SCALE:
+        return _C_ALAFIM if word == "אלפים" else _C_SCALE[value]
+    if kind == _FRACTION:
+        return _C_VAV_FRACTION if hv else _C_FRACTION
+    if kind == _NUMBER:
+        return _C_DIGITS if word.isdecimal() else _C_NUMBER
+    return {_TEN: _C_TEN, _HUNDRED: _C_HUNDRED, _POINT: _C_POINT, _VAV: _C_VAV, _ORDINAL: _C_ORDINAL}.get(kind, _C_WORD)
+
+
+def _known_tokens():
+    yield from _LEXICON.values()
+    yield from _ALPAYIM_TOKENS
+    for first, rest in _PHRASE_TRIE.items():
+        for second, (kind, value) in rest.items():
+            yield (f"{first} {second}", kind, value, False)
+            yield (f"{first} {second}", kind, value, True)
+
+
+# class of every token the tokenizer can produce except digit strings and unknown words
+_CLASS = {tok: _token_class(tok) for tok in _known_tokens()}
+
+
+# register updates; r is [total of closed groups, current group, open tail tokens,
+# a number that may still take a fraction]
+def _add(r, tok, num, arg):
+    r[1] += tok[2]
+
+def _add_num(r, tok, num, arg):
+    r[1] += num(tok[0])
+
+def _hold_num(r, tok, num, arg):
+    r[3] = num(tok[0])
+
+def _number_fraction(r, tok, num, arg):
+    r[1] += r[3] + num(tok[2])  # '12 וחצי': the fraction joins the number first
+
+def _add_fraction(r, tok, num, arg):
+    r[1] += num(tok[2])
+
+def _scale(r, tok, num, arg):
+    r[0] += (r[1] if r[1] != 0 else 1) * arg
+    r[1] = 0
+
+def _scale_fraction(r, tok, num, arg):
+    r[0] += num(tok[2]) * arg
+
+def _vav_fraction(r, tok, num, arg):
+    if r[1] > 0:
+        r[1] += num(tok[2])
+    else:
+        r[0] += num(tok[2]) * arg  # attach to the last scale
+
+def _open_tail(r, tok, num, arg):
+    r[2] = []
+
+def _tail_add(r, tok, num, arg):
+    r[2].append(tok)
+
+def _close_tail(r, num):
+    r[1] += num("0." + _parse_decimal_phrase(r[2]))
+
+def _flush_num(r, num):
+    r[1] += r[3]
+
+_PRECEDED = {}
+
+def _preceded(first, op):
+    """op preceded by first(r, num): closing a tail or flushing a held number."""
+    if (first, op) not in _PRECEDED:
+        def preceded(r, tok, num, arg):
+            first(r, num)
+            if op is not None:
+                op(r, tok, num, arg)
+        _PRECEDED[first, op] = preceded
+    return _PRECEDED[first, op]
+
+
+def _step(state, cls):
+    """Reference semantics of one token: (next_state, op, arg), or (None, back,
+       message) for a rejection (message None: unknown word) where the offending
+       token is `back` tokens before this one (None: this one)."""
+    mode, last, used, seen, number_open, after_scale, adj, pointed = state
+    if mode == _DONE:
+        return None, 1, ERR_ORDINAL  # the ordinal before
+    if cls == _C_ORDINAL:
+        if mode == _START:
+            return (_DONE,) + state[1:], _add, None
+        if mode not in (_TAIL_EMPTY, _PENDING_VAV):
+            return None, None, ERR_ORDINAL
+    if mode == _START:
+        mode = _MAIN
+    is_scale = cls in _CLASS_SCALE
+    next_adj = (_ADJ_TEN if cls == _C_TEN
+                else _ADJ_TEN_VAV if cls == _C_VAV and adj == _ADJ_TEN
+                else _ADJ_TEN_TWO if cls == _C_TWO and adj == _ADJ_TEN
+                else _ADJ_UNIT if cls in (_C_UNIT, _C_TWO)
+                else _ADJ_NONE)
+    strict = None
+    if cls == _C_TEN and adj in (_ADJ_TEN, _ADJ_TEN_VAV):
+        strict = ERR_TWO_TENS
+    elif cls == _C_ALAFIM and adj == _ADJ_TEN_TWO:
+        strict = ERR_TENS_ALPAYIM
+
+    if mode in (_TAIL_EMPTY, _TAIL):
+        if cls in (_C_UNIT, _C_TWO, _C_DIGITS, _C_TEN, _C_HUNDRED) or (is_scale and _CLASS_SCALE[cls] == 1000):
+            if strict:
+                return None, None, strict
+            return (_TAIL, last, used, seen, False, False, next_adj, pointed), _tail_add, None
+        if mode == _TAIL_EMPTY:
+            return None, 1, ERR_DECIMAL_TAIL  # the 'נקודה' before
+        nxt, op, arg = _step((_MAIN, last, used, seen, False, False, adj, pointed), cls)
+        return (nxt, _preceded(_close_tail, op), arg) if nxt is not None else (nxt, op, arg)
+
+    if mode == _PENDING_VAV:
+        if cls not in (_C_FRACTION, _C_VAV_FRACTION):
+            if cls == _C_TEN and strict:
+                return None, None, strict
+            return None, 1, f"{ERR_UNKNOWN_WORD}: ו"  # the 'ו' before
+        if used:
+            return None, None, ERR_REPEATED_FRACTION
+        op = _number_fraction if number_open else _add_fraction if last is None else _vav_fraction
+        return (_MAIN, last, True, seen, False, False, next_adj, pointed), op, last
+
+    if number_open and cls != _C_VAV:
+        if cls in (_C_FRACTION, _C_VAV_FRACTION):
+            return (_MAIN, last, True, seen, False, False, next_adj, pointed), _number_fraction, None
+        nxt, op, arg = _step((_MAIN, last, used, seen, False, after_scale, adj, pointed), cls)
+        return (nxt, _preceded(_flush_num, op), arg) if nxt is not None else (nxt, op, arg)
+
+    if cls in (_C_UNIT, _C_TWO, _C_HUNDRED) and adj in (_ADJ_UNIT, _ADJ_TEN_TWO):
+        return None, None, ERR_TWO_UNITS
+    base = (_MAIN, last, used, seen, False, False, next_adj, pointed)
+    if cls == _C_POINT:
+        if pointed:
+            return None, None, ERR_REPEATED_POINT
+        return (_TAIL_EMPTY, last, used, seen, False, False, next_adj, True), _open_tail, None
+    if cls == _C_VAV:
+        return (_PENDING_VAV, last, used, seen, number_open, False, next_adj, pointed), None, None
+    if cls in (_C_FRACTION, _C_VAV_FRACTION):
+        if used:
+            return None, None, ERR_REPEATED_FRACTION
+        nxt = (_MAIN, last, True, seen, False, False, next_adj, pointed)
+        if after_scale and cls == _C_VAV_FRACTION:
+            return nxt, _scale_fraction, last  # 'מיליון וחצי'
+        return nxt, _add_fraction, None
+    if cls in (_C_DIGITS, _C_NUMBER):
+        return (_MAIN, last, used, False, not used, False, next_adj, pointed), _add_num if used else _hold_num, None
+    if cls == _C_HUNDRED:
+        return (_MAIN, last, used, False, False, False, next_adj, pointed), _add, None
+    if cls == _C_TEN:
+        if strict or seen:
+            return None, None, ERR_TWO_TENS
+        return (_MAIN, last, used, True, False, False, next_adj, pointed), _add, None
+    if cls in (_C_UNIT, _C_TWO):
+        return base, _add, None
+    if is_scale:
+        if strict:
+            return None, None, strict
+        value = _CLASS_SCALE[cls]
+        if last is not None and value >= last:
+            return None, None, ERR_SCALE_ORDER
+        return (_MAIN, value, used, False, False, True, next_adj, pointed), _scale, value
+    return None, None, None
+
+
+def _compile():
+    """Enumerate the states reachable from the start state and build the tables."""
+    start = (_START, None, False, False, False, False, _ADJ_NONE, False)
+    index = {start: 0}
+    states = [start]
+    table = []
+    for state in states:  # grows while iterating
+        row = []
+        for cls in range(_N_CLASSES):
+            nxt, op, arg = _step(state, cls)
+            if nxt is None:
+                row.append((-1, op or 0, arg))
+                continue
+            if nxt not in index:
+                index[nxt] = len(states)
+                states.append(nxt)
+            row.append((index[nxt], op, arg))
+        table.append(tuple(row))
+    # end of input: (message of a rejection, or the op finishing the registers)
+    final = []
+    for mode, _, _, _, number_open, _, _, _ in states:
+        if mode == _PENDING_VAV:
+            final.append((f"{ERR_UNKNOWN_WORD}: ו", None))
+        elif mode == _TAIL_EMPTY:
+            final.append((ERR_DECIMAL_TAIL, None))
+        else:
+            final.append((None, _close_tail if mode == _TAIL else _flush_num if number_open else None))
+    return tuple(table), tuple(final)
+
+
+_TABLE, _FINAL = _compile()
+
+
+def evaluate(text: str, num):
+    """Same contract as parser._evaluate, driven by the compiled tables."""
+    r = [0, 0, None, 0]
+    state = 0
+    table, classes = _TABLE, _CLASS
+    tokens = _tokenize(text)
+    for i, tok in enumerate(tokens):
+        cls = classes.get(tok)
+        if cls is None:
+            cls = _token_class(tok)
+        state, op, arg = table[state][cls]
+        if state < 0:
+            raise _fail(arg if arg is not None else f"{ERR_UNKNOWN_WORD}: {tok[0]}", i - op)
+        if op is not None:
+            op(r, tok, num, arg)
+    message, finish = _FINAL[state]
+    if message is not None:
+        raise _fail(message, len(tokens) - 1)  # a dangling 'ו' or 'נקודה'
+    if finish is not None:
+        finish(r, num)
+    return r[0] + r[1]
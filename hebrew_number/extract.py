@@ -0,0 +1,92 @@
+"""Extract number phrases from free text.
+
+iter_numbers() scans a string or a text file object lazily and yields a
+(start, end, value) span for every number phrase it finds. Files are read in
+fixed-size chunks, so memory stays bounded regardless of the input size.
+"""
+import re
+
+from hebrew_number.parser import _LEXICON, _ORDINAL, _is_number_token, hebrew_to_number
+
+_TOKEN_RE = re.compile(r"\d+(?:\.\d+)?|[א-ת]+")
+_TAIL_RE = re.compile(r"\S*\Z")
+_MAX_PHRASE_TOKENS = 64  # longest candidate run tried as a single phrase
+
+
+def _is_candidate(word: str) -> bool:
+    tok = _LEXICON.get(word)
+    if tok is not None:
+        return tok[1] != _ORDINAL  # 'ביום שלישי' is a day, 'חצי שנייה' a time: not numbers in text
+    if word.startswith("ו") and len(word) > 1:
+        word = word[1:]
+    return _is_number_token(word)
+
+
+def _is_gap(gap: str) -> bool:
+    """Only whitespace and maqaf may separate words of the same phrase."""
+    return not gap or gap.replace("־", " ").isspace()
+
+
+def _scan(buf: str, final: bool):
+    """Split buf into runs of consecutive number words.
+       Returns (closed_runs, keep_from): runs that cannot grow any more and the
+       index from which buf must be kept for the next chunk."""
+    runs = []
+    run = []  # [(start, end, word)]
+    prev_end = 0
+    # words after the last whitespace may continue in the next chunk
+    scan_end = len(buf) if final else _TAIL_RE.search(buf).start()
+    for m in _TOKEN_RE.finditer(buf, 0, scan_end):
+        start, end = m.span()
+        if run and not _is_gap(buf[prev_end:start]):
+            runs.append(run); run = []
+        word = m.group()
+        if _is_candidate(word):
+            run.append((start, end, word))
+        elif run:
+            runs.append(run); run = []
+        prev_end = end
+    if run and (final or not _is_gap(buf[prev_end:scan_end])):
+        runs.append(run); run = []
+    return runs, run[0][0] if run else scan_end
+
+
+def _parse_run(run):
+    """Yield the longest valid phrases of a run from left to right; words that
+       cannot start any valid phrase are skipped."""
+    i = 0
+    while i < len(run):
+        for j in range(min(len(run), i + _MAX_PHRASE_TOKENS), i, -1):
+            try:
+                value = hebrew_to_number(" ".join(w for _, _, w in run[i:j]))
+            except ValueError:
+                continue
+            yield run[i][0], run[j-1][1], value
+            i = j
+            break
+        else:
+            i += 1
+
+
+def iter_numbers(source, chunk_size: int = 1 << 16):
+    """Yield (start, end, value) for each number phrase in `source`.
+       `source` is a str or a text file object; offsets are character positions
+       in the whole input."""
+    if isinstance(source, str):
+        chunks = iter((source,))
+    else:
+        chunks = iter(lambda: source.read(chunk_size), "")
+    buf = ""
+    offset = 0
+    for chunk in chunks:
+        buf += chunk
+        runs, keep = _scan(buf, final=False)
+        for run in runs:
+            for start, end, value in _parse_run(run):
+                yield offset + start, offset + end, value
+        buf = buf[keep:]
+        offset += keep
+    runs, _ = _scan(buf, final=True)
+    for run in runs:
+        for start, end, value in _parse_run(run):
+            yield offset + start, offset + end, value
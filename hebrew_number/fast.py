@@ -0,0 +1,109 @@
+"""Lean serving mode.
+
+    uvicorn hebrew_number.fast:app --no-access-log
+
+Same routes as hebrew_number.main, but the handlers are async and run the parser inline
+(it is pure CPU and takes microseconds), so requests skip the threadpool hop.
+Request bodies are decoded directly instead of through pydantic models,
+responses are encoded with orjson when it is installed, and the landing page
+is the one hebrew_number.web renders at import. The shared helpers come from hebrew_number.web,
+so importing this module does not build hebrew_number.main.
+"""
+import json
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+from fastapi import FastAPI, Request
+from fastapi.responses import HTMLResponse, JSONResponse, PlainTextResponse
+from fastapi.staticfiles import StaticFiles
+
+from hebrew_number import http_cache
+from hebrew_number.cache import cache_stats
+from hebrew_number.limits import BodyLimit, batch_error
+from hebrew_number.metrics import render_metrics
+from hebrew_number.parser import hebrew_to_number
+from hebrew_number.web import (
+    EXAMPLES, HOME_ETAG, HOME_HTML, cached_response, configure, conversion_response, convert_text_to_number,
+    convert_texts_to_numbers, too_large,
+)
+
+try:
+    import orjson
+except ImportError:  # optional: fall back to the stdlib encoder
+    orjson = None
+
+APP_DIR = Path(__file__).resolve().parent
+_loads = orjson.loads if orjson is not None else json.loads
+
+class _OrjsonResponse(JSONResponse):
+    """JSONResponse encoded with orjson (FastAPI deprecated its ORJSONResponse)."""
+    def render(self, content) -> bytes:
+        return orjson.dumps(content)
+
+_Response = _OrjsonResponse if orjson is not None else JSONResponse
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    hebrew_to_number(EXAMPLES[0])  # warm up the lexicon and code paths
+    yield
+
+app = FastAPI(
+    title="Hebrew Number Parser API",
+    description="API to convert Hebrew text numbers to decimal numbers (lean mode)",
+    version="1.2",
+    default_response_class=_Response,
+    lifespan=lifespan,
+)
+app.mount("/static", StaticFiles(directory=APP_DIR / "static"), name="static")
+configure()
+app.add_middleware(BodyLimit)
+
+def _field(body: bytes, name: str, kind: type):
+    """Read a required field from a JSON object body, or None if it is missing/invalid."""
+    try:
+        data = _loads(body)
+    except ValueError:
+        return None
+    value = data.get(name) if isinstance(data, dict) else None
+    if not isinstance(value, kind):
+        return None
+    if kind is list and not all(isinstance(v, str) for v in value):
+        return None
+    return value
+
+def _invalid(name: str):
+    return _Response({"detail": f"body must be a JSON object with '{name}'"}, status_code=422)
+
+@app.get("/", response_class=HTMLResponse)
+async def home(request: Request):
+    return cached_response(HOME_HTML, HOME_ETAG, request.headers.get("if-none-match"),
+                           http_cache.PAGE_CACHE_CONTROL, "text/html; charset=utf-8")
+
+@app.post("/hebrew-number")
+async def convert_number_post(request: Request):
+    text = _field(await request.body(), "text", str)
+    if text is None:
+        return _invalid("text")
+    return _Response(convert_text_to_number(text))
+
+@app.post("/hebrew-number/batch")
+async def convert_number_batch(request: Request):
+    texts = _field(await request.body(), "texts", list)
+    if texts is None:
+        return _invalid("texts")
+    error = batch_error(len(texts))
+    if error is not None:
+        return too_large(error, _Response)
+    return _Response({"results": convert_texts_to_numbers(texts)})
+
+@app.get("/hebrew-number")
+async def convert_number_get(text: str, request: Request):
+    return conversion_response(text, request.headers.get("if-none-match"), _Response)
+
+@app.get("/cache-stats")
+async def get_cache_stats():
+    return _Response(cache_stats())
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics():
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
@@ -0,0 +1,112 @@
+"""Opt-in correction of misspelled number words: hebrew_to_number(text, fuzzy=1).
+
+ASR and OCR output contains near misses such as 'שלושימ' or 'מיליאד'. With
+fuzzy=n an unknown word is replaced by the lexicon word closest to it within
+edit distance n (optimal string alignment: insertions, deletions, substitutions
+and adjacent transpositions). Real words are not numbers with a typo, so only
+words of MIN_LENGTH letters or more that are not in STOP_WORDS are corrected,
+and a substitution must stay within a class of letters that sound or look
+alike (_LETTER_CLASSES): 'שלום' is not 'שלוש', 'שבועה' is not 'שבעה'.
+
+Lookups use a deletion-neighborhood index built when this module is imported:
+every lexicon word is stored under each string obtained by deleting up to
+MAX_DISTANCE of its letters, so the candidates for a word are found by looking
+up its own deletions instead of comparing it with every entry. Corrections are
+memoized. Phrases that parse as they are never reach this module.
+"""
+from functools import lru_cache
+from itertools import combinations
+
+from hebrew_number.parser import _LEXICON, _ORDINAL, _SKIP, _VAV, _unknown_token, normalize_text
+
+MAX_DISTANCE = 2
+MIN_LENGTH = 5   # shorter words are too often real words one letter away from a number
+
+# frequent words within a few edits of a number word
+STOP_WORDS = frozenset((
+    "שלום", "שבוע", "שבועה", "שבועות", "שבועיים", "עשירה", "עשירים", "עשרות", "שמנים", "אחדות",
+))
+
+# letters a substitution may swap: same sound, or a final form, or a look-alike in print
+_LETTER_CLASSES = ("אעה", "הח", "חכך", "כקך", "תט", "סש", "בו", "וי", "דר", "מם", "נן", "פף", "צץ")
+_SUBSTITUTES = frozenset((a, b) for group in _LETTER_CLASSES for a in group for b in group if a != b)
+
+
+def _deletions(word: str, depth: int):
+    """word and every string obtained by deleting up to `depth` of its letters."""
+    out = {word}
+    for k in range(1, min(depth, len(word) - 1) + 1):
+        for drop in combinations(range(len(word)), k):
+            out.add("".join(c for i, c in enumerate(word) if i not in drop))
+    return out
+
+
+def _build_index():
+    index = {}
+    for raw, tok in _LEXICON.items():
+        if tok[3] or tok[1] in (_VAV, _ORDINAL):  # 'ו'-prefixed forms are corrected without their 'ו';
+            continue                                # ordinals are days and times more often than numbers
+        for key in _deletions(raw, MAX_DISTANCE):
+            index.setdefault(key, []).append(raw)
+    return index
+
+
+_INDEX = _build_index()
+
+
+def edit_distance(a: str, b: str, substitutes=None) -> int:
+    """Optimal string alignment distance between a and b. With `substitutes`
+       (a set of letter pairs) other substitutions are not allowed."""
+    never = len(a) + len(b)  # costlier than deleting and inserting everything
+    prev2, prev = None, list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        row = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i-1] == b[j-1] else 1 if substitutes is None or (a[i-1], b[j-1]) in substitutes else never
+            row[j] = min(prev[j] + 1, row[j-1] + 1, prev[j-1] + cost)
+            if i > 1 and j > 1 and a[i-1] == b[j-2] and a[i-2] == b[j-1]:
+                row[j] = min(row[j], prev2[j-2] + 1)
+        prev2, prev = prev, row
+    return prev[-1]
+
+
+@lru_cache(maxsize=4096)
+def correct_word(word: str, max_distance: int = 1):
+    """Nearest lexicon word within max_distance edits, or None.
+       Words shorter than MIN_LENGTH and STOP_WORDS are left alone, substitutions
+       stay within _LETTER_CLASSES, and a word whose nearest candidates disagree
+       on the value is left alone too."""
+    if len(word) < MIN_LENGTH or word in STOP_WORDS:
+        return None
+    limit = min(max_distance, MAX_DISTANCE)
+    if limit < 1:
+        return None
+    best, best_distance = [], limit + 1
+    for key in _deletions(word, limit):
+        for candidate in _INDEX.get(key, ()):
+            d = edit_distance(word, candidate, _SUBSTITUTES)
+            if d > limit:
+                continue
+            if d < best_distance:
+                best, best_distance = [candidate], d
+            elif d == best_distance and candidate not in best:
+                best.append(candidate)
+    if not best or len({_LEXICON[w][1:3] for w in best}) > 1:
+        return None
+    return min(best)
+
+
+def correct_text(text: str, max_distance: int = 1) -> str:
+    """text with every unknown word replaced by its correction, where there is one."""
+    words = normalize_text(text).split()
+    for i, raw in enumerate(words):
+        if raw in _LEXICON or raw in _SKIP:
+            continue
+        word, _, _, hv = _unknown_token(raw)
+        fixed = correct_word(word, max_distance) if not word.replace(".", "").isdecimal() else None
+        if fixed is None and hv and word not in STOP_WORDS:
+            fixed = correct_word(raw, max_distance)  # the 'ו' may be part of the typo
+            hv = False
+        if fixed is not None:
+            words[i] = "ו" + fixed if hv else fixed
+    return " ".join(words)
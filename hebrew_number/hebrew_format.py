@@ -0,0 +1,112 @@
+from types import MappingProxyType
+
+from hebrew_number.cache import cached
+
+ERR_NEGATIVE = "לא ניתן להמיר מספר שלילי"
+
+# reverse lookup tables, indexed by value
+_FEMININE = ("אפס", "אחת", "שתיים", "שלוש", "ארבע", "חמש", "שש", "שבע", "שמונה", "תשע")
+_MASCULINE = ("אפס", "אחד", "שניים", "שלושה", "ארבעה", "חמישה", "שישה", "שבעה", "שמונה", "תשעה")
+_TENS = ("", "עשר", "עשרים", "שלושים", "ארבעים", "חמישים", "שישים", "שבעים", "שמונים", "תשעים")
+_HUNDREDS = ("", "מאה", "מאתיים") + tuple(f"{w} מאות" for w in _FEMININE[3:])
+# 12 is spelled 'שתים עשרה' / 'שנים עשר', without the second yod of 'שתיים' / 'שניים'
+_TEENS_FEMININE = ("",) + tuple(f"{w} עשרה" for w in ("אחת", "שתים") + _FEMININE[3:])
+_TEENS_MASCULINE = ("",) + tuple(f"{w} עשר" for w in ("אחד", "שנים") + _MASCULINE[3:])
+# 3000-10000: construct state + 'אלפים'
+_THOUSANDS = MappingProxyType({
+    1: "אלף", 2: "אלפיים", 3: "שלושת אלפים", 4: "ארבעת אלפים", 5: "חמשת אלפים",
+    6: "ששת אלפים", 7: "שבעת אלפים", 8: "שמונת אלפים", 9: "תשעת אלפים", 10: "עשרת אלפים",
+})
+_SCALES = ((1_000_000_000_000, "טריליון"), (1_000_000_000, "מיליארד"), (1_000_000, "מיליון"))
+
+def _small_number(n: int, masculine: bool) -> list:
+    """Elements of 1..999, with 'ו' joining the last one: 'מאה עשרים ושלוש'."""
+    hundreds, rest = divmod(n, 100)
+    elements = [_HUNDREDS[hundreds]] if hundreds else []
+    if 10 < rest < 20:
+        elements.append((_TEENS_MASCULINE if masculine else _TEENS_FEMININE)[rest - 10])
+    else:
+        tens, units = divmod(rest, 10)
+        if tens:
+            elements.append("עשרה" if masculine and rest == 10 else _TENS[tens])
+        if units:
+            elements.append((_MASCULINE if masculine else _FEMININE)[units])
+    if len(elements) > 1:
+        elements[-1] = "ו" + elements[-1]
+    return elements
+
+def _scale_group(amount: int, label: str) -> list:
+    """Elements of `amount` × scale, e.g. 'שני מיליון', 'עשרים ושניים מיליון'."""
+    if amount == 1:
+        return [label]
+    if amount == 2:
+        return [f"שני {label}"]
+    if amount > 999:
+        return [f"{amount} {label}"]  # beyond the grammar; a digit token still parses
+    elements = _small_number(amount, masculine=True)
+    elements[-1] += f" {label}"
+    return elements
+
+def _thousands_group(amount: int) -> list:
+    if amount in _THOUSANDS:
+        return [_THOUSANDS[amount]]
+    elements = _small_number(amount, masculine=True)
+    elements[-1] += " אלף"
+    return elements
+
+def _split_number(num):
+    """Return (negative, whole, fractional digits string) computed exactly.
+       decimal and fractions are imported only for values that need them."""
+    if isinstance(num, float) and num.is_integer() and abs(num) < 2 ** 53:
+        num = int(num)  # exact, and the same digits as its repr
+    if isinstance(num, int):
+        return num < 0, abs(num), ""
+    from decimal import Decimal
+    if isinstance(num, float):
+        if num != num or num in (float("inf"), float("-inf")):
+            raise ValueError(f"לא ניתן להמיר: {num}")
+        num = Decimal(repr(num))
+    elif not isinstance(num, Decimal):
+        from fractions import Fraction
+        if isinstance(num, Fraction):
+            num = Decimal(num.numerator) / Decimal(num.denominator)
+        else:
+            num = Decimal(repr(float(num)))
+    if not num.is_finite():
+        raise ValueError(f"לא ניתן להמיר: {num}")
+    whole, _, digits = format(abs(num), "f").partition(".")
+    return num < 0, int(whole), digits.rstrip("0")
+
+@cached("number_to_hebrew", key=lambda num: (type(num), num))
+def number_to_hebrew(num: float) -> str:
+    """
+    המרה ממספר לעברית: חלק שלם עד טריליונים בדקדוק מלא ("שלושת אלפים", "עשרים ושניים מיליון"),
+    וחלק עשרוני כספרות אחרי 'נקודה'. הפלט חוזר לאותו מספר דרך hebrew_to_number.
+    מספר שלילי מעלה ValueError, כי המפענח אינו מקבל 'מינוס'.
+    """
+    negative, whole, digits = _split_number(num)
+    if negative:
+        raise ValueError(f"{ERR_NEGATIVE}: {num}")
+
+    segments = []
+    rest = whole
+    for mult, label in _SCALES:
+        amount, rest = divmod(rest, mult)
+        if amount:
+            segments.append(_scale_group(amount, label))
+    thousands, rest = divmod(rest, 1000)
+    if thousands:
+        segments.append(_thousands_group(thousands))
+    if rest:
+        segments.append(_small_number(rest, masculine=False))
+    if not segments:
+        segments.append([_FEMININE[0]])
+    # 'ו' before the last element when it stands alone: 'מיליון ומאה', 'אלף ושלוש'
+    if len(segments) > 1 and len(segments[-1]) == 1:
+        segments[-1][0] = "ו" + segments[-1][0]
+
+    words = [e for seg in segments for e in seg]
+    if digits:
+        words.append("נקודה")
+        words += [_FEMININE[int(d)] for d in digits]
+    return " ".join(words)
@@ -0,0 +1,67 @@
+"""HTTP caching of GET /hebrew-number, whose response depends only on the text.
+
+The ETag is a digest of the normalized text, salted with the contents of the
+lexicon file and of the modules that compute the response, and with the phrase
+limits in force (hebrew_number.limits: a lower max_chars turns an answer into an error).
+It is the same on every replica of one deployment configured alike (no mtimes
+or process state go into it) and changes when a deployment can change an
+answer. Requests whose If-None-Match holds the ETag get a 304 without running
+the parser.
+
+    HEBREW_NUMBER_HTTP_MAX_AGE=86400   # Cache-Control max-age, seconds (default)
+"""
+import hashlib
+import os
+from pathlib import Path
+
+from hebrew_number.lexicon import lexicon_path
+from hebrew_number.limits import LIMITS
+from hebrew_number.parser import normalize_text
+
+MAX_AGE = int(os.environ.get("HEBREW_NUMBER_HTTP_MAX_AGE", 86400))
+CACHE_CONTROL = f"public, max-age={MAX_AGE}"
+PAGE_CACHE_CONTROL = "no-cache"  # the page links the current client bundle: revalidate every time
+
+
+def _salt() -> bytes:
+    import hebrew_number.hebrew_format
+    import hebrew_number.parser
+    h = hashlib.blake2b(digest_size=16)
+    web = Path(hebrew_number.parser.__file__).with_name("web.py")  # the response shape; it imports fastapi
+    for path in (lexicon_path(), hebrew_number.parser.__file__, hebrew_number.hebrew_format.__file__, web):
+        with open(path, "rb") as f:
+            h.update(f.read())
+    return h.digest()
+
+
+_SALT = _salt()
+_salts = {}  # phrase limits -> _SALT salted with them
+
+
+def _limits_salt() -> bytes:
+    limits = (LIMITS.max_chars, LIMITS.max_tokens, LIMITS.max_digits)
+    salt = _salts.get(limits)
+    if salt is None:
+        salt = _salts[limits] = hashlib.blake2b(repr(limits).encode(), digest_size=16, key=_SALT).digest()
+    return salt
+
+
+def etag(text: str) -> str:
+    """Strong ETag of the conversion of text under the current limits."""
+    digest = hashlib.blake2b(normalize_text(text).encode("utf-8"), digest_size=16, key=_limits_salt())
+    return f'"{digest.hexdigest()}"'
+
+
+def page_etag(body: bytes) -> str:
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def not_modified(if_none_match, tag: str) -> bool:
+    """True when an If-None-Match header value matches tag (weak comparison, as for GET)."""
+    if not if_none_match:
+        return False
+    return any(t.strip() in ("*", tag, "W/" + tag) for t in if_none_match.split(","))
+
+
+def headers(tag: str, cache_control: str = CACHE_CONTROL) -> dict:
+    return {"ETag": tag, "Cache-Control": cache_control}
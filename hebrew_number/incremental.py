@@ -0,0 +1,277 @@
+"""Word-at-a-time parsing for live speech-to-text streams.
+
+    p = IncrementalParser()
+    for word in asr_words:
+        if not p.feed(word):      # the word does not continue this phrase
+            emit(p.finish())
+            p = IncrementalParser()
+            p.feed(word)
+        show(p.value())           # partial value so far
+
+The parser keeps the state of the main parse loop (groups, current group,
+last scale, fraction and tens flags) between calls, so each word costs O(1)
+instead of re-parsing the growing prefix. finish() returns what
+hebrew_to_number would return for the accepted words.
+"""
+from contextlib import nullcontext
+
+from hebrew_number.parser import (
+    _FRACTION, _HUNDRED, _PHRASE_TRIE, _LEXICON, _SKIP, _NUMBER, _POINT, _SCALE, _TEN, _UNIT,
+    _VAV, _WORD, _ALPAYIM, _ALPAYIM_TOKENS, _ORDINAL, ERR_DECIMAL_TAIL, ERR_ORDINAL, ERR_REPEATED_FRACTION,
+    ERR_REPEATED_POINT, ERR_SCALE_ORDER, ERR_TWO_TENS, ERR_TWO_UNITS, ERR_UNKNOWN_WORD, _check_digits, _check_strict,
+    _exact_types, _parse_decimal_phrase, _unknown_token,
+)
+
+_MODES = ("float", "decimal", "fraction")
+
+
+class IncrementalParser:
+    __slots__ = (
+        "mode", "ended", "_num", "_context", "_groups",
+        "_current", "_used_fraction", "_used_point", "_seen_tens", "_last_scale", "_window", "_vav", "_number",
+        "_after_scale", "_tail", "_hundreds", "_before_unit", "_deferred",
+    )
+
+    def __init__(self, mode: str = "float"):
+        if mode not in _MODES:
+            raise ValueError(f"unknown mode: {mode!r}")
+        self.mode = mode
+        self.ended = False  # set once a word has been rejected
+        self._num = float if mode == "float" else _exact_types()[4 if mode == "decimal" else 1]
+        self._context = _exact_types()[3] if mode == "decimal" else None
+        self._groups = []            # list of (value, multiplier)
+        self._current = 0            # current_group
+        self._used_fraction = False
+        self._used_point = False
+        self._seen_tens = False      # tens seen since the last scale/hundred/number
+        self._last_scale = None
+        self._window = ()            # last two tokens, for _check_strict
+        self._vav = False            # a standalone 'ו' waits for its fraction
+        self._number = None          # a number that may still take a fraction, not yet added
+        self._after_scale = None     # multiplier of a scale that may take a 'ו' fraction
+        self._tail = None            # tokens of an open 'נקודה' tail
+        self._hundreds = None        # trie node if the last token can start a two-word entry
+        self._before_unit = None     # state to restore when that hundred completes
+        self._deferred = None        # first word of a possible two-word entry, held until the next word
+
+    def _snapshot(self):
+        # groups only grow between a snapshot and its restore, so their length is enough;
+        # the tail is copied, since restoring the state before a unit shrinks it in place
+        return (len(self._groups), self._current, self._used_fraction, self._used_point, self._seen_tens, self._last_scale,
+                self._window, self._vav, self._number, self._after_scale,
+                tuple(self._tail) if self._tail is not None else None,
+                self._hundreds, self._before_unit, self._deferred)
+
+    def _restore(self, state):
+        (n_groups, self._current, self._used_fraction, self._used_point, self._seen_tens, self._last_scale,
+         self._window, self._vav, self._number, self._after_scale, tail,
+         self._hundreds, self._before_unit, self._deferred) = state
+        del self._groups[n_groups:]
+        self._tail = list(tail) if tail is not None else None
+
+    @property
+    def complete(self) -> bool:
+        """True when finish() would succeed now (no dangling 'ו' or 'נקודה')."""
+        return not self._vav and self._deferred is None and (self._tail is None or bool(self._tail))
+
+    def feed(self, word: str) -> bool:
+        """Add the next word. Returns False, leaving the state unchanged and
+           setting `ended`, when the word cannot continue the phrase."""
+        if self.ended:
+            return False
+        state = self._snapshot()
+        try:
+            with _exact_types()[2](self._context) if self._context else nullcontext():
+                for raw in word.replace("־", " ").split():
+                    self._feed_word(raw)
+        except ValueError:
+            self._restore(state)
+            self.ended = True
+            return False
+        return True
+
+    def _feed_word(self, raw: str):
+        tok = _LEXICON.get(raw)
+        if tok is None:
+            if raw in _SKIP:
+                return
+            tok = _unknown_token(raw)
+            if tok[1] == _NUMBER:
+                _check_digits(tok[0])
+        word, kind = tok[0], tok[1]
+        if self._hundreds is not None and word in self._hundreds:
+            # 'שלוש' + 'מאות': redo the unit as a single two-word token
+            prev = self._deferred or self._window[-1]
+            merged = (f"{prev[0]} {word}", *self._hundreds[word], prev[3])
+            self._restore(self._before_unit)
+            self._step(merged)
+            self._hundreds = self._before_unit = None
+            return
+        if self._deferred is not None:
+            self._step(self._deferred)  # not a two-word entry after all: rejected
+        if kind == _WORD and word in _PHRASE_TRIE or kind == _UNIT and (self._vav or self._after_unit()) \
+                and self._may_become_fraction(word):
+            # 'ו שלושת' or 'שלוש ושלושת' may still end in 'רבעי', 'שנים' only becomes a number as 'שנים עשר'
+            self._before_unit = self._snapshot()
+            self._hundreds = _PHRASE_TRIE[word]
+            self._deferred = tok
+            return
+        if kind == _ALPAYIM:
+            for t in _ALPAYIM_TOKENS:
+                self._step(t)
+            self._hundreds = self._before_unit = None
+            return
+        before = self._snapshot() if kind == _UNIT else None
+        self._step(tok)
+        self._hundreds = _PHRASE_TRIE.get(word) if kind == _UNIT else None
+        self._before_unit = before
+
+    def _after_unit(self) -> bool:
+        """The next word follows a unit outside a 'נקודה' tail ('שלוש ושלושת')."""
+        return self._tail is None and bool(self._window) and self._window[-1][1] == _UNIT
+
+    @staticmethod
+    def _may_become_fraction(word: str) -> bool:
+        """word starts a two-word fraction ('שלושת' of 'שלושת רבעי')."""
+        return any(kind == _FRACTION for kind, _ in _PHRASE_TRIE.get(word, {}).values())
+
+    def _push(self, tok):
+        self._window = (self._window[-1], tok) if self._window else (tok,)
+
+    def _close_tail(self):
+        if not self._tail:
+            raise ValueError(ERR_DECIMAL_TAIL)
+        self._current += self._num("0." + _parse_decimal_phrase(self._tail))
+        self._tail = None
+
+    def _step(self, tok):
+        """One iteration of the _evaluate loop for a single token."""
+        w, kind, value, hv = tok
+        window = self._window + (tok,)
+        num = self._num
+        if self._window and self._window[-1][1] == _ORDINAL:
+            raise ValueError(ERR_ORDINAL)  # an ordinal is a whole phrase
+
+        if self._tail is not None:
+            if kind == _UNIT or (kind == _NUMBER and w.isdecimal()):
+                self._tail.append(tok); self._push(tok)
+                return
+            if kind == _TEN or kind == _HUNDRED or (kind == _SCALE and value == 1000):
+                _check_strict(window, len(window) - 1, kind)
+                self._tail.append(tok); self._push(tok)
+                return
+            self._close_tail()
+
+        number, after_scale = self._number, self._after_scale
+        self._number = None
+        self._after_scale = None
+
+        # 'ו' waiting for 'חצי' / 'רבע'
+        if self._vav:
+            if kind != _FRACTION:
+                if kind == _TEN:
+                    _check_strict(window, len(window) - 1, kind)  # 'שמונים ו שבעים'
+                raise ValueError(f"{ERR_UNKNOWN_WORD}: ו")
+            if self._used_fraction:
+                raise ValueError(ERR_REPEATED_FRACTION)
+            frac = num(value)
+            if number is not None:
+                self._current += number + frac
+            elif self._current > 0 or not self._groups:
+                self._current += frac
+            else:
+                # attach to last scale
+                self._groups.append((frac, self._groups[-1][1]))
+            self._used_fraction = True
+            self._vav = False
+            self._push(tok)
+            return
+
+        if kind == _VAV:
+            self._vav = True
+            self._number = number
+            self._push(tok)
+            return
+        if kind == _FRACTION and number is not None:
+            # '12 וחצי': the fraction joins the number first
+            self._current += number + num(value)
+            self._used_fraction = True
+            self._push(tok)
+            return
+        if number is not None:
+            self._current += number
+        if kind == _POINT:
+            if self._used_point:
+                raise ValueError(ERR_REPEATED_POINT)
+            self._tail = []
+            self._used_point = True
+        elif kind == _FRACTION:
+            if self._used_fraction:
+                raise ValueError(ERR_REPEATED_FRACTION)
+            if after_scale is not None and hv:
+                # 'מיליון וחצי'
+                self._groups.append((num(value), after_scale))
+            else:
+                self._current += num(value)
+            self._used_fraction = True
+        elif kind == _NUMBER:
+            if self._used_fraction:
+                self._current += num(w)
+            else:
+                self._number = num(w)
+            self._seen_tens = False
+        elif kind == _HUNDRED:
+            if window[-2:-1] and window[-2][1] == _UNIT:
+                raise ValueError(ERR_TWO_UNITS)
+            self._current += value
+            self._seen_tens = False
+        elif kind == _TEN:
+            _check_strict(window, len(window) - 1, kind)
+            if self._seen_tens:
+                raise ValueError(ERR_TWO_TENS)
+            self._current += value
+            self._seen_tens = True
+        elif kind == _UNIT:
+            if window[-2:-1] and window[-2][1] == _UNIT:
+                raise ValueError(ERR_TWO_UNITS)
+            self._current += value
+        elif kind == _ORDINAL:
+            if self._window:
+                raise ValueError(ERR_ORDINAL)
+            self._current += value
+        elif kind == _SCALE:
+            _check_strict(window, len(window) - 1, kind)
+            if self._last_scale is not None and value >= self._last_scale:
+                raise ValueError(ERR_SCALE_ORDER)
+            self._last_scale = value
+            self._groups.append((self._current if self._current != 0 else 1, value))
+            self._current = 0
+            self._seen_tens = False
+            self._after_scale = value
+        else:
+            raise ValueError(f"{ERR_UNKNOWN_WORD}: {w}")
+        self._push(tok)
+
+    def _total(self):
+        current = self._current
+        if self._number is not None:
+            current += self._number
+        if self._tail:
+            current += self._num("0." + _parse_decimal_phrase(self._tail))
+        return sum(g*m for g, m in self._groups) + current
+
+    def value(self):
+        """Value of the words accepted so far, ignoring a dangling 'ו' or 'נקודה'."""
+        with _exact_types()[2](self._context) if self._context else nullcontext():
+            return self._num(self._total())
+
+    def finish(self):
+        """Final value of the accepted words; raises ValueError when they do not
+           form a complete phrase (e.g. ending in 'ו' or 'נקודה')."""
+        if self._vav:
+            raise ValueError(f"{ERR_UNKNOWN_WORD}: ו")
+        if self._deferred is not None:
+            self._step(self._deferred)  # raises: it did not become a two-word entry
+        if self._tail is not None and not self._tail:
+            raise ValueError(ERR_DECIMAL_TAIL)
+        return self.value()
@@ -0,0 +1,63 @@
+"""Loading the word lists shared by the Python and JavaScript parsers.
+
+The vocabulary lives in hebrew_number/lexicon.json (units, tens, hundreds, scales,
+fractions, ordinals, misspelling aliases and currency words to skip), which
+JavaScriptParser/parser.js imports as well. Set HEBREW_NUMBER_LEXICON to the
+path of another file with the same layout to replace it.
+
+hebrew_number.parser compiles the file into its lookup tables once. The compiled tables
+are cached with marshal in a __pycache__ directory next to the file, keyed like
+a .pyc by the size and mtime of the file and of the compiler's module, so a warm
+start neither imports json nor recompiles.
+"""
+import marshal
+import os
+import sys
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "lexicon.json")
+_FORMAT = 1
+
+
+def lexicon_path() -> str:
+    return os.environ.get("HEBREW_NUMBER_LEXICON") or DEFAULT_PATH
+
+
+def cache_path(path: str) -> str:
+    head, tail = os.path.split(os.path.abspath(path))
+    return os.path.join(head, "__pycache__", f"{tail}.{sys.implementation.cache_tag}.marshal")
+
+
+def read_lexicon(path: str) -> dict:
+    import json  # only needed when the cache is cold
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _stamp(path: str):
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+
+def load_compiled(compile, path: str = None):
+    """Return compile(read_lexicon(path)), from the on-disk cache when it is current.
+       The result must be marshal-able (dicts, tuples, frozensets, str, int, float)."""
+    path = path or lexicon_path()
+    key = (_FORMAT, _stamp(path), _stamp(compile.__code__.co_filename))
+    cache = cache_path(path)
+    try:
+        with open(cache, "rb") as f:
+            cached_key, compiled = marshal.load(f)
+        if cached_key == key:
+            return compiled
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+    compiled = compile(read_lexicon(path))
+    try:
+        os.makedirs(os.path.dirname(cache), exist_ok=True)
+        tmp = f"{cache}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            marshal.dump((key, compiled), f)
+        os.replace(tmp, cache)
+    except OSError:
+        pass  # read-only install: compile on every start
+    return compiled
@@ -0,0 +1,132 @@
+"""Limits on untrusted input, checked before any real work is done.
+
+    HEBREW_NUMBER_MAX_CHARS=500 HEBREW_NUMBER_MAX_BATCH=100 uvicorn hebrew_number.main:app
+
+    from hebrew_number.limits import enable_limits, set_limits
+    enable_limits()                              # what hebrew_number.main and hebrew_number.fast do
+    set_limits(max_tokens=32, max_digits=None)   # None (or 0 in the environment): no limit
+
+The library applies only the limits set in the environment; the web apps call
+enable_limits(), which fills in DEFAULTS for the rest.
+
+max_chars, max_tokens and max_digits bound a single phrase: parse() rejects a
+longer text before splitting it, _tokenize stops splitting after max_tokens
+words, and digit strings and 'נקודה' tails longer than max_digits are rejected
+before they become huge integers. The errors are ordinary parse errors with
+the codes text_too_long, too_many_words and too_many_digits. max_batch and
+max_body_bytes bound an HTTP request: BodyLimit answers 413 (body_too_large)
+as soon as the declared or streamed body passes max_body_bytes, and the batch
+endpoints answer 413 (batch_too_large) for more than max_batch texts.
+"""
+import os
+
+ERR_BATCH_TOO_LARGE = "יותר מדי טקסטים בבקשה אחת"
+ERR_BODY_TOO_LARGE = "גוף הבקשה גדול מדי"
+
+# applied by enable_limits() to the limits the environment does not set
+DEFAULTS = {
+    "max_chars": 1000,
+    "max_tokens": 100,
+    "max_digits": 100,
+    "max_batch": 1000,
+    "max_body_bytes": 1 << 20,
+}
+
+
+class Limits:
+    """The limits in force; read on every call, so set_limits() applies at once."""
+    __slots__ = tuple(DEFAULTS)
+
+    def __init__(self, **values):
+        for name, value in values.items():
+            setattr(self, name, value)
+
+    def __repr__(self):
+        return f"Limits({', '.join(f'{n}={getattr(self, n)!r}' for n in self.__slots__)})"
+
+
+def _from_env(defaults: dict) -> dict:
+    values = {}
+    for name in DEFAULTS:
+        value = os.environ.get(f"HEBREW_NUMBER_{name.upper()}")
+        values[name] = defaults.get(name) if value is None else (int(value) or None)
+    return values
+
+
+LIMITS = Limits(**_from_env({}))
+
+
+def set_limits(**values) -> Limits:
+    """Change some limits (None or 0 turns one off) and return them all."""
+    for name, value in values.items():
+        if name not in DEFAULTS:
+            raise ValueError(f"unknown limit: {name!r}")
+        if value is not None and (not isinstance(value, int) or value < 0):
+            raise ValueError(f"{name} must be a non-negative int or None")
+        setattr(LIMITS, name, value or None)
+    return LIMITS
+
+
+def enable_limits() -> Limits:
+    """Turn on every limit: from its environment variable, else from DEFAULTS."""
+    return set_limits(**_from_env(DEFAULTS))
+
+
+def reset_limits() -> Limits:
+    """Back to the library state: only the limits set in the environment."""
+    return set_limits(**_from_env({}))
+
+
+def batch_error(count: int):
+    """(message, code) when a batch of `count` texts is over max_batch, else None."""
+    limit = LIMITS.max_batch
+    if limit is not None and count > limit:
+        return f"{ERR_BATCH_TOO_LARGE} (עד {limit})", "batch_too_large"
+    return None
+
+
+async def _reject(send, message: str, code: str):
+    import json
+    body = json.dumps({"error": message, "code": code}, ensure_ascii=False).encode("utf-8")
+    await send({"type": "http.response.start", "status": 413, "headers": [
+        (b"content-type", b"application/json"), (b"content-length", str(len(body)).encode()),
+        (b"connection", b"close")]})
+    await send({"type": "http.response.body", "body": body})
+
+
+class BodyLimit:
+    """ASGI middleware answering 413 once a request body passes max_body_bytes:
+       up front from Content-Length, otherwise while the body streams in. The
+       body is read before the application is called and then replayed to it,
+       so a rejected request never reaches a handler."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        limit = LIMITS.max_body_bytes
+        if scope["type"] != "http" or limit is None:
+            return await self.app(scope, receive, send)
+        error = (f"{ERR_BODY_TOO_LARGE} (עד {limit} בתים)", "body_too_large")
+        for name, value in scope["headers"]:
+            if name == b"content-length" and value.isdigit() and int(value) > limit:
+                return await _reject(send, *error)
+        chunks = []
+        seen = 0
+        while True:
+            message = await receive()
+            if message["type"] != "http.request":
+                return  # the client went away
+            chunk = message.get("body", b"")
+            seen += len(chunk)
+            if seen > limit:
+                return await _reject(send, *error)
+            chunks.append(chunk)
+            if not message.get("more_body"):
+                break
+        replay = [{"type": "http.request", "body": b"".join(chunks), "more_body": False}]
+
+        async def replay_receive():
+            return replay.pop() if replay else await receive()
+
+        await self.app(scope, replay_receive, send)
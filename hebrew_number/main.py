@@ -0,0 +1,65 @@
+from pathlib import Path
+
+from fastapi import FastAPI
+from fastapi.responses import HTMLResponse, PlainTextResponse
+from fastapi.staticfiles import StaticFiles
+from fastapi import Request
+from pydantic import BaseModel
+from hebrew_number.cache import cache_stats
+from hebrew_number import http_cache
+from hebrew_number.limits import BodyLimit, batch_error
+from hebrew_number.metrics import render_metrics
+from hebrew_number.web import (
+    HOME_ETAG, HOME_HTML, cached_response, configure, conversion_response, convert_text_to_number,
+    convert_texts_to_numbers, too_large,
+)
+
+app = FastAPI(
+    title="Hebrew Number Parser API",
+    description="API to convert Hebrew text numbers to decimal numbers",
+    version="1.2"
+)
+
+# input limits for untrusted requests (hebrew_number.limits.DEFAULTS, overridden by HEBREW_NUMBER_MAX_*),
+# plus the opt-in cache and metrics; request bodies over max_body_bytes get a 413 before they
+# reach a handler
+configure()
+app.add_middleware(BodyLimit)
+
+# mount static files (relative to this file, so any working directory works)
+APP_DIR = Path(__file__).resolve().parent
+app.mount("/static", StaticFiles(directory=APP_DIR / "static"), name="static")
+
+class NumberRequest(BaseModel):
+    text: str
+
+class BatchRequest(BaseModel):
+    texts: list[str]
+
+@app.get("/", response_class=HTMLResponse)
+def home(request: Request):
+    return cached_response(HOME_HTML, HOME_ETAG, request.headers.get("if-none-match"),
+                           http_cache.PAGE_CACHE_CONTROL, "text/html; charset=utf-8")
+
+@app.post("/hebrew-number")
+def convert_number_post(req: NumberRequest):
+    return convert_text_to_number(req.text)
+
+@app.post("/hebrew-number/batch")
+def convert_number_batch(req: BatchRequest):
+    error = batch_error(len(req.texts))
+    if error is not None:
+        return too_large(error)
+    return {"results": convert_texts_to_numbers(req.texts)}
+
+@app.get("/hebrew-number")
+def convert_number_get(text: str, request: Request):
+    return conversion_response(text, request.headers.get("if-none-match"))
+
+@app.get("/cache-stats")
+def get_cache_stats():
+    return cache_stats()
+
+@app.get("/metrics", response_class=PlainTextResponse)
+def get_metrics():
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
@@ -0,0 +1,149 @@
+"""Optional hot-path instrumentation, exported in Prometheus text format.
+
+Disabled by default; enable_metrics() turns it on. While disabled an
+instrumented function costs one global lookup and an `is None` test.
+"""
+import bisect
+import functools
+import threading
+import time
+
+from hebrew_number.cache import cache_stats
+from hebrew_number.limits import LIMITS
+
+LATENCY_BUCKETS = (1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 1e-3, 1e-2)
+TOKEN_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128)
+
+
+def error_category(message: str) -> str:
+    from hebrew_number.parser import ERROR_CATEGORIES  # parser imports this module
+    for prefix, category in ERROR_CATEGORIES:
+        if message.startswith(prefix):
+            return category
+    return "other"
+
+
+class Histogram:
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def render(self, name: str, labels: str) -> list:
+        lines = []
+        cumulative = 0
+        for bound, n in zip(self.bounds, self.counts):
+            cumulative += n
+            lines.append(f'{name}_bucket{{{labels},le="{bound:g}"}} {cumulative}')
+        lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {self.count}')
+        lines.append(f"{name}_sum{{{labels}}} {self.sum:.9g}")
+        lines.append(f"{name}_count{{{labels}}} {self.count}")
+        return lines
+
+
+class Metrics:
+    def __init__(self):
+        self.latency = {}  # function -> Histogram
+        self.tokens = Histogram(TOKEN_BUCKETS)
+        self.errors = {}   # (function, category) -> count
+        self._lock = threading.Lock()
+
+    def record(self, function: str, seconds: float, tokens=None, error=None):
+        with self._lock:
+            hist = self.latency.get(function)
+            if hist is None:
+                hist = self.latency[function] = Histogram(LATENCY_BUCKETS)
+            hist.observe(seconds)
+            if tokens is not None:
+                self.tokens.observe(tokens)
+            if error is not None:
+                key = (function, error_category(error))
+                self.errors[key] = self.errors.get(key, 0) + 1
+
+    def render(self) -> list:
+        with self._lock:
+            lines = [
+                "# HELP hebrew_number_latency_seconds Call latency.",
+                "# TYPE hebrew_number_latency_seconds histogram",
+            ]
+            for function, hist in sorted(self.latency.items()):
+                lines += hist.render("hebrew_number_latency_seconds", f'function="{function}"')
+            lines += [
+                "# HELP hebrew_number_tokens Words per parsed phrase.",
+                "# TYPE hebrew_number_tokens histogram",
+            ]
+            lines += self.tokens.render("hebrew_number_tokens", 'function="hebrew_to_number"')
+            lines += [
+                "# HELP hebrew_number_errors_total Parse errors by category.",
+                "# TYPE hebrew_number_errors_total counter",
+            ]
+            for (function, category), n in sorted(self.errors.items()):
+                lines.append(f'hebrew_number_errors_total{{function="{function}",category="{category}"}} {n}')
+            return lines
+
+
+_metrics = None
+
+
+def enable_metrics() -> Metrics:
+    """Start recording (resetting any previous counters) and return the registry."""
+    global _metrics
+    _metrics = Metrics()
+    return _metrics
+
+
+def disable_metrics():
+    global _metrics
+    _metrics = None
+
+
+def _words(args, kwargs):
+    """Word count of the text argument, counted after the call and within the
+       phrase limits, so a text the limits reject is not split here either."""
+    text = args[0] if args else kwargs.get("text", "")
+    if LIMITS.max_chars is not None and len(text) > LIMITS.max_chars:
+        return None
+    cap = LIMITS.max_tokens
+    return len(text.replace("־", " ").split(None, cap) if cap else text.replace("־", " ").split())
+
+
+def instrumented(function: str, count_tokens: bool = False):
+    """Decorator recording latency (and optionally the word count) of each call,
+       plus the category of any ValueError it raises."""
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            metrics = _metrics
+            if metrics is None:
+                return fn(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                result = fn(*args, **kwargs)
+            except ValueError as e:
+                seconds = time.perf_counter() - start
+                metrics.record(function, seconds, _words(args, kwargs) if count_tokens else None, str(e))
+                raise
+            seconds = time.perf_counter() - start
+            metrics.record(function, seconds, _words(args, kwargs) if count_tokens else None)
+            return result
+        return wrapper
+    return decorator
+
+
+def render_metrics() -> str:
+    """Text exposition of the call metrics (when enabled) and the cache counters."""
+    lines = _metrics.render() if _metrics is not None else []
+    stats = cache_stats()
+    if stats["enabled"]:
+        for name in ("hits", "misses", "evictions"):
+            lines += [f"# TYPE hebrew_number_cache_{name}_total counter",
+                      f"hebrew_number_cache_{name}_total {stats[name]}"]
+        lines += ["# TYPE hebrew_number_cache_size gauge", f"hebrew_number_cache_size {stats['size']}",
+                  "# TYPE hebrew_number_cache_maxsize gauge", f"hebrew_number_cache_maxsize {stats['maxsize']}"]
+    return "\n".join(lines) + "\n"
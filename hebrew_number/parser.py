@@ -0,0 +1,596 @@
+from types import MappingProxyType
+
+from hebrew_number.cache import cached
+from hebrew_number.lexicon import load_compiled
+from hebrew_number.limits import LIMITS
+from hebrew_number.metrics import error_category, instrumented
+
+# error messages (ERROR_CATEGORIES maps each one to a short category name)
+ERR_TWO_TENS = "ניסוח לא תקין: שתי עשרות ברצף באותו מספר. נסה לנסח מחדש (למשל: 'אלף מאה וחמישים' במקום 'אלף שמונים שבעים')."
+ERR_TENS_ALPAYIM = "ניסוח לא תקין: 'חמישים אלפיים' אינו תקין. כתוב 'חמישים אלף' או 'חמישים ושניים אלף'."
+ERR_DECIMAL_TAIL = "ניסוח לא תקין: אחרי 'נקודה' חייב לבוא ביטוי מספרי (למשל: 'נקודה חמש' / 'נקודה שבע מאות')."
+ERR_REPEATED_FRACTION = "לא ניתן להשתמש בתוספת שבר (חצי/רבע) יותר מפעם אחת בביטוי"
+ERR_SCALE_ORDER = "ניסוח לא תקין: לא ניתן להשתמש בשני מכפילים מאותו סדר גודל או גדול יותר ברצף (למשל 'מיליון מיליון', 'אלף מיליון')."
+ERR_UNKNOWN_WORD = "מילה לא מוכרת"
+ERR_INEXACT_DECIMAL = "לא ניתן לייצג את השבר במדויק כמספר עשרוני (למשל 'שליש'). השתמש ב-mode='fraction' או 'float'."
+ERR_TEXT_TOO_LONG = "הטקסט ארוך מדי"          # limits from hebrew_number.limits
+ERR_TOO_MANY_WORDS = "יותר מדי מילים בביטוי"
+ERR_TOO_MANY_DIGITS = "יותר מדי ספרות במספר"
+ERR_TWO_UNITS = "ניסוח לא תקין: אחרי יחידה לא יכולות לבוא יחידה נוספת או מאות. נסה לנסח מחדש (למשל: 'מאה עשרים ושלוש' במקום 'מאה עשרים שלוש ארבע')."
+ERR_REPEATED_POINT = "ניסוח לא תקין: 'נקודה' יכולה להופיע רק פעם אחת בביטוי"
+ERR_ORDINAL = "מספר סודר (למשל 'שלישי') מתקבל רק כביטוי שלם, לא כחלק ממספר"
+ERROR_CATEGORIES = (
+    (ERR_TWO_TENS, "two_tens"),
+    (ERR_TENS_ALPAYIM, "tens_alpayim"),
+    (ERR_DECIMAL_TAIL, "decimal_tail"),
+    (ERR_REPEATED_FRACTION, "repeated_fraction"),
+    (ERR_SCALE_ORDER, "scale_order"),
+    (ERR_UNKNOWN_WORD, "unknown_word"),
+    (ERR_INEXACT_DECIMAL, "inexact_decimal"),
+    (ERR_TEXT_TOO_LONG, "text_too_long"),
+    (ERR_TOO_MANY_WORDS, "too_many_words"),
+    (ERR_TOO_MANY_DIGITS, "too_many_digits"),
+    (ERR_TWO_UNITS, "two_units"),
+    (ERR_REPEATED_POINT, "repeated_point"),
+    (ERR_ORDINAL, "ordinal"),
+)
+
+# token kinds assigned by _tokenize
+_UNIT, _TEN, _HUNDRED, _SCALE, _FRACTION, _POINT, _VAV, _NUMBER, _WORD, _ALPAYIM, _ORDINAL = range(11)
+_TWO_WORDS = frozenset(("שניים", "שתיים", "שני"))
+
+class _Ratio(float):
+    """Value of a fraction word with no exact float ('שליש'): behaves as the
+       nearest float, but keeps the exact ratio for mode="fraction"."""
+
+    def __new__(cls, numerator: int, denominator: int):
+        self = super().__new__(cls, numerator / denominator)
+        self.ratio = (numerator, denominator)
+        return self
+
+    def as_integer_ratio(self):
+        return self.ratio
+
+    def __repr__(self):
+        return "%d/%d" % self.ratio
+
+def _fraction_value(text: str):
+    """'1/2' -> 0.5; a ratio with no exact float stays an (n, d) tuple until load."""
+    n, _, d = text.partition("/")
+    n, d = int(n), int(d or 1)
+    return n / d if d & (d - 1) == 0 else (n, d)
+
+def _compile_lexicon(data: dict) -> dict:
+    """Build the token lookup tables from the lexicon file (hebrew_number/lexicon.py caches
+       the result on disk). Every word maps to a ready token (word, kind, value,
+       has_vav); its 'ו'-prefixed form is a separate key, so classifying a token is
+       a single dict lookup. Two-word entries ('שלוש מאות', 'שלושת רבעי', 'שנים עשר')
+       live in a trie keyed by their first word, a unit or a word that is not a
+       number on its own."""
+    tables = {name: dict(data.get(name, {})) for name in ("units", "tens", "hundreds", "scales", "ordinals")}
+    tables["fractions"] = {w: _fraction_value(v) for w, v in data.get("fractions", {}).items()}
+    base = {}
+    for name, kind in (("units", _UNIT), ("tens", _TEN), ("scales", _SCALE), ("fractions", _FRACTION)):
+        for word, value in tables[name].items():
+            if " " not in word:
+                base[word] = (word, kind, value)
+    for word, value in tables["ordinals"].items():
+        if not 0 < value <= 10:
+            raise ValueError(f"lexicon: ordinal out of range: {word}")
+        base.setdefault(word, (word, _ORDINAL, value))
+    for word, value in tables["hundreds"].items():
+        if " " not in word:
+            base[word] = (word, _HUNDRED, value)
+    trie = {}
+    for name, kind in (("tens", _TEN), ("hundreds", _HUNDRED), ("fractions", _FRACTION)):
+        for phrase, value in tables[name].items():
+            first, *rest = phrase.split()
+            if not rest:
+                continue
+            if len(rest) != 1 or base.get(first, (first, _WORD))[1] not in (_UNIT, _WORD):
+                raise ValueError(f"lexicon: multi-word entries must be a unit or a new word and one more word: {phrase}")
+            trie.setdefault(first, {})[rest[0]] = (kind, value)
+            base.setdefault(first, (first, _WORD, None))  # 'שנים' of 'שנים עשר' is no number alone
+            base.setdefault(rest[0], (rest[0], _WORD, None))
+    for alias, word in data.get("aliases", {}).items():
+        if word not in base:
+            raise ValueError(f"lexicon: alias of an unknown word: {alias} -> {word}")
+        base.setdefault(alias, base[word])  # keeps the canonical word, so the trie applies
+    base["נקודה"] = ("נקודה", _POINT, None)
+    base["ו"] = ("ו", _VAV, None)
+    base["אלפיים"] = ("אלפיים", _ALPAYIM, None)
+    lexicon = {}
+    for raw, (w, kind, value) in base.items():
+        lexicon[raw] = (w, kind, value, False)
+    for raw, (w, kind, value) in base.items():
+        lexicon.setdefault("ו" + raw, (w, kind, value, True))
+    skip = frozenset(data.get("skip", ())) | frozenset("ו" + w for w in data.get("skip", ()))
+    return {"tables": tables, "lexicon": lexicon, "trie": trie, "skip": skip - lexicon.keys()}
+
+def _load_lexicon():
+    compiled = load_compiled(_compile_lexicon)
+    def ratio(value):
+        return _Ratio(*value) if type(value) is tuple else value
+    tables = compiled["tables"]
+    tables["fractions"] = {w: ratio(v) for w, v in tables["fractions"].items()}
+    lexicon = {raw: (t[0], t[1], ratio(t[2]), t[3]) if t[1] == _FRACTION else t
+               for raw, t in compiled["lexicon"].items()}
+    trie = {first: {rest: (kind, ratio(value)) for rest, (kind, value) in node.items()}
+            for first, node in compiled["trie"].items()}
+    return tables, lexicon, trie, compiled["skip"]
+
+_tables, _LEXICON, _PHRASE_TRIE, _SKIP = _load_lexicon()
+# public word tables are read-only views, so callers cannot change the grammar under
+# running threads; edit hebrew_number/lexicon.json to extend them
+hebrew_units = MappingProxyType(_tables["units"])
+hebrew_tens = MappingProxyType(_tables["tens"])
+hebrew_hundreds = MappingProxyType(_tables["hundreds"])
+scales = MappingProxyType(_tables["scales"])
+fractions_map = MappingProxyType(_tables["fractions"])
+ordinals_map = MappingProxyType(_tables["ordinals"])
+del _tables
+_ALPAYIM_TOKENS = (("שניים", _UNIT, 2, False), ("אלפים", _SCALE, 1000, False))
+
+def _is_number_token(tok: str) -> bool:
+    whole, dot, frac = tok.partition(".")
+    return whole.isdecimal() and (not dot or frac.isdecimal())
+
+def _unknown_token(raw: str):
+    """Token for a word missing from the lexicon: a digit string or an unknown word."""
+    hv = raw.startswith("ו") and len(raw) > 1
+    word = raw[1:] if hv else raw
+    return (word, _NUMBER if _is_number_token(word) else _WORD, None, hv)
+
+def _tokenize(text: str):
+    """Split and classify in one pass; returns a list of (word, kind, value, has_vav).
+       'ו' prefixes are stripped, 'אלפיים' expands to 'שניים אלפים', skip words
+       (currency) are dropped and two-word entries are merged into a single token.
+       Splitting stops after LIMITS.max_tokens words (ERR_TOO_MANY_WORDS)."""
+    limit = LIMITS.max_tokens
+    if limit is None:
+        return _tokens(text.replace("־", " ").split())
+    words = text.replace("־", " ").split(None, limit)
+    if len(words) > limit:
+        raise ValueError(f"{ERR_TOO_MANY_WORDS} (עד {limit})")
+    return _tokens(words)
+
+def _tokens(words):
+    """Tokens of already split words (see _tokenize)."""
+    tokens = []
+    pending = None  # trie node of the previous token, if it can start a two-word entry
+    for raw in words:
+        tok = _LEXICON.get(raw)
+        if tok is None:
+            if raw in _SKIP:
+                continue
+            tok = _unknown_token(raw)
+            if tok[1] == _NUMBER:
+                _check_digits(tok[0], len(tokens))
+        word, kind = tok[0], tok[1]
+        if pending is not None and word in pending:
+            prev = tokens[-1]
+            kind, value = pending[word]
+            tokens[-1] = (f"{prev[0]} {word}", kind, value, prev[3])
+            pending = None
+            continue
+        if kind == _ALPAYIM:
+            tokens.extend(_ALPAYIM_TOKENS)
+            pending = None
+            continue
+        tokens.append(tok)
+        pending = _PHRASE_TRIE.get(word) if kind == _UNIT or kind == _WORD else None
+    return tokens
+
+def _check_digits(word: str, position=None):
+    """ERR_TOO_MANY_DIGITS for a digit string over LIMITS.max_digits."""
+    limit = LIMITS.max_digits
+    if limit is not None and len(word) - ("." in word) > limit:
+        raise _fail(f"{ERR_TOO_MANY_DIGITS} (עד {limit})", position)
+
+def normalize_text(text: str) -> str:
+    """Canonical spelling of a phrase: maqaf treated as a space, whitespace collapsed."""
+    return " ".join(text.replace("־", " ").split())
+
+def _fail(message: str, position: int) -> ValueError:
+    """ValueError for the token at `position`; parse() reports it as ParseResult.position."""
+    error = ValueError(message)
+    error.position = position
+    return error
+
+def _check_strict(tokens, i: int, kind: int):
+    """Strictness checks for the token at i against the ones before it:
+       two tens in a row ('שמונים שבעים', 'שמונים ו שבעים') and tens before
+       'אלפיים' ('חמישים אלפיים')."""
+    if kind == _TEN:
+        if i and (tokens[i-1][1] == _TEN or (i > 1 and tokens[i-1][1] == _VAV and tokens[i-2][1] == _TEN)):
+            raise _fail(ERR_TWO_TENS, i)
+    elif i > 1 and tokens[i][0] == "אלפים" and tokens[i-1][0] in _TWO_WORDS and tokens[i-2][1] == _TEN:
+        raise _fail(ERR_TENS_ALPAYIM, i)
+
+def _scan_decimal_tail(tokens, i: int, n: int):
+    """Consume the tail after 'נקודה' starting at tokens[i] in a single pass.
+       Returns (digits, end) where end is the index of the first token not in the tail:
+       - without tens/hundreds/אלף the tokens are a digit sequence: 'אפס שבע' -> "07".
+       - otherwise the phrase is interpreted as an integer ('שבע מאות ושבע' -> "707").
+       The digits are then used as fractional digits: 0.<digits>"""
+    digits = []      # digit strings, while no magnitude has been seen
+    val = group = 0  # integer interpretation, once one has
+    j = i
+    while j < n:
+        word, kind, value, _ = tokens[j]
+        if kind == _UNIT or (kind == _NUMBER and word.isdecimal()):
+            if digits is not None:
+                digits.append(word if kind == _NUMBER else str(value))
+            elif kind == _UNIT:
+                group += value
+            else:
+                group = group * (10 ** len(word)) + int(word)
+        elif kind == _TEN or kind == _HUNDRED or (kind == _SCALE and value == 1000):
+            _check_strict(tokens, j, kind)
+            if digits is not None:
+                # first magnitude: fold the digits seen so far into the integer
+                for k in range(i, j):
+                    w, kd, v, _ = tokens[k]
+                    group = group * (10 ** len(w)) + int(w) if kd == _NUMBER else group + v
+                digits = None
+            if kind == _SCALE:
+                val = val * 1000 + (group or 1) * 1000
+                group = 0
+            else:
+                group += value
+        else:
+            break
+        j += 1
+    if digits is not None:
+        digits = "".join(digits) or "0"
+        _check_digits(digits)
+        return digits, j
+    val += group
+    limit = LIMITS.max_digits
+    if limit is not None and val >= 10 ** limit:
+        raise ValueError(f"{ERR_TOO_MANY_DIGITS} (עד {limit})")
+    return (str(val) if val > 0 else "0"), j
+
+def _parse_decimal_phrase(tokens):
+    """Digits string of a whole 'נקודה' tail (see _scan_decimal_tail)."""
+    return _scan_decimal_tail(tokens, 0, len(tokens))[0]
+
+_exact = None
+
+def _exact_types():
+    """(Decimal, Fraction, localcontext, exact context, decimal num), imported on
+       first use: decimal and fractions make up most of this module's import time.
+       The decimal num is Decimal, except that a _Ratio fraction converts exactly
+       or raises ERR_INEXACT_DECIMAL."""
+    global _exact
+    if _exact is None:
+        from decimal import Context, Decimal, MAX_PREC, localcontext
+        from fractions import Fraction
+
+        def to_decimal(value):
+            if type(value) is not _Ratio:
+                return Decimal(value)
+            n, d = value.ratio
+            rest = d
+            for p in (2, 5):
+                while rest % p == 0:
+                    rest //= p
+            if rest != 1:
+                raise ValueError(ERR_INEXACT_DECIMAL)
+            return Decimal(n) / Decimal(d)  # terminates, so exact under the context
+
+        _exact = (Decimal, Fraction, localcontext, Context(prec=MAX_PREC), to_decimal)  # Decimal sums never round
+    return _exact
+
+class ParseResult:
+    """Outcome of parse(): the value, or the error message with its category
+       (`code`, as in ERROR_CATEGORIES) and the index of the offending token
+       (`position`, None when no single token is at fault). `spans` are the
+       (start, end) character offsets of the tokens in `text`, computed on
+       first access."""
+    __slots__ = ("text", "value", "error", "code", "position", "_spans")
+
+    def __init__(self, text: str, value=None, error: str = None, code: str = None, position: int = None):
+        self.text = text
+        self.value = value
+        self.error = error
+        self.code = code
+        self.position = position
+        self._spans = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    @property
+    def spans(self) -> list:
+        if self._spans is None:
+            self._spans = _token_spans(self.text)
+        return self._spans
+
+    @property
+    def error_span(self):
+        """(start, end) of the offending token, or None."""
+        return self.spans[self.position] if self.position is not None else None
+
+    def __repr__(self):
+        if self.error is None:
+            return f"ParseResult(value={self.value!r})"
+        return f"ParseResult(code={self.code!r}, position={self.position!r}, error={self.error!r})"
+
+def _token_spans(text: str):
+    """Character span of each token _tokenize(text) returns: a merged two-word
+       entry spans both words, and both tokens of 'אלפיים' span the word."""
+    import re
+    spans = []
+    pending = None
+    for m in re.finditer(r"[^\s־]+", text):
+        raw = m.group()
+        tok = _LEXICON.get(raw)
+        if tok is None:
+            if raw in _SKIP:
+                continue
+            tok = _unknown_token(raw)
+        if pending is not None and tok[0] in pending:
+            spans[-1] = (spans[-1][0], m.end())
+            pending = None
+            continue
+        spans.append(m.span())
+        if tok[1] == _ALPAYIM:
+            spans.append(m.span())
+        pending = _PHRASE_TRIE.get(tok[0]) if tok[1] == _UNIT or tok[1] == _WORD else None
+    return spans
+
+def _too_long(text: str):
+    """ERR_TEXT_TOO_LONG for a text over LIMITS.max_chars, else None."""
+    limit = LIMITS.max_chars
+    if limit is not None and len(text) > limit:
+        return f"{ERR_TEXT_TOO_LONG} (עד {limit} תווים)"
+    return None
+
+def _cache_key(text: str):
+    # the phrase limits can turn an answer into an error, so an entry holds only under them
+    return normalize_text(text), LIMITS.max_chars, LIMITS.max_tokens, LIMITS.max_digits
+
+def parse(text: str, mode: str = "float", backend: str = "loop", fuzzy: int = 0) -> ParseResult:
+    """Like hebrew_to_number, but returns a ParseResult instead of raising on a
+       phrase that does not parse (invalid arguments still raise ValueError)."""
+    if mode not in ("float", "decimal", "fraction"):
+        raise ValueError(f"unknown mode: {mode!r}")
+    evaluate = _evaluate if backend == "loop" else _backend(backend)
+    message = _too_long(text)
+    if message is not None:
+        return ParseResult(text, error=message, code="text_too_long")
+    converted = text
+    try:
+        return ParseResult(text, _convert(text, mode, evaluate))
+    except ValueError as e:
+        error = e
+    if fuzzy and str(error).startswith(ERR_UNKNOWN_WORD):
+        # retry with each unknown word replaced by its nearest lexicon word
+        from hebrew_number.fuzzy import correct_text  # builds the index on first use
+        fixed = correct_text(text, fuzzy)
+        if fixed != normalize_text(text):
+            converted = fixed
+            try:
+                return ParseResult(text, _convert(fixed, mode, evaluate))
+            except ValueError as e:
+                error = e
+    message = str(error)
+    position = getattr(error, "position", None)
+    if message == ERR_INEXACT_DECIMAL:
+        # raised while converting the first fraction with no exact decimal; the
+        # fuzzy retry may have made it, so look in the text that was converted
+        position = next((k for k, tok in enumerate(_tokenize(converted)) if type(tok[2]) is _Ratio), None)
+    return ParseResult(text, error=message, code=error_category(message), position=position)
+
+@instrumented("hebrew_to_number", count_tokens=True)
+def hebrew_to_number(text: str, mode: str = "float", backend: str = "loop", fuzzy: int = 0):
+    """Convert a Hebrew number phrase to a number; raises ValueError when it does
+       not parse (parse() returns the error instead, with its token position).
+       mode="float" (default) returns a float; mode="decimal" / "fraction" return an
+       exact decimal.Decimal / fractions.Fraction.
+       backend="loop" (default) runs the hand-written parse loop; backend="dfa" runs
+       the same grammar compiled into a transition table (hebrew_number.dfa).
+       fuzzy=n (opt-in) retries a phrase that fails on an unknown word with each
+       unknown word replaced by the nearest lexicon word within n edits (hebrew_number.fuzzy);
+       phrases that parse as they are take the same path as without it."""
+    message = _too_long(text)  # before the cache: padding does not change the normalized key
+    if message is not None:
+        raise ValueError(message)
+    return _cached_conversion(text, mode, backend, fuzzy)
+
+@cached("hebrew_to_number", key=_cache_key)
+def _cached_conversion(text: str, mode: str, backend: str, fuzzy: int):
+    result = parse(text, mode, backend, fuzzy)
+    if result.error is not None:
+        raise ValueError(result.error)
+    return result.value
+
+def _convert(text: str, mode: str, evaluate):
+    if mode == "float":
+        return float(evaluate(text, float))
+    if mode == "decimal":
+        Decimal, _, localcontext, context, to_decimal = _exact_types()
+        with localcontext(context):
+            return Decimal(evaluate(text, to_decimal))
+    Fraction = _exact_types()[1]
+    return Fraction(evaluate(text, Fraction))
+
+def _backend(name: str):
+    if name == "dfa":
+        from hebrew_number.dfa import evaluate  # compiles the tables on first use
+        return evaluate
+    raise ValueError(f"unknown backend: {name!r}")
+
+def _evaluate(text: str, num):
+    """Parse and evaluate a phrase in one left-to-right pass that also enforces
+       the strictness rules. Whole parts accumulate as int; only number tokens,
+       fractions and decimal tails go through `num`, so phrases without a
+       fractional part never leave integer arithmetic."""
+    return _evaluate_tokens(_tokenize(text), num)
+
+def _evaluate_tokens(tokens, num):
+    """_evaluate of a token list (callers that tokenize themselves, e.g. hebrew_number.compound)."""
+    n = len(tokens)
+    i = 0
+    groups = []  # list of (value, multiplier)
+    current_group = 0
+    used_fraction = False
+    used_point = False
+    seen_tens_in_segment = False  # reset on scales
+    last_scale_value = None
+
+    while i < n:
+        w, kind, value, _ = tokens[i]
+
+        # an ordinal is a number only on its own: 'שלישי', but not 'מאה שלישי' or 'ביום שלישי'
+        if kind == _ORDINAL:
+            if n > 1:
+                raise _fail(ERR_ORDINAL, i)
+            return value
+
+        # decimal point
+        if kind == _POINT:
+            if used_point:
+                raise _fail(ERR_REPEATED_POINT, i)
+            used_point = True
+            digits, j = _scan_decimal_tail(tokens, i + 1, n)
+            if j == i + 1:
+                raise _fail(ERR_DECIMAL_TAIL, i)
+            current_group += num("0." + digits)
+            i = j
+            continue
+
+        # separate 'ו חצי' / 'ו רבע'
+        if kind == _VAV and i + 1 < n and tokens[i+1][1] == _FRACTION:
+            if used_fraction:
+                raise _fail(ERR_REPEATED_FRACTION, i + 1)
+            frac = num(tokens[i+1][2])
+            if current_group > 0:
+                current_group += frac
+            elif groups:
+                # attach to last scale
+                last_mult = groups[-1][1]
+                groups.append((frac, last_mult))
+            else:
+                current_group += frac
+            used_fraction = True
+            i += 2
+            continue
+
+        # standalone 'חצי' / 'רבע'
+        if kind == _FRACTION:
+            if used_fraction:
+                raise _fail(ERR_REPEATED_FRACTION, i)
+            current_group += num(value)
+            used_fraction = True
+            i += 1
+            continue
+
+        # numeric token
+        if kind == _NUMBER:
+            number = num(w)
+            # optionally followed by 'ו חצי/חצי' etc.
+            if i + 2 < n and tokens[i+1][1] == _VAV and tokens[i+2][1] == _FRACTION and not used_fraction:
+                number += num(tokens[i+2][2])
+                used_fraction = True
+                i += 3
+            elif i + 1 < n and tokens[i+1][1] == _FRACTION and not used_fraction:
+                number += num(tokens[i+1][2])
+                used_fraction = True
+                i += 2
+            else:
+                i += 1
+            current_group += number
+            seen_tens_in_segment = False
+            continue
+
+        # hundreds (two-word forms are merged by the tokenizer)
+        if kind == _HUNDRED:
+            if i and tokens[i-1][1] == _UNIT:
+                raise _fail(ERR_TWO_UNITS, i)  # 'שלוש מאה'
+            current_group += value
+            i += 1
+            seen_tens_in_segment = False
+            continue
+
+        # tens
+        if kind == _TEN:
+            _check_strict(tokens, i, kind)
+            if seen_tens_in_segment:
+                raise _fail(ERR_TWO_TENS, i)
+            current_group += value
+            i += 1
+            seen_tens_in_segment = True
+            continue
+
+        # units: one per number, a teen's comes before its ten ('שלוש עשרה')
+        if kind == _UNIT:
+            if i and tokens[i-1][1] == _UNIT:
+                raise _fail(ERR_TWO_UNITS, i)  # 'שלוש ארבע'
+            current_group += value
+            i += 1
+            continue
+
+        # scales
+        if kind == _SCALE:
+            _check_strict(tokens, i, kind)
+            mult = value
+            # enforce descending order of scales: once a scale is used, following scales must be strictly smaller
+            if last_scale_value is not None and mult >= last_scale_value:
+                raise _fail(ERR_SCALE_ORDER, i)
+            last_scale_value = mult
+            group_val = current_group if current_group != 0 else 1
+            groups.append((group_val, mult))
+            current_group = 0
+            seen_tens_in_segment = False
+
+            # attached 'ו' fraction after scale (e.g., 'מיליון וחצי' or 'מיליון ו חצי')
+            if i + 2 < n and tokens[i+1][1] == _VAV and tokens[i+2][1] == _FRACTION:
+                if used_fraction:
+                    raise _fail(ERR_REPEATED_FRACTION, i + 2)
+                groups.append((num(tokens[i+2][2]), mult))
+                used_fraction = True
+                i += 3
+                continue
+            if i + 1 < n and tokens[i+1][3] and tokens[i+1][1] == _FRACTION:
+                if used_fraction:
+                    raise _fail(ERR_REPEATED_FRACTION, i + 1)
+                groups.append((num(tokens[i+1][2]), mult))
+                used_fraction = True
+                i += 2
+                continue
+
+            i += 1
+            continue
+
+        if kind == _VAV and i + 1 < n and tokens[i+1][1] == _TEN:
+            _check_strict(tokens, i + 1, _TEN)  # 'שמונים ו שבעים'
+        raise _fail(f"{ERR_UNKNOWN_WORD}: {w}", i)
+
+    return sum(g*m for g, m in groups) + current_group
+
+def _convert_chunk(texts, mode: str):
+    results = []
+    for text in texts:
+        try:
+            results.append((hebrew_to_number(text, mode), None))
+        except ValueError as e:
+            results.append((None, str(e)))
+    return results
+
+def hebrew_to_numbers(texts, mode: str = "float", workers: int = 1, chunk_size: int = 1000):
+    """Batch variant of hebrew_to_number.
+       Returns a list of (number, error) pairs in input order; a phrase that fails
+       parsing yields (None, message) instead of aborting the whole batch.
+       workers > 1 converts chunks of chunk_size phrases on a thread pool. That only
+       scales on a free-threaded (no-GIL) CPython build; under the GIL it is a bit
+       slower than workers=1 (use hebrew_number.cli --workers for processes)."""
+    if workers <= 1:
+        return _convert_chunk(texts, mode)
+    from concurrent.futures import ThreadPoolExecutor
+    texts = list(texts)
+    chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return [result for chunk in pool.map(_convert_chunk, chunks, [mode] * len(chunks)) for result in chunk]
@@ -0,0 +1,272 @@
+const lexicon={"units":{"אפס":0,"אחת":1,"אחד":1,"שתיים":2,"שניים":2,"שתי":2,"שני":2,"שלוש":3,"שלושה":3,"שלושת":3,"ארבע":4,"ארבעה":4,"ארבעת":4,"חמש":5,"חמישה":5,"חמשת":5,"שש":6,"שישה":6,"ששת":6,"שבע":7,"שבעה":7,"שבעת":7,"שמונה":8,"שמונת":8,"תשע":9,"תשעה":9,"תשעת":9},"tens":{"עשר":10,"עשרה":10,"עשרת":10,"שנים עשר":12,"שתים עשרה":12,"עשרים":20,"שלשים":30,"שלושים":30,"ארבעים":40,"חמישים":50,"שישים":60,"שבעים":70,"שמונים":80,"תשעים":90},"hundreds":{"מאה":100,"מאתיים":200,"מאתים":200,"שלוש מאות":300,"שלושה מאות":300,"ארבע מאות":400,"חמש מאות":500,"שש מאות":600,"שבע מאות":700,"שמונה מאות":800,"תשע מאות":900},"scales":{"אלף":1000,"אלפים":1000,"מיליון":1000000,"מליון":1000000,"מיליארד":1000000000,"מליארד":1000000000,"טריליון":1000000000000},"fractions":{"חצי":"1/2","רבע":"1/4","שליש":"1/3","שלושת רבעי":"3/4"},"ordinals":{"ראשון":1,"ראשונה":1,"שנייה":2,"שלישי":3,"רביעי":4,"חמישי":5,"שישי":6,"שביעי":7,"שמיני":8,"תשיעי":9,"עשירי":10},"aliases":{"שלש":"שלוש","שלשה":"שלושה","שלשת":"שלושת","חמשה":"חמישה","ששה":"שישה","ששים":"שישים","טרליון":"טריליון"},"skip":["שקל","שקלים","ש\"ח","₪","דולר","דולרים","אירו","יורו"]};
+const ERR_TWO_TENS="ניסוח לא תקין: שתי עשרות ברצף באותו מספר. נסה לנסח מחדש (למשל: 'אלף מאה וחמישים' במקום 'אלף שמונים שבעים').";
+const ERR_TENS_ALPAYIM="ניסוח לא תקין: 'חמישים אלפיים' אינו תקין. כתוב 'חמישים אלף' או 'חמישים ושניים אלף'.";
+const ERR_DECIMAL_TAIL="ניסוח לא תקין: אחרי 'נקודה' חייב לבוא ביטוי מספרי (למשל: 'נקודה חמש' / 'נקודה שבע מאות').";
+const ERR_REPEATED_FRACTION="לא ניתן להשתמש בתוספת שבר (חצי/רבע) יותר מפעם אחת בביטוי";
+const ERR_SCALE_ORDER="ניסוח לא תקין: לא ניתן להשתמש בשני מכפילים מאותו סדר גודל או גדול יותר ברצף (למשל 'מיליון מיליון', 'אלף מיליון').";
+const ERR_UNKNOWN_WORD="מילה לא מוכרת";
+const ERR_TWO_UNITS="ניסוח לא תקין: אחרי יחידה לא יכולות לבוא יחידה נוספת או מאות. נסה לנסח מחדש (למשל: 'מאה עשרים ושלוש' במקום 'מאה עשרים שלוש ארבע').";
+const ERR_REPEATED_POINT="ניסוח לא תקין: 'נקודה' יכולה להופיע רק פעם אחת בביטוי";
+const ERR_ORDINAL="מספר סודר (למשל 'שלישי') מתקבל רק כביטוי שלם, לא כחלק ממספר";
+const ERROR_CATEGORIES=[
+[ERR_TWO_TENS,"two_tens"],
+[ERR_TENS_ALPAYIM,"tens_alpayim"],
+[ERR_DECIMAL_TAIL,"decimal_tail"],
+[ERR_REPEATED_FRACTION,"repeated_fraction"],
+[ERR_SCALE_ORDER,"scale_order"],
+[ERR_UNKNOWN_WORD,"unknown_word"],
+[ERR_TWO_UNITS,"two_units"],
+[ERR_REPEATED_POINT,"repeated_point"],
+[ERR_ORDINAL,"ordinal"],
+];
+const UNIT=0,TEN=1,HUNDRED=2,SCALE=3,FRACTION=4,POINT=5,VAV=6,NUMBER=7,WORD=8,ALPAYIM=9,ORDINAL=10;
+const TWO_WORDS=new Set(["שניים","שתיים","שני"]);
+const ALPAYIM_TOKENS=[["שניים",UNIT,2,false],["אלפים",SCALE,1000,false]];
+function fractionValue(ratio){
+const[n,d="1"]=ratio.split("/");
+return Number(n)/Number(d);
+}
+function compileLexicon(data){
+const base=new Map();
+const fractions=Object.fromEntries(Object.entries(data.fractions??{}).map(([w,r])=>[w,fractionValue(r)]));
+for(const[table,kind]of[[data.units,UNIT],[data.tens,TEN],[data.scales,SCALE],[fractions,FRACTION]]){
+for(const[word,value]of Object.entries(table??{})){
+if(!word.includes(" "))base.set(word,[word,kind,value]);
+}
+}
+for(const[word,value]of Object.entries(data.ordinals??{})){
+if(!base.has(word))base.set(word,[word,ORDINAL,value]);
+}
+for(const[word,value]of Object.entries(data.hundreds??{})){
+if(!word.includes(" "))base.set(word,[word,HUNDRED,value]);
+}
+const trie=new Map();
+for(const[table,kind]of[[data.tens,TEN],[data.hundreds,HUNDRED],[fractions,FRACTION]]){
+for(const[phrase,value]of Object.entries(table??{})){
+const[first,second]=phrase.split(" ");
+if(second===undefined)continue;
+if(!trie.has(first))trie.set(first,new Map());
+trie.get(first).set(second,[kind,value]);
+if(!base.has(first))base.set(first,[first,WORD,null]);
+if(!base.has(second))base.set(second,[second,WORD,null]);
+}
+}
+for(const[alias,word]of Object.entries(data.aliases??{})){
+if(!base.has(alias))base.set(alias,base.get(word));
+}
+base.set("נקודה",["נקודה",POINT,null]);
+base.set("ו",["ו",VAV,null]);
+base.set("אלפיים",["אלפיים",ALPAYIM,null]);
+const words=new Map();
+for(const[raw,[w,kind,value]]of base)words.set(raw,[w,kind,value,false]);
+for(const[raw,[w,kind,value]]of base){
+if(!words.has("ו"+raw))words.set("ו"+raw,[w,kind,value,true]);
+}
+const skip=new Set([...(data.skip??[]),...(data.skip??[]).map(w=>"ו"+w)].filter(w=>!words.has(w)));
+return{words,trie,skip};
+}
+const{words:LEXICON,trie:PHRASE_TRIE,skip:SKIP}=compileLexicon(lexicon);
+function isNumberToken(tok){return/^\d+(?:\.\d+)?$/.test(tok);}
+function unknownToken(raw){
+const hv=raw.startsWith("ו")&&raw.length>1;
+const word=hv?raw.slice(1):raw;
+return[word,isNumberToken(word)?NUMBER:WORD,null,hv];
+}
+function fail(message,position){
+const error=new Error(message);
+error.code=(ERROR_CATEGORIES.find(([prefix])=>message.startsWith(prefix))??[null,"other"])[1];
+error.position=position;
+return error;
+}
+function tokenize(text){
+const tokens=[];
+let pending=null;
+for(const raw of text.replace(/־/g," ").split(/\s+/)){
+if(!raw)continue;
+let tok=LEXICON.get(raw);
+if(tok===undefined){
+if(SKIP.has(raw))continue;
+tok=unknownToken(raw);
+}
+const[word,kind]=tok;
+if(pending!==null&&pending.has(word)){
+const prev=tokens[tokens.length-1];
+const[mergedKind,value]=pending.get(word);
+tokens[tokens.length-1]=[`${prev[0]} ${word}`,mergedKind,value,prev[3]];
+pending=null;
+continue;
+}
+if(kind===ALPAYIM){
+tokens.push(...ALPAYIM_TOKENS);
+pending=null;
+continue;
+}
+tokens.push(tok);
+pending=kind===UNIT||kind===WORD?PHRASE_TRIE.get(word)??null:null;
+}
+return tokens;
+}
+function checkStrict(tokens,i,kind){
+if(kind===TEN){
+if(i&&(tokens[i-1][1]===TEN||(i>1&&tokens[i-1][1]===VAV&&tokens[i-2][1]===TEN))){
+throw fail(ERR_TWO_TENS,i);
+}
+}else if(i>1&&tokens[i][0]==="אלפים"&&TWO_WORDS.has(tokens[i-1][0])&&tokens[i-2][1]===TEN){
+throw fail(ERR_TENS_ALPAYIM,i);
+}
+}
+const isDigits=word=>/^\d+$/.test(word);
+function scanDecimalTail(tokens,i,n){
+let digits=[];
+let val=0n,group=0n;
+let j=i;
+for(;j<n;j++){
+const[word,kind,value]=tokens[j];
+if(kind===UNIT||(kind===NUMBER&&isDigits(word))){
+if(digits!==null)digits.push(kind===NUMBER?word:String(value));
+else if(kind===UNIT)group+=BigInt(value);
+else group=group*10n**BigInt(word.length)+BigInt(word);
+}else if(kind===TEN||kind===HUNDRED||(kind===SCALE&&value===1000)){
+checkStrict(tokens,j,kind);
+if(digits!==null){
+for(let k=i;k<j;k++){
+const[w,kd,v]=tokens[k];
+group=kd===NUMBER?group*10n**BigInt(w.length)+BigInt(w):group+BigInt(v);
+}
+digits=null;
+}
+if(kind===SCALE){
+val=val*1000n+(group||1n)*1000n;
+group=0n;
+}else{
+group+=BigInt(value);
+}
+}else{
+break;
+}
+}
+if(digits!==null)return[digits.join("")||"0",j];
+val+=group;
+return[val>0n?String(val):"0",j];
+}
+function evaluate(text){
+const tokens=tokenize(text);
+const n=tokens.length;
+let i=0;
+const groups=[];
+let currentGroup=0;
+let usedFraction=false;
+let usedPoint=false;
+let seenTensInSegment=false;
+let lastScaleValue=null;
+while(i<n){
+const[w,kind,value]=tokens[i];
+if(kind===ORDINAL){
+if(n>1)throw fail(ERR_ORDINAL,i);
+return value;
+}
+if(kind===POINT){
+if(usedPoint)throw fail(ERR_REPEATED_POINT,i);
+usedPoint=true;
+const[digits,j]=scanDecimalTail(tokens,i+1,n);
+if(j===i+1)throw fail(ERR_DECIMAL_TAIL,i);
+currentGroup+=Number("0."+digits);
+i=j;
+continue;
+}
+if(kind===VAV&&i+1<n&&tokens[i+1][1]===FRACTION){
+if(usedFraction)throw fail(ERR_REPEATED_FRACTION,i+1);
+const frac=tokens[i+1][2];
+if(currentGroup>0)currentGroup+=frac;
+else if(groups.length)groups.push([frac,groups[groups.length-1][1]]);
+else currentGroup+=frac;
+usedFraction=true;
+i+=2;
+continue;
+}
+if(kind===FRACTION){
+if(usedFraction)throw fail(ERR_REPEATED_FRACTION,i);
+currentGroup+=value;
+usedFraction=true;
+i+=1;
+continue;
+}
+if(kind===NUMBER){
+let number=Number(w);
+if(i+2<n&&tokens[i+1][1]===VAV&&tokens[i+2][1]===FRACTION&&!usedFraction){
+number+=tokens[i+2][2];
+usedFraction=true;
+i+=3;
+}else if(i+1<n&&tokens[i+1][1]===FRACTION&&!usedFraction){
+number+=tokens[i+1][2];
+usedFraction=true;
+i+=2;
+}else{
+i+=1;
+}
+currentGroup+=number;
+seenTensInSegment=false;
+continue;
+}
+if(kind===HUNDRED){
+if(i&&tokens[i-1][1]===UNIT)throw fail(ERR_TWO_UNITS,i);
+currentGroup+=value;
+i+=1;
+seenTensInSegment=false;
+continue;
+}
+if(kind===TEN){
+checkStrict(tokens,i,kind);
+if(seenTensInSegment)throw fail(ERR_TWO_TENS,i);
+currentGroup+=value;
+i+=1;
+seenTensInSegment=true;
+continue;
+}
+if(kind===UNIT){
+if(i&&tokens[i-1][1]===UNIT)throw fail(ERR_TWO_UNITS,i);
+currentGroup+=value;
+i+=1;
+continue;
+}
+if(kind===SCALE){
+checkStrict(tokens,i,kind);
+const mult=value;
+if(lastScaleValue!==null&&mult>=lastScaleValue)throw fail(ERR_SCALE_ORDER,i);
+lastScaleValue=mult;
+groups.push([currentGroup!==0?currentGroup:1,mult]);
+currentGroup=0;
+seenTensInSegment=false;
+if(i+2<n&&tokens[i+1][1]===VAV&&tokens[i+2][1]===FRACTION){
+if(usedFraction)throw fail(ERR_REPEATED_FRACTION,i+2);
+groups.push([tokens[i+2][2],mult]);
+usedFraction=true;
+i+=3;
+continue;
+}
+if(i+1<n&&tokens[i+1][3]&&tokens[i+1][1]===FRACTION){
+if(usedFraction)throw fail(ERR_REPEATED_FRACTION,i+1);
+groups.push([tokens[i+1][2],mult]);
+usedFraction=true;
+i+=2;
+continue;
+}
+i+=1;
+continue;
+}
+if(kind===VAV&&i+1<n&&tokens[i+1][1]===TEN)checkStrict(tokens,i+1,TEN);
+throw fail(`${ERR_UNKNOWN_WORD}: ${w}`,i);
+}
+return groups.reduce((sum,[g,m])=>sum+g*m,0)+currentGroup;
+}
+export function hebrewToNumber(text){
+return evaluate(text);
+}
+export function parse(text){
+try{
+return{value:evaluate(text)};
+}catch(e){
+if(e.code===undefined)throw e;
+return{error:e.message,code:e.code,position:e.position};
+}
+}
@@ -0,0 +1,67 @@
+"""Column-wise conversion for NumPy arrays and pandas Series.
+
+    values, errors = parse_array(df["amount"].to_numpy())
+    df["number"] = df["amount"].hebrew.to_number()
+
+Inputs are deduplicated first, so each distinct phrase is parsed once and the
+results are scattered back by index. Failures never raise: the value is NaN and
+the error mask is True. Requires numpy; the `.hebrew` Series accessor is
+registered when pandas is installed.
+"""
+import numpy as np
+
+from hebrew_number.parser import hebrew_to_number
+
+try:
+    import pandas as pd
+except ImportError:  # optional: no Series accessor
+    pd = None
+
+
+def _factorize(flat):
+    """Return (codes, uniques) so that flat[i] == uniques[codes[i]]."""
+    if pd is not None:
+        codes, uniques = pd.factorize(flat, use_na_sentinel=False)
+        return codes, list(uniques)
+    index = {}
+    codes = np.fromiter((index.setdefault(v, len(index)) for v in flat), dtype=np.intp, count=len(flat))
+    return codes, list(index)
+
+
+def parse_array(arr):
+    """Convert an array-like of Hebrew number phrases.
+       Returns (values, errors): a float64 array of the input's shape and a bool
+       mask that is True where the element is not a str or failed to parse."""
+    arr = np.asarray(arr, dtype=object)
+    codes, uniques = _factorize(arr.ravel())
+    unique_values = np.full(len(uniques), np.nan)
+    unique_errors = np.ones(len(uniques), dtype=bool)
+    for i, text in enumerate(uniques):
+        if not isinstance(text, str):
+            continue
+        try:
+            unique_values[i] = hebrew_to_number(text)
+        except ValueError:
+            continue
+        unique_errors[i] = False
+    return unique_values[codes].reshape(arr.shape), unique_errors[codes].reshape(arr.shape)
+
+
+if pd is not None:
+    @pd.api.extensions.register_series_accessor("hebrew")
+    class HebrewAccessor:
+        def __init__(self, series):
+            self._series = series
+
+        def to_number(self, errors: str = "coerce"):
+            """Float Series of the converted phrases; errors="coerce" leaves NaN on
+               failures, errors="raise" raises ValueError for the first one."""
+            if errors not in ("coerce", "raise"):
+                raise ValueError(f"unknown errors: {errors!r}")
+            values, mask = parse_array(self._series.to_numpy(dtype=object))
+            if errors == "raise" and mask.any():
+                text = self._series.iloc[mask.argmax()]
+                if isinstance(text, str):
+                    hebrew_to_number(text)  # re-raise the parser's own message
+                raise ValueError(f"לא ניתן להמיר: {text!r}")
+            return pd.Series(values, index=self._series.index, name=self._series.name)
@@ -0,0 +1,103 @@
+"""What the two web apps (hebrew_number.main and hebrew_number.fast) share; importing it builds no app.
+
+Conversion results, the landing page (rendered once, at import), the cached and
+413 responses, and configure(), which applies the server settings.
+"""
+import json
+import os
+from pathlib import Path
+
+from fastapi.responses import JSONResponse, Response
+
+from hebrew_number import http_cache
+from hebrew_number.cache import enable_cache
+from hebrew_number.hebrew_format import number_to_hebrew
+from hebrew_number.limits import enable_limits
+from hebrew_number.metrics import enable_metrics, error_category, instrumented
+from hebrew_number.parser import hebrew_to_number, hebrew_to_numbers
+
+APP_DIR = Path(__file__).resolve().parent
+
+# the UI parses in the browser with the bundle built by JavaScriptParser/build.mjs
+# (a content-hashed file name); without it the page falls back to the API
+try:
+    CLIENT_PARSER = json.loads((APP_DIR / "static" / "hebrew-number.json").read_text())["file"]
+except (OSError, ValueError, KeyError):
+    CLIENT_PARSER = None
+
+# Up to 10 helpful, somewhat complex examples for users to try
+EXAMPLES = [
+    "מיליון וחצי",
+    "מיליארד שלוש מאות מיליון וחצי",
+    "שלוש וחצי מיליון",
+    "מיליון שלוש מאות אלף חמש מאות וחצי",
+    "שבע מאות שמונים ותשע אלף מאתיים שלושים ואחד",
+    "עשרים ושלושה אלף ארבע מאות חמישים ושש",
+    "מאה אלף חצי",
+    "אלף שלוש וחצי",
+    "2.5 מיליארד",
+    "תשע מאות תשעים ותשע מיליון תשע מאות תשעים ותשע אלף תשע מאות תשעים ותשע",
+]
+
+
+def configure():
+    """Server settings: the input limits of hebrew_number.limits, plus the opt-in result cache
+       (e.g. HEBREW_NUMBER_CACHE_SIZE=10000) and /metrics instrumentation
+       (HEBREW_NUMBER_METRICS=1) from the environment."""
+    enable_limits()
+    if os.environ.get("HEBREW_NUMBER_CACHE_SIZE"):
+        enable_cache(int(os.environ["HEBREW_NUMBER_CACHE_SIZE"]))
+    if os.environ.get("HEBREW_NUMBER_METRICS"):
+        enable_metrics()
+
+
+@instrumented("convert_text_to_number")
+def convert_text_to_number(text: str):
+    try:
+        number = hebrew_to_number(text)
+        return {"number": number, "hebrew": number_to_hebrew(number)}
+    except ValueError as e:
+        return {"error": str(e), "code": error_category(str(e))}
+
+
+def convert_texts_to_numbers(texts: list[str]):
+    results = []
+    for number, error in hebrew_to_numbers(texts):
+        if error is not None:
+            results.append({"error": error, "code": error_category(error)})
+        else:
+            results.append({"number": number, "hebrew": number_to_hebrew(number)})
+    return results
+
+
+def render_home() -> bytes:
+    """The landing page; it depends only on EXAMPLES and the client bundle, so it is rendered once."""
+    import jinja2
+    env = jinja2.Environment(loader=jinja2.FileSystemLoader(APP_DIR / "templates"), autoescape=True)
+    return env.get_template("index.html").render(examples=EXAMPLES, client_parser=CLIENT_PARSER).encode("utf-8")
+
+
+def cached_response(body: bytes, tag: str, if_none_match, cache_control: str, media_type: str):
+    """body with ETag/Cache-Control headers, or an empty 304 when the client holds tag."""
+    headers = http_cache.headers(tag, cache_control)
+    if http_cache.not_modified(if_none_match, tag):
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type=media_type, headers=headers)
+
+
+def conversion_response(text: str, if_none_match, response_class=JSONResponse):
+    """GET /hebrew-number response; a matching If-None-Match skips the parser."""
+    tag = http_cache.etag(text)
+    if http_cache.not_modified(if_none_match, tag):
+        return Response(status_code=304, headers=http_cache.headers(tag))
+    return response_class(convert_text_to_number(text), headers=http_cache.headers(tag))
+
+
+def too_large(error, response_class=JSONResponse):
+    """413 response for a (message, code) limit error from hebrew_number.limits."""
+    message, code = error
+    return response_class({"error": message, "code": code}, status_code=413)
+
+
+HOME_HTML = render_home()
+HOME_ETAG = http_cache.page_etag(HOME_HTML)
@@ -0,0 +1,78 @@
+"""Shared conformance corpus of the Python and JavaScript parsers.
+
+    python tests/conformance.py      # rewrites JavaScriptParser/conformance.json
+
+The corpus holds the phrases of test_cases.json plus seeded random phrases,
+each with what the Python parser returns for it (mode="float"): the value, or
+the error message, its category and token position. tests/test_conformance.py
+checks that the file is current and runs it against both parsers, so the
+client-side parser the web UI uses cannot drift from the server's.
+"""
+import json
+import random
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from hebrew_number.hebrew_format import number_to_hebrew  # noqa: E402
+from hebrew_number.parser import _LEXICON, _SKIP, parse  # noqa: E402
+
+PATH = ROOT / "JavaScriptParser" / "conformance.json"
+SEED = 21
+RANDOM_PHRASES = 1500
+RENDERED_NUMBERS = 500
+
+
+def _vocabulary():
+    words = sorted(w for w in _LEXICON if not w.startswith("ו") or len(w) < 3) + sorted(_SKIP)
+    return words + ["ו" + w for w in ("חצי", "רבע", "שלוש", "עשרים", "מאה")] + ["12", "3.5", "007", "1.", "שלום"]
+
+
+def phrases():
+    with open(ROOT / "JavaScriptParser" / "test_cases.json", encoding="utf-8") as f:
+        cases = json.load(f)
+    yield from (c["text"] for c in cases["valid"])
+    yield from cases["invalid"]
+    rng = random.Random(SEED)
+    for _ in range(RENDERED_NUMBERS):
+        n = rng.choice((rng.randint(0, 999), rng.randint(0, 10 ** 6), rng.randint(0, 10 ** 12)))
+        yield number_to_hebrew(n + rng.choice((0, 0, 0.5, 0.25)))
+    words = _vocabulary()
+    for _ in range(RANDOM_PHRASES):
+        yield rng.choice((" ", " ", "־")).join(rng.choice(words) for _ in range(rng.randint(1, 6)))
+
+
+def entry(text: str) -> dict:
+    result = parse(text)
+    if result.ok:
+        return {"text": text, "expected": result.value}
+    return {"text": text, "error": result.error, "code": result.code, "position": result.position}
+
+
+def build() -> dict:
+    corpus = {"valid": [], "invalid": []}
+    seen = set()
+    for text in phrases():
+        if text in seen:
+            continue
+        seen.add(text)
+        e = entry(text)
+        corpus["valid" if "expected" in e else "invalid"].append(e)
+    return corpus
+
+
+def dumps(corpus: dict) -> str:
+    """JSON with one case per line, so regenerating it gives readable diffs."""
+    parts = []
+    for kind, cases in corpus.items():
+        lines = ",\n".join(json.dumps(c, ensure_ascii=False) for c in cases)
+        parts.append(f'"{kind}": [\n{lines}\n]')
+    return "{\n" + ",\n".join(parts) + "\n}\n"
+
+
+if __name__ == "__main__":
+    corpus = build()
+    PATH.write_text(dumps(corpus), encoding="utf-8")
+    print(f"{PATH.relative_to(ROOT)}: {len(corpus['valid'])} valid, {len(corpus['invalid'])} invalid")
@@ -0,0 +1,88 @@
+import math
+
+import pytest
+
+from hebrew_number import bulk
+from hebrew_number.bulk import ERROR_CODES, convert_file, output_paths
+from hebrew_number.parser import ERROR_CATEGORIES
+
+LINES = ["מיליון וחצי", "חצי חצי", "", "שליש", "עשרים־שלושה אלף", "שלום", "12\r", "3.5"]
+
+
+@pytest.fixture
+def src(tmp_path, monkeypatch):
+    # tiny blocks and shards, so a few lines exercise the block and shard boundaries
+    monkeypatch.setattr(bulk, "BLOCK_SIZE", 16)
+    monkeypatch.setattr(bulk, "_MIN_SHARD", 32)
+    path = tmp_path / "in.txt"
+    path.write_text("\n".join(LINES * 20), encoding="utf-8")  # no final newline
+    return str(path)
+
+
+def _read(path, fmt):
+    import array
+    values = array.array(fmt)
+    with open(path, "rb") as f:
+        values.frombytes(f.read())
+    return values
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_binary_float64(src, tmp_path, workers):
+    dst = str(tmp_path / "out")
+    assert convert_file(src, dst, workers=workers) == len(LINES) * 20
+    values_path, errors_path = output_paths(dst)
+    values, errors = _read(values_path, "d"), _read(errors_path, "B")
+    assert values[0] == 1_500_000 and math.isnan(values[1])
+    assert [ERROR_CODES[c] for c in errors[:len(LINES)]] == [
+        "ok", "repeated_fraction", "ok", "ok", "ok", "unknown_word", "ok", "ok"]
+    assert values[3] == 1/3 and values[6] == 12 and values[-1] == 3.5
+    assert list(errors) == list(errors[:len(LINES)]) * 20
+
+
+def test_binary_int64(src, tmp_path):
+    dst = str(tmp_path / "out")
+    convert_file(src, dst, dtype="int64", workers=2)
+    values, errors = _read(output_paths(dst, "int64")[0], "q"), _read(output_paths(dst, "int64")[1], "B")
+    assert [ERROR_CODES[c] for c in errors[:len(LINES)]] == [
+        "ok", "repeated_fraction", "ok", "not_integer", "ok", "unknown_word", "ok", "not_integer"]
+    assert list(values[:len(LINES)]) == [1_500_000, 0, 0, 0, 23_000, 0, 12, 0]
+
+
+def test_error_codes_are_frozen():
+    # codes already written to .err files; new categories may only be appended
+    assert ERROR_CODES[:16] == (
+        "ok", "two_tens", "tens_alpayim", "decimal_tail", "repeated_fraction", "scale_order", "unknown_word",
+        "inexact_decimal", "other", "not_integer", "text_too_long", "too_many_words", "too_many_digits",
+        "two_units", "repeated_point", "ordinal",
+    )
+    assert len(set(ERROR_CODES)) == len(ERROR_CODES) <= 256
+    assert {category for _, category in ERROR_CATEGORIES} <= set(ERROR_CODES)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_text_matches_cli(src, tmp_path, workers):
+    from hebrew_number.cli import main
+    dst, expected = tmp_path / "out.txt", tmp_path / "cli.txt"
+    convert_file(src, str(dst), format="text", workers=workers)
+    with open(src, encoding="utf-8", newline="") as f:
+        lines = [line.rstrip("\r\n") for line in f]
+    (tmp_path / "stripped.txt").write_text("\n".join(lines) + "\n", encoding="utf-8")
+    main([str(tmp_path / "stripped.txt"), "-o", str(expected)])
+    assert dst.read_text(encoding="utf-8") == expected.read_text(encoding="utf-8")
+    assert not list(tmp_path.glob("out.txt.part*"))
+
+
+def test_empty_file(tmp_path):
+    src = tmp_path / "empty.txt"
+    src.write_bytes(b"")
+    assert convert_file(str(src), str(tmp_path / "out")) == 0
+
+
+def test_load_results(src, tmp_path):
+    np = pytest.importorskip("numpy")
+    dst = str(tmp_path / "out")
+    convert_file(src, dst)
+    values, errors = bulk.load_results(dst)
+    assert isinstance(values, np.memmap) and values.dtype == np.float64
+    assert np.isnan(values[errors != 0]).all() and values[0] == 1_500_000
@@ -0,0 +1,53 @@
+import pytest
+from hebrew_number import cache
+from hebrew_number.parser import hebrew_to_number
+from hebrew_number.hebrew_format import number_to_hebrew
+
+
+@pytest.fixture
+def lru():
+    c = cache.enable_cache(maxsize=2)
+    yield c
+    cache.disable_cache()
+
+
+def test_cache_disabled_by_default():
+    assert cache.cache_stats() == {"enabled": False}
+    assert hebrew_to_number("מיליון וחצי") == 1_500_000
+
+
+def test_normalized_variants_share_an_entry(lru):
+    assert hebrew_to_number("עשרים־שלושה אלף") == 23_000
+    assert hebrew_to_number("  עשרים   שלושה אלף ") == 23_000
+    assert hebrew_to_number("עשרים שלושה אלף") == 23_000
+    stats = cache.cache_stats()
+    assert stats["misses"] == 1 and stats["hits"] == 2 and stats["size"] == 1
+
+
+def test_errors_are_cached(lru):
+    for _ in range(3):
+        with pytest.raises(ValueError):
+            hebrew_to_number("מיליון מיליון")
+    assert cache.cache_stats()["hits"] == 2
+
+
+def test_eviction_is_least_recently_used(lru):
+    hebrew_to_number("אלף")
+    number_to_hebrew(1000)
+    hebrew_to_number("אלף")         # refresh
+    hebrew_to_number("חצי")         # evicts number_to_hebrew(1000)
+    stats = cache.cache_stats()
+    assert stats["evictions"] == 1 and stats["size"] == 2
+    hebrew_to_number("אלף")
+    assert cache.cache_stats()["hits"] == 2
+
+
+@pytest.mark.parametrize("enabled", [False, True])
+def test_first_argument_by_keyword(enabled):
+    if enabled:
+        cache.enable_cache()
+    try:
+        assert number_to_hebrew(num=5) == number_to_hebrew(5)
+        assert number_to_hebrew(num=1000) == "אלף"
+    finally:
+        cache.disable_cache()
@@ -0,0 +1,73 @@
+import json
+from decimal import Decimal
+
+import pytest
+from hebrew_number.cli import main
+from hebrew_number.parser import hebrew_to_number
+
+PHRASES = ["מיליון וחצי", "חצי חצי", "אלף", "עשרים־שלושה אלף"]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_text_lines_keep_order(tmp_path, workers):
+    src, dst = tmp_path / "in.txt", tmp_path / "out.txt"
+    src.write_text("\n".join(PHRASES) + "\n", encoding="utf-8")
+    main([str(src), "-o", str(dst), "--workers", str(workers), "--chunk-size", "1"])
+    lines = dst.read_text(encoding="utf-8").splitlines()
+    assert lines[0] == "1500000.0"
+    assert lines[1].startswith("ERROR\t")
+    assert lines[2:] == ["1000.0", "23000.0"]
+
+
+def test_jsonl_reports_errors_per_record(tmp_path):
+    src, dst = tmp_path / "in.jsonl", tmp_path / "out.jsonl"
+    src.write_text("\n".join(json.dumps({"id": i, "text": t}) for i, t in enumerate(PHRASES)), encoding="utf-8")
+    main([str(src), "-o", str(dst), "--format", "jsonl"])
+    rows = [json.loads(line) for line in dst.read_text(encoding="utf-8").splitlines()]
+    assert [r["id"] for r in rows] == [0, 1, 2, 3]
+    assert rows[0]["number"] == 1_500_000 and "error" in rows[1]
+
+
+def test_csv_to_hebrew(tmp_path):
+    src, dst = tmp_path / "in.csv", tmp_path / "out.csv"
+    src.write_text("amount\n1000\nabc\n", encoding="utf-8")
+    main([str(src), "-o", str(dst), "--format", "csv", "--column", "amount", "--to-hebrew"])
+    lines = dst.read_text(encoding="utf-8").splitlines()
+    assert lines[0] == "amount,hebrew,error"
+    assert lines[1] == "1000,אלף,"
+    assert lines[2].startswith("abc,,")
+
+
+def test_fuzzy_flag(tmp_path):
+    src, dst = tmp_path / "in.txt", tmp_path / "out.txt"
+    src.write_text("שלושימ אלף\n", encoding="utf-8")
+    main([str(src), "-o", str(dst)])
+    assert dst.read_text(encoding="utf-8").startswith("ERROR\t")
+    main([str(src), "-o", str(dst), "--fuzzy", "1"])
+    assert dst.read_text(encoding="utf-8") == "30000.0\n"
+
+
+def test_to_hebrew_keeps_every_digit(tmp_path):
+    src, dst = tmp_path / "in.txt", tmp_path / "out.txt"
+    src.write_text("123456789012345678\n0.1000000000000000055\n", encoding="utf-8")
+    main([str(src), "-o", str(dst), "--to-hebrew"])
+    lines = dst.read_text(encoding="utf-8").splitlines()
+    assert hebrew_to_number(lines[0], mode="decimal") == 123456789012345678
+    assert hebrew_to_number(lines[1], mode="decimal") == Decimal("0.1000000000000000055")
+
+
+def test_unreadable_records_are_reported_and_skipped(tmp_path):
+    src, dst = tmp_path / "in.jsonl", tmp_path / "out.jsonl"
+    src.write_text('{"text": "אלף"}\n{"text": \n[1]\n{"id": 3}\n{"text": "שלוש"}\n', encoding="utf-8")
+    main([str(src), "-o", str(dst), "--format", "jsonl", "--workers", "2", "--chunk-size", "2"])
+    rows = [json.loads(line) for line in dst.read_text(encoding="utf-8").splitlines()]
+    assert [r.get("number") for r in rows] == [1000, None, None, None, 3]
+    assert rows[1]["line"] == 2 and "invalid JSON" in rows[1]["error"]
+    assert rows[2] == {"line": 3, "error": "not a JSON object"}
+    assert rows[3] == {"id": 3, "error": "missing field 'text'"}
+
+    src, dst = tmp_path / "in.csv", tmp_path / "out.csv"
+    src.write_text("id,amount\n1,אלף\n2\n3,שלוש,extra\n", encoding="utf-8")
+    main([str(src), "-o", str(dst), "--format", "csv", "--column", "amount"])
+    assert dst.read_text(encoding="utf-8").splitlines() == [
+        "id,amount,number,error", "1,אלף,1000.0,", "2,,,missing column 'amount'", "3,שלוש,3.0,"]
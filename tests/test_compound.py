@@ -0,0 +1,105 @@
+from decimal import Decimal
+from fractions import Fraction
+
+import pytest
+
+from hebrew_number.compound import ERR_COMPOUND, Compound, parse_compound
+from hebrew_number.parser import hebrew_to_number
+
+
+def result(text, mode="float"):
+    c = parse_compound(text, mode)
+    return c.kind, list(c.values)
+
+
+@pytest.mark.parametrize("text, values", [
+    ("בין שלושים לארבעים אלף", [30_000, 40_000]),
+    ("בין חמש מאות לאלף", [500, 1000]),
+    ("בין מאה למאתיים אלף", [100_000, 200_000]),
+    ("שלוש עד חמש מאות", [300, 500]),
+    ("שלוש עד ארבע מאות אלף", [300_000, 400_000]),
+    ("משלוש עד חמש", [3, 5]),
+    ("מ 10 עד 20 אלף", [10_000, 20_000]),
+    ("30-40 אלף", [30_000, 40_000]),
+    ("בין 30 ל-40", [30, 40]),
+    ("אחד עד אלפיים", [1, 2000]),
+    ("מיליון עד מיליון וחצי", [1_000_000, 1_500_000]),
+])
+def test_ranges(text, values):
+    assert result(text) == ("range", values)
+
+
+@pytest.mark.parametrize("text, values", [
+    ("אלף, אלפיים ושלושת אלפים", [1000, 2000, 3000]),
+    ("עשרים, שלושים וארבעים אלף", [20_000, 30_000, 40_000]),
+    ("שלוש, ארבע או חמש מאות", [300, 400, 500]),
+    ("חמש או שש", [5, 6]),
+    ("אלפיים ושלושת אלפים", [2000, 3000]),
+    ("שלוש, ארבע וחמש", [3, 4, 5]),
+    ("אחת או שתיים ושלוש", [1, 2, 3]),
+    ("2 או 3 וחצי", [2, 3.5]),          # 'ו' before a fraction stays in its number
+    ("שתיים, שלוש ורבע", [2, 3.25]),
+    ("עשרים ושלוש, עשרים וארבע", [23, 24]),
+    ("אלף, מאה ועשרים", [1000, 120]),
+    ("אחד, עשרים ושלוש", [1, 23]),
+    ("שלוש, מאה ומאתיים", [3, 100, 200]),
+])
+def test_lists(text, values):
+    assert result(text) == ("list", values)
+
+
+@pytest.mark.parametrize("text", ["מיליון וחצי", "עשרים ושלושה אלף", "2.5 מיליארד", "אלף ומאה"])
+def test_single_number_matches_hebrew_to_number(text):
+    assert result(text) == ("number", [hebrew_to_number(text)])
+
+
+def test_scale_is_not_shared_by_bare_scales_or_alpayim():
+    # 'אלף' alone and 'אלפיים' are whole numbers, not an amount of thousands
+    assert result("חמש עד אלף") == ("range", [5, 1000])
+    assert result("חמש או אלפיים") == ("list", [5, 2000])
+    # a number that has its own scale keeps it
+    assert result("מיליון עד שלושה מיליארד") == ("range", [1_000_000, 3_000_000_000])
+
+
+def test_words_starting_with_lamed_or_mem_are_not_split():
+    assert result("מאה עד מאתיים") == ("range", [100, 200])
+    assert result("מיליון, מאה") == ("list", [1_000_000, 100])
+
+
+def test_modes():
+    assert result("שלוש עד ארבע וחצי", "fraction") == ("range", [Fraction(3), Fraction(9, 2)])
+    assert result("0.1 עד 0.2", "decimal") == ("range", [Decimal("0.1"), Decimal("0.2")])
+    with pytest.raises(ValueError):
+        parse_compound("אחד עד שתיים", mode="binary")
+
+
+def test_compound_object():
+    c = parse_compound("בין שלושים לארבעים אלף")
+    assert isinstance(c, Compound) and (c.low, c.high) == (30_000, 40_000)
+    assert repr(c) == "Compound(range, 30000.0, 40000.0)"
+    assert not hasattr(c, "__dict__")
+
+
+@pytest.mark.parametrize("text", [
+    "אחד עד שתיים, שלוש",        # range and list
+    "אחד עד שתיים עד שלוש",      # three-way range
+    "בין שלוש",                   # 'בין' without a second number
+    "בין שלוש או ארבע",
+    "אחד עד",
+    ", שתיים",
+    "שקל עד 5",
+])
+def test_malformed_expressions(text):
+    with pytest.raises(ValueError) as e:
+        parse_compound(text)
+    assert str(e.value) == ERR_COMPOUND
+
+
+def test_errors_of_a_number_are_the_parser_errors():
+    with pytest.raises(ValueError, match="בננה"):
+        parse_compound("שלוש עד בננה")
+    with pytest.raises(ValueError) as e:
+        parse_compound("עשרים שלושים עד ארבעים")
+    with pytest.raises(ValueError) as single:
+        hebrew_to_number("עשרים שלושים")
+    assert str(e.value) == str(single.value)
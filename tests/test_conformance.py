@@ -0,0 +1,77 @@
+import json
+import shutil
+import subprocess
+
+import pytest
+
+import conformance
+from hebrew_number.parser import parse
+
+CORPUS = json.loads(conformance.PATH.read_text(encoding="utf-8"))
+JS_DIR = conformance.ROOT / "JavaScriptParser"
+node = pytest.mark.skipif(shutil.which("node") is None, reason="node is not installed")
+
+# runs a parser module over the corpus and prints the cases whose outcome differs
+RUNNER = """
+import fs from "fs";
+const { parse } = await import(process.argv[1]);
+const corpus = JSON.parse(fs.readFileSync(process.argv[2], "utf8"));
+const bad = [];
+for (const c of corpus.valid) {
+  const r = parse(c.text);
+  if (r.value !== c.expected) bad.push([c.text, r]);
+}
+for (const c of corpus.invalid) {
+  const r = parse(c.text);
+  if (r.error !== c.error || r.code !== c.code || r.position !== c.position) bad.push([c.text, r]);
+}
+console.log(JSON.stringify(bad));
+"""
+
+
+def run_js(module):
+    out = subprocess.run(["node", "--input-type=module", "-e", RUNNER, "--", module.as_uri(), str(conformance.PATH)],
+                         capture_output=True, text=True, encoding="utf-8", check=True)
+    return json.loads(out.stdout)
+
+
+def test_corpus_is_current():
+    # regenerate with: python tests/conformance.py
+    assert conformance.dumps(conformance.build()) == conformance.PATH.read_text(encoding="utf-8")
+
+
+def test_corpus_covers_test_cases():
+    texts = {c["text"] for kind in ("valid", "invalid") for c in CORPUS[kind]}
+    cases = json.loads((JS_DIR / "test_cases.json").read_text(encoding="utf-8"))
+    assert {c["text"] for c in cases["valid"]} | set(cases["invalid"]) <= texts
+    assert len(CORPUS["valid"]) > 500 and len(CORPUS["invalid"]) > 100
+
+
+def test_python_parser_meets_test_cases():
+    # test_cases.json is the hand-written spec; the corpus is generated from Python and cannot catch it drifting
+    cases = json.loads((JS_DIR / "test_cases.json").read_text(encoding="utf-8"))
+    for c in cases["valid"]:
+        assert parse(c["text"]).value == pytest.approx(c["expected"], rel=1e-9), c["text"]
+    for text in cases["invalid"]:
+        assert parse(text).error is not None, text
+
+
+@pytest.mark.parametrize("backend", ["loop", "dfa"])
+def test_python_backends(backend):
+    for c in CORPUS["valid"]:
+        assert parse(c["text"], backend=backend).value == c["expected"], c["text"]
+    for c in CORPUS["invalid"]:
+        r = parse(c["text"], backend=backend)
+        assert (r.error, r.code, r.position) == (c["error"], c["code"], c["position"]), c["text"]
+
+
+@node
+def test_js_parser():
+    assert run_js(JS_DIR / "parser.js") == []
+
+
+@node
+def test_js_bundle():
+    subprocess.run(["node", str(JS_DIR / "build.mjs"), "--check"], check=True)
+    manifest = json.loads((conformance.ROOT / "hebrew_number" / "static" / "hebrew-number.json").read_text())
+    assert run_js(conformance.ROOT / "hebrew_number" / "static" / manifest["file"]) == []
@@ -0,0 +1,36 @@
+import json
+import random
+from pathlib import Path
+
+import pytest
+from hebrew_number.parser import hebrew_to_number
+
+CASES = json.loads((Path(__file__).resolve().parent.parent / "JavaScriptParser" / "test_cases.json").read_text(encoding="utf-8"))
+WORDS = ["שלוש", "ושלוש", "שניים", "מאות", "עשרים", "ועשרים", "שלושים", "מאה", "אלף", "אלפים", "אלפיים",
+         "מיליון", "מיליארד", "חצי", "וחצי", "רבע", "ו", "נקודה", "12", "3.5", "0", "שלום"]
+
+
+def outcome(text, mode, backend):
+    try:
+        result = hebrew_to_number(text, mode=mode, backend=backend)
+    except ValueError as e:
+        return "error", str(e)
+    return type(result), result
+
+
+@pytest.mark.parametrize("mode", ["float", "decimal", "fraction"])
+@pytest.mark.parametrize("text", [c["text"] for c in CASES["valid"]] + CASES["invalid"])
+def test_matches_loop_on_test_cases(text, mode):
+    assert outcome(text, mode, "dfa") == outcome(text, mode, "loop")
+
+
+def test_matches_loop_on_random_phrases():
+    rng = random.Random(14)
+    for _ in range(5_000):
+        text = " ".join(rng.choice(WORDS) for _ in range(rng.randint(0, 7)))
+        assert outcome(text, "fraction", "dfa") == outcome(text, "fraction", "loop"), text
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        hebrew_to_number("אלף", backend="regex")
@@ -0,0 +1,62 @@
+import itertools
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "benchmarks"))
+
+import differential  # noqa: E402
+import phrasegen  # noqa: E402
+from hebrew_number.parser import hebrew_to_number, parse  # noqa: E402
+
+
+def broken(text, mode):
+    """hebrew_to_number with an off-by-one on phrases containing 'אלף'."""
+    value = hebrew_to_number(text, mode)
+    return value + 1 if "אלף" in text else value
+
+
+def test_valid_phrases_have_their_value():
+    rng = random.Random(23)
+    for _ in range(3_000):
+        text, value = phrasegen.valid_phrase(phrasegen.random_shape(rng), rng)
+        assert hebrew_to_number(text, mode="fraction") == value, text
+
+
+def test_every_shape_is_enumerated_once():
+    shapes = list(itertools.islice(phrasegen.shapes(), 5_000))
+    assert len(set(shapes)) == len(shapes)
+    assert {s[3] for s in shapes} == set(phrasegen.SUFFIXES)
+    rng = random.Random(5)
+    for shape in shapes[::10]:
+        text, value = phrasegen.valid_phrase(shape, rng)
+        assert hebrew_to_number(text, mode="fraction") == value, text
+
+
+@pytest.mark.parametrize("error", phrasegen.MUTATIONS)
+def test_mutations_hit_their_error(error):
+    rng = random.Random(error)
+    for _ in range(300):
+        text = phrasegen.invalid_phrase(error, rng)
+        assert parse(text).code == error, text
+
+
+@pytest.mark.parametrize("engine, compare", [("dfa", "message"), ("incremental", "ok")])
+def test_engines_agree_with_reference(engine, compare):
+    r = differential.run(engine, 3_000, mode="fraction", compare=compare, chunk=1_000)
+    assert r["phrases"] == 3_000 and r["mismatch_count"] == 0, r["mismatches"]
+    assert r["reference_per_s"] > 0 and r["engine_per_s"] > 0
+
+
+def test_mismatches_are_reported():
+    r = differential.run("test_differential:broken", 500, chunk=250)
+    assert r["mismatch_count"] > 0
+    text, expected, got = r["mismatches"][0]
+    assert "אלף" in text and got[1] == expected[1] + 1
+
+
+def test_unknown_engine():
+    with pytest.raises(ValueError):
+        differential.run("regex", 10)
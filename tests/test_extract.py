@@ -0,0 +1,47 @@
+import io
+import pytest
+from hebrew_number.extract import iter_numbers
+
+TEXT = ("העד העיד ששילם מיליון וחצי שקלים, ועוד שלוש מאות עשרים וחמישה אלף "
+        "בחשבונית מספר 17. לאחר מכן הוחזרו חמישים אלף; נשארו 2.5 מיליארד.")
+
+
+def spans(source, **kw):
+    return [(TEXT[s:e] if isinstance(source, (str, io.StringIO)) else None, v)
+            for s, e, v in iter_numbers(source, **kw)]
+
+
+def test_extracts_phrases_with_offsets():
+    assert spans(TEXT) == [
+        ("מיליון וחצי", 1_500_000),
+        ("שלוש מאות עשרים וחמישה אלף", 325_000),
+        ("17", 17),
+        ("חמישים אלף", 50_000),
+        ("2.5 מיליארד", 2_500_000_000),
+    ]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 64])
+def test_chunked_file_matches_string(chunk_size):
+    assert spans(io.StringIO(TEXT), chunk_size=chunk_size) == spans(TEXT)
+
+
+@pytest.mark.strict
+def test_invalid_runs_split_by_strictness_rules():
+    text = "מיליון מיליון"
+    assert [(text[s:e], v) for s, e, v in iter_numbers(text)] == [
+        ("מיליון", 1_000_000), ("מיליון", 1_000_000)]
+
+
+def test_punctuation_separates_phrases():
+    text = "שלוש, ארבע"
+    assert [v for _, _, v in iter_numbers(text)] == [3, 4]
+
+
+def test_no_numbers():
+    assert list(iter_numbers("אין כאן מספרים בכלל")) == []
+
+
+def test_ordinals_are_not_extracted():
+    assert [v for _, _, v in iter_numbers("חיכה חצי שנייה")] == [0.5]
+    assert list(iter_numbers("ביום שלישי")) == []
@@ -0,0 +1,61 @@
+import pytest
+
+from hebrew_number.fuzzy import _SUBSTITUTES, correct_text, correct_word, edit_distance
+from hebrew_number.parser import ERR_TWO_TENS, hebrew_to_number
+
+
+@pytest.mark.parametrize("text,expected", [
+    ("שלושימ", 30),
+    ("מיליאד", 1_000_000_000),
+    ("אלף ושלושימ", 1030),
+    ("ארבאה אלף", 4000),
+    ("מיליון ומאטיים", 1_000_200),
+    ("שבעימ ושתיים שקלים", 72),
+])
+def test_fuzzy_corrects(text, expected):
+    with pytest.raises(ValueError):
+        hebrew_to_number(text)
+    assert hebrew_to_number(text, fuzzy=1) == expected
+    assert hebrew_to_number(text, fuzzy=1, backend="dfa") == expected
+
+
+def test_fuzzy_distance_is_configurable():
+    assert correct_word("שלושיימ", 1) is None
+    assert correct_word("שלושיימ", 2) == "שלושים"
+    assert hebrew_to_number("שלושיימ אלף", fuzzy=2) == 30_000
+
+
+@pytest.mark.parametrize("word", ["של", "אבג", "יום", "12ב"])
+def test_fuzzy_leaves_unrelated_words(word):
+    assert correct_word(word, 2) is None
+    with pytest.raises(ValueError):
+        hebrew_to_number(f"אלף {word}", fuzzy=2)
+
+
+@pytest.mark.parametrize("text", ["שלום", "מאה ושלום", "שבועה", "עשרים עשירים", "ארבה מאות", "מיליון וחאי"])
+def test_fuzzy_leaves_real_and_short_words(text):
+    # stop words, words under MIN_LENGTH letters and substitutions across letter classes
+    with pytest.raises(ValueError):
+        hebrew_to_number(text, fuzzy=2)
+    assert correct_text(text, 2) == text
+
+
+def test_substitutions_stay_within_letter_classes():
+    assert edit_distance("שלום", "שלוש") == 1
+    assert edit_distance("שלום", "שלוש", _SUBSTITUTES) == 2   # a deletion and an insertion
+    assert edit_distance("שלושימ", "שלושים", _SUBSTITUTES) == 1
+    assert correct_word("שמונימ") == "שמונים" and correct_word("שמוניש") is None
+
+
+def test_fuzzy_keeps_other_errors():
+    with pytest.raises(ValueError, match="עשרות"):
+        hebrew_to_number("שמונים שבעימ", fuzzy=1)
+    with pytest.raises(ValueError) as e:
+        hebrew_to_number("שמונים שבעים", fuzzy=1)
+    assert str(e.value) == ERR_TWO_TENS
+
+
+def test_correct_text_and_distance():
+    assert correct_text("אלף ושלושימ 12") == "אלף ושלושים 12"
+    assert edit_distance("מאתיים", "מאתיימ") == 1
+    assert edit_distance("שלוש", "שלשו") == 1  # transposition
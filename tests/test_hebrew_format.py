@@ -0,0 +1,61 @@
+import random
+import pytest
+from decimal import Decimal
+from hebrew_number.parser import hebrew_to_number
+from hebrew_number.hebrew_format import ERR_NEGATIVE, number_to_hebrew
+
+
+@pytest.mark.parametrize("num,expected", [
+    (0, "אפס"),
+    (12, "שתים עשרה"),
+    (12_000, "שנים עשר אלף"),
+    (112, "מאה ושתים עשרה"),
+    (121, "מאה עשרים ואחת"),
+    (1_150, "אלף מאה וחמישים"),
+    (2_000, "אלפיים"),
+    (3_000, "שלושת אלפים"),
+    (10_005, "עשרת אלפים וחמש"),
+    (22_000_000, "עשרים ושניים מיליון"),
+    (1_500_000, "מיליון וחמש מאות אלף"),
+    (2_000_000_000_000, "שני טריליון"),
+    (3.25, "שלוש נקודה שתיים חמש"),
+    (Decimal("0.05"), "אפס נקודה אפס חמש"),
+])
+def test_number_to_hebrew(num, expected):
+    assert number_to_hebrew(num) == expected
+
+
+def _samples():
+    rng = random.Random(20240917)
+    ints = list(range(0, 2_100)) + [10 ** k for k in range(16)]
+    for digits in range(1, 16):
+        ints += [rng.randrange(10 ** (digits - 1), 10 ** digits) for _ in range(200)]
+    decimals = [Decimal(rng.randrange(0, 10 ** 9)) / 10 ** rng.randint(1, 6) for _ in range(2_000)]
+    return ints, decimals
+
+
+INTS, DECIMALS = _samples()
+
+
+def test_round_trip_integers():
+    for n in INTS:
+        text = number_to_hebrew(n)
+        assert hebrew_to_number(text, mode="fraction") == n, text
+
+
+def test_round_trip_decimals():
+    for d in DECIMALS:
+        text = number_to_hebrew(d)
+        assert hebrew_to_number(text, mode="decimal") == d, text
+        assert hebrew_to_number(number_to_hebrew(float(d))) == pytest.approx(float(d), rel=1e-15), text
+
+
+@pytest.mark.parametrize("num", [-1, -0.5, Decimal("-12"), -(10 ** 20)])
+def test_negative_numbers_are_rejected(num):
+    # the parser has no 'מינוס', so there is no phrase that round-trips
+    with pytest.raises(ValueError, match=ERR_NEGATIVE):
+        number_to_hebrew(num)
+
+
+def test_negative_zero_is_zero():
+    assert number_to_hebrew(-0.0) == "אפס"
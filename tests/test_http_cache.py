@@ -0,0 +1,45 @@
+import subprocess
+import sys
+
+from hebrew_number import http_cache
+
+
+def test_etag_is_deterministic_and_normalized():
+    tag = http_cache.etag("מיליון וחצי")
+    assert tag == http_cache.etag("  מיליון   וחצי ") == http_cache.etag("מיליון־וחצי")
+    assert tag != http_cache.etag("מיליון ורבע")
+    assert tag.startswith('"') and tag.endswith('"')
+
+
+def test_etag_is_stable_across_processes():
+    code = "from hebrew_number.http_cache import etag; print(etag('אלף'))"
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == http_cache.etag("אלף")
+
+
+def test_not_modified():
+    tag = http_cache.etag("אלף")
+    assert http_cache.not_modified(tag, tag)
+    assert http_cache.not_modified(f'"x", W/{tag}', tag)
+    assert http_cache.not_modified("*", tag)
+    assert not http_cache.not_modified(None, tag)
+    assert not http_cache.not_modified('"x"', tag)
+
+
+def test_headers():
+    headers = http_cache.headers('"x"')
+    assert headers == {"ETag": '"x"', "Cache-Control": f"public, max-age={http_cache.MAX_AGE}"}
+
+
+def test_etag_changes_with_the_phrase_limits():
+    from hebrew_number.limits import reset_limits, set_limits
+    before = http_cache.etag("אלף")
+    try:
+        set_limits(max_chars=2)
+        limited = http_cache.etag("אלף")
+        assert limited != before
+        set_limits(max_batch=5)   # does not change a GET answer
+        assert http_cache.etag("אלף") == limited
+    finally:
+        reset_limits()
+    assert http_cache.etag("אלף") == before
@@ -0,0 +1,45 @@
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+HEAVY = ("fastapi", "starlette", "pydantic", "jinja2", "numpy", "pandas", "decimal", "fractions", "multiprocessing")
+
+
+def loaded_after(code: str) -> set:
+    out = subprocess.run([sys.executable, "-c", f"{code}\nimport sys; print(' '.join(sys.modules))"],
+                         cwd=ROOT, capture_output=True, text=True, check=True).stdout
+    return set(out.split())
+
+
+def test_library_path_stays_light():
+    modules = loaded_after("from hebrew_number.parser import hebrew_to_number; hebrew_to_number('מיליון וחצי')")
+    assert not modules & set(HEAVY)
+
+
+def test_package_exports_are_lazy():
+    assert "hebrew_number.parser" not in loaded_after("import hebrew_number")
+    modules = loaded_after("import hebrew_number; assert hebrew_number.hebrew_to_number('אלף') == 1000")
+    assert "hebrew_number.parser" in modules and "hebrew_number.main" not in modules
+
+
+def test_exact_modes_import_on_demand():
+    assert "decimal" in loaded_after("from hebrew_number.parser import hebrew_to_number; hebrew_to_number('חצי', mode='decimal')")
+
+
+def test_warm_start_skips_lexicon_compile():
+    loaded_after("import hebrew_number.parser")  # writes the compiled lexicon cache
+    assert "json" not in loaded_after("import hebrew_number.parser")
+
+
+def test_cli_and_formatter_stay_light():
+    modules = loaded_after("import hebrew_number.cli, hebrew_number.incremental; from hebrew_number.hebrew_format import number_to_hebrew; "
+                           "number_to_hebrew(1500000.0); number_to_hebrew(12)")
+    assert not modules & {"decimal", "fractions"}
+    assert "decimal" in loaded_after("from hebrew_number.hebrew_format import number_to_hebrew; number_to_hebrew(0.5)")
+
+
+def test_old_app_path_aliases_the_package():
+    modules = loaded_after("import app.parser, hebrew_number.parser; from app import hebrew_to_number; "
+                           "assert app.parser is hebrew_number.parser and hebrew_to_number('אלף') == 1000")
+    assert "hebrew_number.parser" in modules and "hebrew_number.main" not in modules
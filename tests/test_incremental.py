@@ -0,0 +1,126 @@
+import pytest
+from decimal import Decimal
+from hebrew_number.incremental import IncrementalParser
+from hebrew_number.parser import hebrew_to_number
+
+
+def feed_all(text, mode="float"):
+    p = IncrementalParser(mode)
+    values = []
+    for word in text.split():
+        assert p.feed(word), word
+        values.append(p.value())
+    return p, values
+
+
+@pytest.mark.parametrize("text", [
+    "אלף מאה וחמישים",
+    "מיליון וחצי",
+    "מיליון ו חצי",
+    "שלוש וחצי מיליון",
+    "מיליארד שלוש מאות מיליון וחצי",
+    "חמישים ושש נקודה שבע אלף",
+    "אפס נקודה אפס אפס חמש",
+    "2.5 מיליארד נקודה 123",
+    "אלפיים שלוש מאות",
+    "12 ו רבע",
+    "מאה 31.568 וחצי",
+])
+@pytest.mark.parametrize("mode", ["float", "decimal", "fraction"])
+def test_matches_hebrew_to_number(text, mode):
+    p, _ = feed_all(text, mode)
+    assert p.complete
+    result = p.finish()
+    assert result == hebrew_to_number(text, mode=mode) and type(result) is type(hebrew_to_number(text, mode=mode))
+
+
+def test_partial_values():
+    _, values = feed_all("מיליון שלוש מאות אלף וחצי")
+    assert values == [1_000_000, 1_000_003, 1_000_300, 1_300_000, 1_300_500]
+
+
+def test_rejected_word_ends_phrase_and_keeps_state():
+    p, _ = feed_all("אלף שמונים")
+    assert not p.feed("שבעים")
+    assert p.ended and not p.feed("ושלוש")
+    assert p.finish() == 1080
+
+
+@pytest.mark.parametrize("text", ["מיליון ו", "חמש נקודה"])
+def test_dangling_words_are_incomplete(text):
+    p, _ = feed_all(text)
+    assert not p.complete
+    with pytest.raises(ValueError):
+        p.finish()
+
+
+@pytest.mark.parametrize("text, expected", [("מיליון ו שלושת רבעי", 1_750_000), ("ו שלושת רבעי", 0.75)])
+def test_two_word_fraction_after_standalone_vav(text, expected):
+    p, _ = feed_all(text)
+    assert p.finish() == hebrew_to_number(text) == expected
+
+
+def test_unit_after_standalone_vav_is_rejected():
+    p, _ = feed_all("אלף ו שלושת")
+    with pytest.raises(ValueError):
+        p.finish()
+    assert not p.feed("מאות") and p.ended
+
+
+def test_unit_after_standalone_vav_is_held_only_before_a_fraction():
+    p, _ = feed_all("עשרים ו")
+    assert not p.feed("שלוש") and p.ended    # no 'שלוש ...' fraction: nothing can follow
+    p, _ = feed_all("עשרים ו")
+    assert p.feed("שלושת") and not p.complete
+
+
+@pytest.mark.parametrize("text", ["שתיים נקודה שלושת", "אלף שלושת", "מיליון ו שלושת", "חמש נקודה שבע שלושת"])
+@pytest.mark.parametrize("rejected", ["רבעי", "מיליון", "חצי", "שלום"])
+def test_rejected_word_after_two_word_start_keeps_state(text, rejected):
+    p, _ = feed_all(text)
+    if p.feed(rejected):
+        return
+    try:
+        expected = hebrew_to_number(text)
+    except ValueError:
+        with pytest.raises(ValueError):
+            p.finish()
+    else:
+        assert p.finish() == expected
+
+
+@pytest.mark.parametrize("text, rejected", [
+    ("אלף מאה עשרים שלוש", "ארבע"),
+    ("שלוש", "מאה"),
+    ("שלוש נקודה ארבע", "נקודה"),
+])
+def test_second_unit_or_point_is_rejected(text, rejected):
+    p, _ = feed_all(text)
+    assert not p.feed(rejected)
+    assert p.finish() == hebrew_to_number(text)
+
+
+def test_unit_that_may_become_a_fraction_is_held():
+    p, _ = feed_all("שלוש ושלושת")
+    assert not p.complete
+    assert p.feed("רבעי") and p.finish() == 3.75
+    p, _ = feed_all("שלוש ושלושת")
+    with pytest.raises(ValueError, match="יחידה"):
+        p.finish()
+
+
+def test_decimal_mode_is_exact():
+    p, _ = feed_all("מיליארד נקודה אפס אחת", mode="decimal")
+    assert p.finish() == Decimal("1000000000.01")
+
+
+def test_unknown_mode():
+    with pytest.raises(ValueError):
+        IncrementalParser(mode="int")
+
+
+def test_ordinal_only_as_a_whole_phrase():
+    p, _ = feed_all("שלישי")
+    assert p.finish() == 3 and not p.feed("מאה")
+    p, _ = feed_all("מאה")
+    assert not p.feed("ראשון") and p.finish() == 100
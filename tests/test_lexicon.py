@@ -0,0 +1,93 @@
+import json
+import os
+import subprocess
+import sys
+from decimal import Decimal
+from fractions import Fraction
+from pathlib import Path
+
+import pytest
+
+from hebrew_number import lexicon
+from hebrew_number.lexicon import DEFAULT_PATH, read_lexicon
+from hebrew_number.parser import _TEN, _WORD, _compile_lexicon, fractions_map, hebrew_to_number
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.mark.parametrize("text,expected", [
+    ("שליש", 1/3),
+    ("שלושת רבעי", 0.75),
+    ("מיליון ושלושת רבעי", 1_750_000),
+    ("טריליון", 1_000_000_000_000),
+    ("טרליון", 1_000_000_000_000),
+    ("שלש מאות ששים", 360),
+    ("ששה אלף", 6000),
+    ("עשירי", 10),
+    ("שלישי", 3),
+    ("חמישה שקלים", 5),
+    ("מאתיים ש\"ח", 200),
+    ("מיליון ₪", 1_000_000),
+    ("אלף דולר וחצי", 1500),
+])
+def test_lexicon_words(text, expected):
+    assert hebrew_to_number(text) == expected
+    assert hebrew_to_number(text, backend="dfa") == expected
+
+
+def test_exact_thirds():
+    assert hebrew_to_number("שליש", mode="fraction") == Fraction(1, 3)
+    assert hebrew_to_number("מאה ושליש", mode="fraction") == Fraction(301, 3)
+    assert hebrew_to_number("שלושת רבעי", mode="decimal") == Decimal("0.75")
+    with pytest.raises(ValueError, match="mode='fraction'"):
+        hebrew_to_number("שליש", mode="decimal")
+
+
+def test_fraction_table():
+    assert set(fractions_map) >= {"חצי", "רבע", "שליש", "שלושת רבעי"}
+    assert fractions_map["חצי"] == 0.5 and type(fractions_map["חצי"]) is float
+
+
+@pytest.mark.parametrize("data", [
+    {"units": {"שלוש": 3}, "aliases": {"שלש": "שלושים"}},
+    {"units": {"שלוש": 3}, "hundreds": {"שלוש מאות אלף": 300_000}},
+    {"tens": {"עשרים": 20}, "fractions": {"עשרים רבעי": "20/4"}},
+])
+def test_invalid_lexicon(data):
+    with pytest.raises(ValueError, match="lexicon"):
+        _compile_lexicon(data)
+
+
+def test_two_word_entry_may_start_with_a_new_word():
+    # 'שנים' is a number only as the start of 'שנים עשר'
+    compiled = _compile_lexicon({"tens": {"עשר": 10, "שנים עשר": 12}})
+    assert compiled["lexicon"]["שנים"][1:3] == (_WORD, None)
+    assert compiled["trie"]["שנים"] == {"עשר": (_TEN, 12)}
+    assert hebrew_to_number("מאה ושנים עשר") == 112
+    with pytest.raises(ValueError, match="שנים"):
+        hebrew_to_number("שנים")
+
+
+def test_compiled_cache(tmp_path, monkeypatch):
+    path = tmp_path / "lexicon.json"
+    data = read_lexicon(DEFAULT_PATH)
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    reads = []
+    monkeypatch.setattr(lexicon, "read_lexicon", lambda p: reads.append(p) or read_lexicon(p))
+    first = lexicon.load_compiled(_compile_lexicon, str(path))
+    assert os.path.exists(lexicon.cache_path(str(path)))
+    assert lexicon.load_compiled(_compile_lexicon, str(path)) == first and len(reads) == 1
+    data["units"]["תרי"] = 2
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    assert "תרי" in lexicon.load_compiled(_compile_lexicon, str(path))["lexicon"] and len(reads) == 2
+
+
+def test_lexicon_override(tmp_path):
+    data = read_lexicon(DEFAULT_PATH)
+    data["units"]["תרי"] = 2
+    path = tmp_path / "custom.json"
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    out = subprocess.run([sys.executable, "-c", "from hebrew_number.parser import hebrew_to_number; print(hebrew_to_number('תרי אלף'))"],
+                         cwd=ROOT, env={**os.environ, "HEBREW_NUMBER_LEXICON": str(path)},
+                         capture_output=True, text=True, check=True).stdout
+    assert out.strip() == "2000.0"
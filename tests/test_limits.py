@@ -0,0 +1,208 @@
+import asyncio
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from hebrew_number.compound import parse_compound
+from hebrew_number.incremental import IncrementalParser
+from hebrew_number.hebrew_format import number_to_hebrew
+from hebrew_number.limits import DEFAULTS, LIMITS, BodyLimit, batch_error, enable_limits, reset_limits, set_limits
+from hebrew_number.parser import hebrew_to_number, hebrew_to_numbers, parse
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture
+def library():
+    reset_limits()
+    return LIMITS
+
+
+@pytest.fixture(autouse=True)
+def limits():
+    yield enable_limits()
+    reset_limits()
+
+
+def test_library_has_no_limits_by_default(library):
+    assert all(getattr(library, name) is None for name in DEFAULTS)
+    tiny = number_to_hebrew(5e-324)   # 326 words
+    assert hebrew_to_number(tiny) == 5e-324
+    assert hebrew_to_numbers(["1" * 200]) == [(float("1" * 200), None)]
+
+
+def test_defaults_allow_every_valid_phrase():
+    longest = " ".join(["תשע מאות תשעים ותשע טריליון", "תשע מאות תשעים ותשע מיליארד",
+                        "תשע מאות תשעים ותשע מיליון", "תשע מאות תשעים ותשע אלף",
+                        "תשע מאות תשעים ותשע נקודה", "9" * 50])
+    assert hebrew_to_number(longest) == 999_999_999_999_999.99
+
+
+def test_text_too_long():
+    set_limits(max_chars=20)
+    r = parse("מיליון שלוש מאות אלף חמש מאות")
+    assert (r.code, r.position) == ("text_too_long", None) and "20" in r.error
+    with pytest.raises(ValueError, match="הטקסט ארוך מדי"):
+        hebrew_to_number("שלום " * 100_000)
+
+
+def test_cache_does_not_bypass_limits():
+    from hebrew_number import cache
+    cache.enable_cache()
+    try:
+        assert hebrew_to_number("אלף") == 1000
+        set_limits(max_chars=20)
+        with pytest.raises(ValueError, match="הטקסט ארוך מדי"):
+            hebrew_to_number("אלף" + " " * 50)   # normalizes to the cached 'אלף'
+        assert hebrew_to_number("מאה עשרים ושלוש") == 123
+        set_limits(max_tokens=2)                 # cached answers do not outlive the limits
+        with pytest.raises(ValueError, match="מילים"):
+            hebrew_to_number("מאה עשרים ושלוש")
+    finally:
+        cache.disable_cache()
+
+
+def test_metrics_do_not_split_rejected_text():
+    from hebrew_number import metrics
+    registry = metrics.enable_metrics()
+    try:
+        set_limits(max_chars=20, max_tokens=3)
+        with pytest.raises(ValueError):
+            hebrew_to_number("שלום " * 100_000)
+        assert registry.tokens.count == 0
+        with pytest.raises(ValueError):
+            hebrew_to_number("אלף " * 4)
+        assert registry.tokens.sum == 4      # counted up to max_tokens + 1
+    finally:
+        metrics.disable_metrics()
+
+
+def test_too_many_words():
+    set_limits(max_tokens=3)
+    assert hebrew_to_number("מאה עשרים ושלוש") == 123
+    r = parse("מאה עשרים ושלוש אלף")
+    assert (r.code, r.position) == ("too_many_words", None)
+    assert parse("מאה עשרים ושלוש אלף", backend="dfa").code == "too_many_words"
+
+
+@pytest.mark.parametrize("text, mode", [
+    ("1" * 101, "float"),
+    ("1" * 101, "fraction"),          # would overflow int("1" * n) past 4300 digits
+    ("1." + "5" * 100, "decimal"),
+    ("אפס נקודה " + "9" * 60 + " " + "9" * 60, "float"),
+    ("אפס נקודה מאה " + " ".join(["9" * 100] * 3), "fraction"),   # integer tail
+])
+def test_too_many_digits(text, mode):
+    assert parse(text, mode).code == "too_many_digits"
+
+
+def test_digit_error_points_at_the_number():
+    set_limits(max_digits=3)
+    assert parse("מיליון אלף 1234").position == 2
+    assert hebrew_to_number("מיליון אלף 123") == 1_001_123
+
+
+def test_none_turns_a_limit_off():
+    set_limits(max_chars=None, max_digits=None)
+    assert hebrew_to_number("1" * 2000, mode="decimal") == int("1" * 2000)
+
+
+def test_set_limits_validates():
+    with pytest.raises(ValueError):
+        set_limits(max_words=3)
+    with pytest.raises(ValueError):
+        set_limits(max_chars=-1)
+    assert set_limits(max_batch=0).max_batch is None
+
+
+def test_environment():
+    code = "from hebrew_number.limits import LIMITS; print(LIMITS.max_tokens, LIMITS.max_chars)"
+    env = {"HEBREW_NUMBER_MAX_TOKENS": "0", "HEBREW_NUMBER_MAX_CHARS": "50", "PYTHONPATH": str(ROOT)}
+    out = subprocess.run([sys.executable, "-c", code], env=env, cwd=ROOT, capture_output=True, text=True, check=True)
+    assert out.stdout.split() == ["None", "50"]
+    assert enable_limits().max_chars == DEFAULTS["max_chars"]
+    assert reset_limits().max_chars is None
+
+
+def test_compound_and_incremental():
+    set_limits(max_tokens=4)
+    with pytest.raises(ValueError, match="יותר מדי מילים"):
+        parse_compound("אחד, שתיים, שלוש")   # commas count as words
+    assert parse_compound("אחד או שתיים").values == (1, 2)
+    p = IncrementalParser()
+    assert p.feed("אלף") and not p.feed("1" * 101)
+    assert p.finish() == 1000
+
+
+def test_batch_error():
+    set_limits(max_batch=2)
+    assert batch_error(2) is None
+    message, code = batch_error(3)
+    assert code == "batch_too_large" and "2" in message
+
+
+async def _echo(scope, receive, send):
+    """Reads the whole body and answers with its length."""
+    size = 0
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            break
+        size += len(message.get("body", b""))
+        if not message.get("more_body"):
+            break
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": str(size).encode()})
+
+
+def request(chunks, headers=()):
+    """(status, body, chunks read) of a POST through BodyLimit(_echo)."""
+    pending = [{"type": "http.request", "body": c, "more_body": k < len(chunks) - 1} for k, c in enumerate(chunks)]
+    sent = []
+
+    async def receive():
+        return pending.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {"type": "http", "method": "POST", "headers": list(headers)}
+    asyncio.run(BodyLimit(_echo)(scope, receive, send))
+    assert len(sent) == 2, sent
+    return sent[0]["status"], sent[1]["body"], len(chunks) - len(pending)
+
+
+def test_body_limit():
+    set_limits(max_body_bytes=10)
+    assert request([b"12345", b"12345"]) == (200, b"10", 2)
+    status, body, read = request([b"12345", b"123456", b"x" * 100])
+    assert (status, read) == (413, 2) and b"body_too_large" in body
+    status, body, read = request([b"x" * 100], headers=[(b"content-length", b"100")])
+    assert (status, read) == (413, 0)
+    set_limits(max_body_bytes=None)
+    assert request([b"x" * 100])[:2] == (200, b"100")
+
+
+@pytest.mark.parametrize("module", ["hebrew_number.fast", "hebrew_number.main"])
+def test_apps_reject_a_chunked_oversize_body(module):
+    pytest.importorskip("fastapi")
+    pytest.importorskip("httpx")
+    import importlib
+    from fastapi.testclient import TestClient
+    asgi_app = importlib.import_module(module).app
+    set_limits(max_body_bytes=100)
+
+    def body():   # no Content-Length: the limit is hit while streaming
+        yield b'{"texts": ['
+        for _ in range(100):
+            yield '"אלף", '.encode()
+        yield b'"x"]}'
+
+    # the client re-raises any exception a handler raises
+    with TestClient(asgi_app) as client:
+        r = client.post("/hebrew-number/batch", content=body())
+        assert r.status_code == 413 and r.json()["code"] == "body_too_large"
+        r = client.post("/hebrew-number", json={"text": "אלף"})
+        assert r.status_code == 200 and r.json()["number"] == 1000
@@ -0,0 +1,51 @@
+import pytest
+from hebrew_number import cache, metrics
+from hebrew_number.parser import hebrew_to_number
+
+
+@pytest.fixture
+def registry():
+    m = metrics.enable_metrics()
+    yield m
+    metrics.disable_metrics()
+
+
+def test_disabled_by_default():
+    assert metrics._metrics is None
+    assert metrics.render_metrics() == "\n"
+
+
+@pytest.mark.parametrize("text,category", [
+    ("אלף שמונים שבעים", "two_tens"),
+    ("חצי חצי", "repeated_fraction"),
+    ("מיליון מיליון", "scale_order"),
+    ("שלום", "unknown_word"),
+    ("חמש נקודה מיליון", "decimal_tail"),
+    ("חמישים אלפיים", "tens_alpayim"),
+])
+def test_error_categories(registry, text, category):
+    with pytest.raises(ValueError):
+        hebrew_to_number(text)
+    assert registry.errors == {("hebrew_to_number", category): 1}
+
+
+def test_exposition(registry):
+    cache.enable_cache(maxsize=8)
+    try:
+        hebrew_to_number("מיליון וחצי")
+        hebrew_to_number("מיליון וחצי")
+        with pytest.raises(ValueError):
+            hebrew_to_number("מיליון מיליון")
+        text = metrics.render_metrics()
+    finally:
+        cache.disable_cache()
+    assert 'hebrew_number_latency_seconds_count{function="hebrew_to_number"} 3' in text
+    assert 'hebrew_number_tokens_bucket{function="hebrew_to_number",le="2"} 3' in text
+    assert 'hebrew_number_errors_total{function="hebrew_to_number",category="scale_order"} 1' in text
+    assert "hebrew_number_cache_hits_total 1" in text
+    assert "hebrew_number_cache_size 2" in text
+
+
+def test_text_by_keyword(registry):
+    assert hebrew_to_number(text="מיליון וחצי") == 1_500_000
+    assert registry.tokens.count == 1 and registry.tokens.sum == 2
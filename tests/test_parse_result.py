@@ -0,0 +1,71 @@
+import pytest
+
+from hebrew_number.parser import ERROR_CATEGORIES, ParseResult, _tokenize, hebrew_to_number, parse
+
+
+def test_ok_result():
+    r = parse("שלוש מאות אלפיים וחצי")
+    assert r.ok and r.value == 302_500
+    assert r.error is r.code is r.position is None and r.error_span is None
+    # the merged hundred spans both words; both tokens of 'אלפיים' span the word
+    assert r.spans == [(0, 9), (10, 16), (10, 16), (17, 21)]
+
+
+@pytest.mark.parametrize("text,code,word", [
+    ("אלף שמונים שבעים", "two_tens", "שבעים"),
+    ("שמונים ו שבעים", "two_tens", "שבעים"),
+    ("חמישים אלפיים", "tens_alpayim", "אלפיים"),
+    ("מיליון וחצי ורבע", "repeated_fraction", "ורבע"),
+    ("שלוש וחצי ו רבע", "repeated_fraction", "רבע"),
+    ("אלף מיליון", "scale_order", "מיליון"),
+    ("אלף שלום", "unknown_word", "שלום"),
+    ("אלף ו שלוש", "unknown_word", "ו"),
+    ("שלוש נקודה", "decimal_tail", "נקודה"),
+    ("אלף  ₪  נקודה וחצי", "decimal_tail", "נקודה"),
+])
+@pytest.mark.parametrize("backend", ["loop", "dfa"])
+def test_error_position(text, code, word, backend):
+    r = parse(text, backend=backend)
+    assert not r.ok and r.value is None and r.code == code
+    start, end = r.error_span
+    assert text[start:end] == word
+    with pytest.raises(ValueError) as e:
+        hebrew_to_number(text, backend=backend)
+    assert str(e.value) == r.error
+
+
+def test_inexact_decimal_position():
+    r = parse("מיליון ושליש", mode="decimal")
+    assert r.code == "inexact_decimal" and r.position == 1
+    assert parse("מיליון ושליש", mode="fraction").ok
+
+
+def test_inexact_decimal_made_by_fuzzy_retry():
+    r = parse("שלישש", mode="decimal", fuzzy=1)
+    assert (r.code, r.position) == ("inexact_decimal", 0)
+    r = parse("אלף ושלישש", mode="decimal", fuzzy=1)
+    assert (r.code, r.position) == ("inexact_decimal", 1)
+    with pytest.raises(ValueError, match="במדויק"):
+        hebrew_to_number("אלף ושלישש", mode="decimal", fuzzy=1)
+
+
+def test_codes_are_categories():
+    assert {parse(t).code for t in ("חצי חצי", "מיליון מיליון")} <= {c for _, c in ERROR_CATEGORIES}
+
+
+def test_spans_follow_tokens():
+    text = "עשרים־שלושה   אלף שקלים ושלושת רבעי"
+    assert len(parse(text).spans) == len(_tokenize(text))
+    assert [text[a:b] for a, b in parse(text).spans] == ["עשרים", "שלושה", "אלף", "ושלושת רבעי"]
+
+
+def test_invalid_arguments_raise():
+    with pytest.raises(ValueError):
+        parse("אלף", mode="int")
+    with pytest.raises(ValueError):
+        parse("אלף", backend="nope")
+
+
+def test_slots():
+    r = parse("אלף")
+    assert isinstance(r, ParseResult) and not hasattr(r, "__dict__")
@@ -0,0 +1,22 @@
+import pytest
+from hebrew_number.parser import hebrew_to_number, hebrew_to_numbers
+
+
+def test_batch_preserves_order_and_values():
+    texts = ["אלף מאה וחמישים", "מיליון וחצי", "חצי", "2.5 מיליארד"]
+    results = hebrew_to_numbers(texts)
+    assert [n for n, _ in results] == [hebrew_to_number(t) for t in texts]
+    assert all(err is None for _, err in results)
+
+
+@pytest.mark.strict
+def test_batch_reports_errors_per_item():
+    results = hebrew_to_numbers(["אלף", "מיליון מיליון", "חצי חצי", "שלוש"])
+    assert results[0] == (1000, None)
+    assert results[1][0] is None and results[1][1]
+    assert results[2][0] is None and results[2][1]
+    assert results[3] == (3, None)
+
+
+def test_batch_empty():
+    assert hebrew_to_numbers([]) == []
@@ -1,11 +1,25 @@
 import pytest
-from app.parser import hebrew_to_number
+from hebrew_number.parser import hebrew_to_number
 
 @pytest.mark.parametrize("text,expected", [
     ("ואחת", 1),
     ("3 אלפים", 3000),
     ("12 אלפים", 12000),
+    ("שלושת אלפים", 3000),
+    ("עשרת אלפים וחמש", 10_005),
+    ("שני טריליון", 2_000_000_000_000),
     ("תשע מאות תשעים ותשע מיליון תשע מאות תשעים ותשע אלף תשע מאות תשעים ותשע", 999_999_999),
 ])
 def test_core_numbers(text, expected):
     assert hebrew_to_number(text) == expected
+
+
+def test_tokenize_classifies_in_one_pass():
+    from hebrew_number.parser import _tokenize, _HUNDRED, _SCALE, _UNIT, _FRACTION
+    tokens = _tokenize("ושלוש מאות אלפיים וחצי")
+    assert tokens == [
+        ("שלוש מאות", _HUNDRED, 300, True),
+        ("שניים", _UNIT, 2, False),
+        ("אלפים", _SCALE, 1000, False),
+        ("חצי", _FRACTION, 0.5, True),
+    ]
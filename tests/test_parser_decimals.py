@@ -1,5 +1,5 @@
 import pytest
-from app.parser import hebrew_to_number
+from hebrew_number.parser import hebrew_to_number
 
 @pytest.mark.decimals
 @pytest.mark.parametrize("text,expected", [
@@ -9,6 +9,8 @@ from app.parser import hebrew_to_number
     ("אפס נקודה שבע אלף", 0.7000),
     ("שלוש נקודה ארבע", 3.4),
     ("ארבע נקודה 2 5", 4.25),
+    ("שלוש נקודה אחת ארבע", 3.14),
+    ("אלף מאה עשרים שלוש נקודה ארבע חמש", 1123.45),
     ("אפס נקודה שבע מאות ושבע", 0.707),
     ("אפס נקודה תשע מאות תשעים ותשע", 0.999),
     ("עשר נקודה אפס אפס אפס חמש", 10.0005),
@@ -0,0 +1,44 @@
+import pytest
+from decimal import Decimal
+from fractions import Fraction
+from hebrew_number.parser import hebrew_to_number
+
+BIG = ("תשע מאות תשעים ותשע מיליארד תשע מאות תשעים ותשע מיליון "
+       "תשע מאות תשעים ותשע אלף תשע מאות תשעים ותשע")
+
+
+@pytest.mark.parametrize("text,expected", [
+    ("מיליון וחצי", "1500000"),
+    ("אלף שלוש ורבע", "1003.25"),
+    ("2.5 מיליארד", "2500000000"),
+    ("עשר נקודה אפס אפס אפס חמש", "10.0005"),
+    ("3.1415 מיליון", "3141500"),
+    (BIG + " נקודה 123456789", "999999999999.123456789"),
+])
+def test_decimal_mode_is_exact(text, expected):
+    value = hebrew_to_number(text, mode="decimal")
+    assert isinstance(value, Decimal)
+    assert value == Decimal(expected)
+    assert hebrew_to_number(text, mode="fraction") == Fraction(expected)
+
+
+def test_integer_phrases_keep_full_precision():
+    text = "תשע מאות תשעים ותשע מיליארד " + BIG.split(" מיליארד ", 1)[1]
+    assert hebrew_to_number(text, mode="fraction") == Fraction(999_999_999_999)
+    assert hebrew_to_number(text) == 999_999_999_999.0
+
+
+def test_float_mode_unchanged():
+    assert isinstance(hebrew_to_number("אלף"), float)
+    assert hebrew_to_number("אלף", mode="float") == 1000.0
+
+
+def test_unknown_mode():
+    with pytest.raises(ValueError):
+        hebrew_to_number("אלף", mode="int")
+
+
+@pytest.mark.strict
+def test_exact_mode_keeps_strictness():
+    with pytest.raises(ValueError):
+        hebrew_to_number("חצי חצי", mode="decimal")
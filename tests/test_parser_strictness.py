@@ -1,11 +1,14 @@
 import pytest
-from app.parser import hebrew_to_number
+from hebrew_number.parser import hebrew_to_number, parse
 
 @pytest.mark.strict
 @pytest.mark.parametrize("text", [
     "אלף שמונים שבעים",
     "מיליון ו",
     "חמישים אלפיים",
+    "אלף שמונים ו שבעים",
+    "אפס נקודה עשרים שלושים",
+    "אפס נקודה חמישים אלפיים",
 ])
 def test_strict_invalid(text):
     import pytest
@@ -18,3 +21,36 @@ def test_strict_invalid(text):
 ])
 def test_strict_valid_alternatives(text, expected):
     assert hebrew_to_number(text) == expected
+
+@pytest.mark.parametrize("text, code, position", [
+    ("אלף מאה עשרים שלוש ארבע", "two_units", 4),
+    ("שלוש וארבע", "two_units", 1),
+    ("שלוש ארבע מאות", "two_units", 1),
+    ("שלוש אלפיים", "two_units", 1),         # 'אלפיים' is 'שניים אלפים'
+    ("אלף מאה עשרים שלוש נקודה ארבע נקודה חמש שש", "repeated_point", 6),
+    ("שלוש נקודה 5 נקודה", "repeated_point", 3),
+])
+def test_second_unit_or_point(text, code, position):
+    for backend in ("loop", "dfa"):
+        r = parse(text, backend=backend)
+        assert (r.code, r.position) == (code, position), backend
+
+@pytest.mark.parametrize("text,expected", [
+    ("שלוש עשרה", 13),
+    ("שלוש ושלושת רבעי", 3.75),
+    ("אפס נקודה שלוש ארבע", 0.34),
+    ("2.5 מיליארד נקודה 123", 2_500_000_000.123),
+])
+def test_units_and_points_that_stay_valid(text, expected):
+    assert hebrew_to_number(text) == expected
+
+@pytest.mark.parametrize("text, position", [
+    ("מאה ראשון", 1),
+    ("חצי שנייה", 1),
+    ("שלישי מאה", 0),     # the ordinal is the error, not the word after it
+    ("עשרים ושלישי", 1),
+])
+def test_ordinal_only_as_a_whole_phrase(text, position):
+    for backend in ("loop", "dfa"):
+        r = parse(text, backend=backend)
+        assert (r.code, r.position) == ("ordinal", position), backend
@@ -1,5 +1,5 @@
 import pytest
-from app.parser import hebrew_to_number
+from hebrew_number.parser import hebrew_to_number
 
 @pytest.mark.strict
 @pytest.mark.parametrize("text", [
@@ -0,0 +1,72 @@
+import random
+import sys
+import threading
+
+import pytest
+from hebrew_number import cache, metrics
+from hebrew_number.parser import hebrew_to_number, hebrew_to_numbers, hebrew_units, scales
+from hebrew_number.hebrew_format import number_to_hebrew
+
+THREADS = 16
+ROUNDS = 20
+
+
+def test_word_tables_are_read_only():
+    with pytest.raises(TypeError):
+        hebrew_units["שלום"] = 1
+    with pytest.raises(TypeError):
+        del scales["אלף"]
+
+
+def test_thread_pool_batch_matches_serial():
+    texts = ["אלף", "חצי חצי", "מיליון וחצי", "שלום"] * 500
+    assert hebrew_to_numbers(texts, workers=4, chunk_size=64) == hebrew_to_numbers(texts)
+
+
+def test_concurrent_parse_and_format_with_cache_and_metrics():
+    rng = random.Random(16)
+    numbers = [rng.randrange(10 ** rng.randint(1, 12)) for _ in range(200)]
+    phrases = [number_to_hebrew(n) for n in numbers] + ["מיליון מיליון", "חצי חצי"]
+    expected = hebrew_to_numbers(phrases)
+
+    lru = cache.enable_cache(maxsize=64)  # small, so threads keep evicting each other's entries
+    registry = metrics.enable_metrics()
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    barrier = threading.Barrier(THREADS)
+    failures = []
+
+    def worker(seed):
+        order = list(range(len(phrases)))
+        random.Random(seed).shuffle(order)
+        barrier.wait()
+        for _ in range(ROUNDS):
+            for i in order:
+                try:
+                    got = (hebrew_to_number(phrases[i]), None)
+                except ValueError as e:
+                    got = (None, str(e))
+                if got != expected[i]:
+                    failures.append((phrases[i], got))
+                if i < len(numbers) and number_to_hebrew(numbers[i]) != phrases[i]:
+                    failures.append((numbers[i], "format"))
+
+    threads = [threading.Thread(target=worker, args=(seed,)) for seed in range(THREADS)]
+    try:
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        stats = cache.cache_stats()
+    finally:
+        sys.setswitchinterval(interval)
+        cache.disable_cache()
+        metrics.disable_metrics()
+
+    assert not failures
+    parse_calls = THREADS * ROUNDS * len(phrases)
+    format_calls = THREADS * ROUNDS * len(numbers)
+    assert stats["hits"] + stats["misses"] == parse_calls + format_calls
+    assert stats["size"] <= lru.maxsize
+    assert registry.latency["hebrew_to_number"].count == parse_calls
+    assert sum(registry.errors.values()) == THREADS * ROUNDS * 2
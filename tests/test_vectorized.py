@@ -0,0 +1,40 @@
+import math
+import pytest
+
+np = pytest.importorskip("numpy")
+from hebrew_number.vectorized import parse_array
+from hebrew_number.parser import hebrew_to_number
+
+
+def test_values_and_error_mask():
+    values, errors = parse_array(["אלף", "מיליון וחצי", "חצי חצי", None, "אלף"])
+    assert values.dtype == np.float64 and errors.dtype == bool
+    assert list(values[:2]) == [1000, 1_500_000] and values[4] == 1000
+    assert math.isnan(values[2]) and math.isnan(values[3])
+    assert list(errors) == [False, False, True, True, False]
+
+
+def test_keeps_shape_and_matches_scalar_api():
+    texts = [["עשרים ושלושה אלף", "שלוש וחצי"], ["2.5 מיליארד", "נקודה חמש"]]
+    values, errors = parse_array(texts)
+    assert values.shape == errors.shape == (2, 2)
+    assert not errors.any()
+    assert values.tolist() == [[hebrew_to_number(t) for t in row] for row in texts]
+
+
+def test_duplicates_are_parsed_once(monkeypatch):
+    import hebrew_number.vectorized
+    calls = []
+    monkeypatch.setattr(hebrew_number.vectorized, "hebrew_to_number", lambda t: calls.append(t) or 1.0)
+    parse_array(["אלף", "חצי", "אלף", "חצי", "אלף"])
+    assert sorted(calls) == ["אלף", "חצי"]
+
+
+def test_series_accessor():
+    pd = pytest.importorskip("pandas")
+    s = pd.Series(["אלף", "שלום", "אלף"], index=[5, 6, 7], name="amount")
+    out = s.hebrew.to_number()
+    assert list(out.index) == [5, 6, 7] and out.name == "amount"
+    assert out[5] == 1000 and math.isnan(out[6])
+    with pytest.raises(ValueError):
+        s.hebrew.to_number(errors="raise")
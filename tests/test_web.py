@@ -0,0 +1,30 @@
+import warnings
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from test_imports import loaded_after  # noqa: E402
+
+
+def test_fast_app_does_not_build_main():
+    modules = loaded_after("import hebrew_number.fast")
+    assert "hebrew_number.web" in modules and "hebrew_number.main" not in modules
+
+
+@pytest.mark.parametrize("module", ["hebrew_number.fast", "hebrew_number.main"])
+def test_apps_answer_alike_without_deprecation_warnings(module):
+    import importlib
+    asgi_app = importlib.import_module(module).app
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", DeprecationWarning)
+        with TestClient(asgi_app) as client:
+            r = client.post("/hebrew-number", json={"text": "מיליון וחצי"})
+            assert r.json() == {"number": 1_500_000, "hebrew": "מיליון וחמש מאות אלף"}
+            r = client.post("/hebrew-number/batch", json={"texts": ["אלף", "שלום"]})
+            assert r.json()["results"][1]["code"] == "unknown_word"
+            r = client.get("/")
+            assert r.status_code == 200 and "מיליון וחצי" in r.text